@@ -75,7 +75,25 @@ module connection_manager_wrapper #(
     output wire         m02_axis_tvalid, 
     output wire         m02_axis_tlast,
     output wire [31:0]  m02_axis_tdata,
-    output wire [4:0]   m02_axis_tstrb
+    output wire [4:0]   m02_axis_tstrb,
+
+    // Ports of Axi Slave Bus Interface S03_AXIS (table dump cursor)
+    input wire          s03_axis_aclk, 
+    input wire          s03_axis_aresetn,
+    input wire          s03_axis_tvalid,
+    input wire          s03_axis_tlast, 
+    input wire [31:0]   s03_axis_tdata,
+    input wire [4:0]    s03_axis_tstrb,
+    output wire         s03_axis_tready,
+
+    // Ports of Axi Master Bus Interface M03_AXIS (table dump entry)
+    input wire          m03_axis_aclk, 
+    input wire          m03_axis_aresetn,
+    input wire          m03_axis_tready,
+    output wire         m03_axis_tvalid, 
+    output wire         m03_axis_tlast,
+    output wire [95:0]  m03_axis_tdata,
+    output wire [11:0]  m03_axis_tstrb
 );
 
     localparam CONN_ID_WIDTH = HASH_WIDTH+$clog2(WAYS);
@@ -83,13 +101,16 @@ module connection_manager_wrapper #(
     assign m00_axis_tlast = 1'b1;
     assign m01_axis_tlast = 1'b1;
     assign m02_axis_tlast = 1'b1;
+    assign m03_axis_tlast = 1'b1;
     assign m00_axis_tstrb = ~('b0);
     assign m01_axis_tstrb = ~('b0);
     assign m02_axis_tstrb = ~('b0);
+    assign m03_axis_tstrb = ~('b0);
 
     assign m00_axis_tdata[31:CONN_ID_WIDTH+1]   = 'b0;
     assign m01_axis_tdata[63:49]                = 'b0;
-    assign m02_axis_tdata[31:CONN_ID_WIDTH+2]   = 'b0;
+    assign m02_axis_tdata[31:CONN_ID_WIDTH+4]   = 'b0;
+    assign m03_axis_tdata[95:CONN_ID_WIDTH+49]  = 'b0;
 
     connection_manager #(
         .WAYS(WAYS),
@@ -134,13 +155,29 @@ module connection_manager_wrapper #(
         .s02_axis_ctrl_ipAddr(s02_axis_tdata[31:0]),
         .s02_axis_ctrl_udpPort(s02_axis_tdata[47:32]),
         .s02_axis_ctrl_bind(s02_axis_tdata[48]),
+        .s02_axis_ctrl_user(s02_axis_tdata[50:49]),
         .s02_axis_ctrl_ready(s02_axis_tready),
 
         .m02_axis_ctrl_ready(m02_axis_tready),
         .m02_axis_ctrl_valid(m02_axis_tvalid),
         .m02_axis_ctrl_ack(m02_axis_tdata[CONN_ID_WIDTH]),
         .m02_axis_ctrl_full(m02_axis_tdata[CONN_ID_WIDTH+1]),
-        .m02_axis_ctrl_connectionId(m02_axis_tdata[CONN_ID_WIDTH-1:0])
+        .m02_axis_ctrl_connectionId(m02_axis_tdata[CONN_ID_WIDTH-1:0]),
+        .m02_axis_ctrl_user(m02_axis_tdata[CONN_ID_WIDTH+3:CONN_ID_WIDTH+2]),
+
+        // -------------------------------------------------------------------------
+        // Table Dump Channel
+        // -------------------------------------------------------------------------
+        .s03_axis_dump_valid(s03_axis_tvalid),
+        .s03_axis_dump_cursor(s03_axis_tdata[CONN_ID_WIDTH-1:0]),
+        .s03_axis_dump_ready(s03_axis_tready),
+
+        .m03_axis_dump_ready(m03_axis_tready),
+        .m03_axis_dump_valid(m03_axis_tvalid),
+        .m03_axis_dump_ipAddr(m03_axis_tdata[31:0]),
+        .m03_axis_dump_udpPort(m03_axis_tdata[47:32]),
+        .m03_axis_dump_connectionId(m03_axis_tdata[CONN_ID_WIDTH+47:48]),
+        .m03_axis_dump_hit(m03_axis_tdata[CONN_ID_WIDTH+48])
     );
 
 endmodule
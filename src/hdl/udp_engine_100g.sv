@@ -50,6 +50,7 @@ module udp_engine_100g #(
     parameter int DATA_WIDTH         = 512,
     parameter int C_S_AXI_DATA_WIDTH = 32,
     parameter int C_S_AXI_ADDR_WIDTH = 7,
+    parameter int ENABLE_CTRL_DMA    = 0,
     parameter int CONN_ID_WIDTH      = HASH_WIDTH + $clog2(WAYS)
 ) (
     // ----------------------------------------------------------------
@@ -97,6 +98,25 @@ module udp_engine_100g #(
     output logic                    udp_rx_axis_tlast,
     input  wire                     udp_rx_axis_tready,
 
+    // ----------------------------------------------------------------
+    // CONNECTION MANAGER BULK INTERFACE (AXI-STREAM, s_axi_aclk)
+    // ----------------------------------------------------------------
+    //   Only active with ENABLE_CTRL_DMA; otherwise tready/tvalid are tied low.
+
+    // Command Channel (from DMA MM2S): {15'b0, bind, udpPort, ipAddr}
+    input  wire  [            63:0] ctrl_s_axis_tdata,
+    input  wire  [             7:0] ctrl_s_axis_tkeep,
+    input  wire                     ctrl_s_axis_tvalid,
+    input  wire                     ctrl_s_axis_tlast,
+    output logic                    ctrl_s_axis_tready,
+
+    // Response Channel (to DMA S2MM): {12'b0, full, ack, connectionId}
+    output logic [            31:0] ctrl_m_axis_tdata,
+    output logic [             3:0] ctrl_m_axis_tkeep,
+    output logic                    ctrl_m_axis_tvalid,
+    output logic                    ctrl_m_axis_tlast,
+    input  wire                     ctrl_m_axis_tready,
+
     // ----------------------------------------------------------------
     // CONTROL INTERFACE (AXI-LITE)
     // ----------------------------------------------------------------
@@ -139,6 +159,20 @@ module udp_engine_100g #(
   logic [31:0] csr_udp_engine_100g__connManager_wr_status;  // 0x2C
   logic [31:0] csr_udp_engine_100g__connManager_wr_connectedId;  // 0x30
 
+  logic [31:0] csr_udp_engine_100g__connManager_dump_cursor;  // 0x34
+  logic [31:0] csr_udp_engine_100g__connManager_dump_seek;  // 0x38 (write pulse)
+  logic [31:0] csr_udp_engine_100g__connManager_dump_next;  // 0x3C (write pulse)
+  logic [31:0] csr_udp_engine_100g__connManager_dump_status;  // 0x3C (read)
+  logic [31:0] csr_udp_engine_100g__connManager_dump_ipAddr;  // 0x40
+  logic [31:0] csr_udp_engine_100g__connManager_dump_connectedId;  // 0x44
+
+  logic [31:0] csr_udp_engine_100g__connManager_batch_ipAddr;  // 0x48
+  logic [31:0] csr_udp_engine_100g__connManager_batch_push;  // 0x4C {bind, udpPort}
+  logic [31:0] csr_udp_engine_100g__connManager_batch_push_pulse;  // 0x4C (write pulse)
+  logic [31:0] csr_udp_engine_100g__connManager_batch_pop;  // 0x50 (write pulse)
+  logic [31:0] csr_udp_engine_100g__connManager_batch_resp;  // 0x50 (read)
+  logic [31:0] csr_udp_engine_100g__connManager_batch_status;  // 0x54
+
 
 
   // -------------------------------------------------------------------------
@@ -162,6 +196,18 @@ module udp_engine_100g #(
       .csr_udp_engine_100g__connManager_wr_trigger(csr_udp_engine_100g__connManager_wr_trigger),
       .csr_udp_engine_100g__connManager_wr_status(csr_udp_engine_100g__connManager_wr_status),
       .csr_udp_engine_100g__connManager_wr_connectedId(csr_udp_engine_100g__connManager_wr_connectedId),
+      .csr_udp_engine_100g__connManager_dump_cursor(csr_udp_engine_100g__connManager_dump_cursor),
+      .csr_udp_engine_100g__connManager_dump_seek(csr_udp_engine_100g__connManager_dump_seek),
+      .csr_udp_engine_100g__connManager_dump_next(csr_udp_engine_100g__connManager_dump_next),
+      .csr_udp_engine_100g__connManager_dump_status(csr_udp_engine_100g__connManager_dump_status),
+      .csr_udp_engine_100g__connManager_dump_ipAddr(csr_udp_engine_100g__connManager_dump_ipAddr),
+      .csr_udp_engine_100g__connManager_dump_connectedId(csr_udp_engine_100g__connManager_dump_connectedId),
+      .csr_udp_engine_100g__connManager_batch_ipAddr(csr_udp_engine_100g__connManager_batch_ipAddr),
+      .csr_udp_engine_100g__connManager_batch_push(csr_udp_engine_100g__connManager_batch_push),
+      .csr_udp_engine_100g__connManager_batch_push_pulse(csr_udp_engine_100g__connManager_batch_push_pulse),
+      .csr_udp_engine_100g__connManager_batch_pop(csr_udp_engine_100g__connManager_batch_pop),
+      .csr_udp_engine_100g__connManager_batch_resp(csr_udp_engine_100g__connManager_batch_resp),
+      .csr_udp_engine_100g__connManager_batch_status(csr_udp_engine_100g__connManager_batch_status),
 
       .S_AXI_ACLK(s_axi_aclk),
       .S_AXI_ARESETN(s_axi_aresetn),
@@ -295,11 +341,44 @@ module udp_engine_100g #(
   // -------------------------------------------------------------------------
   // Registers -> Connection Manager Write Channel
   // -------------------------------------------------------------------------
+  //   Up to three command sources share the pipelined control channel, told
+  //   apart by s02_axis_ctrl_user and routed back by m02_axis_ctrl_user:
+  //     CTRL_SRC_REGS  : one command via 0x1C-0x28, response in 0x2C/0x30
+  //     CTRL_SRC_BATCH : command FIFO, push via 0x48/0x4C, responses popped
+  //                      from 0x50 (read head, write to pop), counts in 0x54
+  //     CTRL_SRC_DMA   : ctrl_s_axis stream, responses on ctrl_m_axis in
+  //                      command order (CTRL_SRC_DMA_LAST marks the command
+  //                      that carried tlast, so the response packet ends there);
+  //                      only built with ENABLE_CTRL_DMA
+  //
+  //   Priority is regs > batch > DMA. Batch and DMA commands are only issued
+  //   while their response FIFO has a free slot for the response, so responses
+  //   that are not popped (batch) or a stalled S2MM channel (DMA) back-pressure
+  //   the command side instead of being dropped. For the batch interface this
+  //   shows up as the command FIFO full bit in 0x54.
+  //
+  //   batch_resp (0x50 read):
+  //     [31]       response available
+  //     [19]       full
+  //     [18]       ack
+  //     [17:0]     connectionId
+  //   batch_status (0x54 read):
+  //     [31]       command FIFO full
+  //     [15:0]     commands pushed and not yet popped
+
+  localparam logic [1:0] CTRL_SRC_REGS     = 2'd0;
+  localparam logic [1:0] CTRL_SRC_BATCH    = 2'd1;
+  localparam logic [1:0] CTRL_SRC_DMA      = 2'd2;
+  localparam logic [1:0] CTRL_SRC_DMA_LAST = 2'd3;
+  localparam int         BATCH_DEPTH       = 512;
+  localparam int         BATCH_RESP_DEPTH  = 2 * BATCH_DEPTH;
+  localparam int         DMA_RESP_DEPTH    = 1024;
 
   logic                      s02_axis_ctrl_valid;
   logic [ IP_ADDR_WIDTH-1:0] s02_axis_ctrl_ipAddr;
   logic [UDP_PORT_WIDTH-1:0] s02_axis_ctrl_udpPort;
   logic                      s02_axis_ctrl_bind;
+  logic [               1:0] s02_axis_ctrl_user;
   logic                      s02_axis_ctrl_ready;
 
   logic                      m02_axis_ctrl_ready;
@@ -307,39 +386,205 @@ module udp_engine_100g #(
   logic                      m02_axis_ctrl_ack;
   logic [ CONN_ID_WIDTH-1:0] m02_axis_ctrl_connectionId;
   logic                      m02_axis_ctrl_full;
+  logic [               1:0] m02_axis_ctrl_user;
+
+  // single register command, held until the control channel accepts it
+  logic                      regs_cmd_valid;
+  logic [ IP_ADDR_WIDTH-1:0] regs_cmd_ipAddr;
+  logic [UDP_PORT_WIDTH-1:0] regs_cmd_udpPort;
+  logic                      regs_cmd_bind;
+
+  // batch command / response FIFOs
+  logic                      batch_cmd_s_tready;
+  logic                      batch_cmd_valid;
+  logic                      batch_cmd_m_tvalid;
+  logic                      batch_cmd_m_tready;
+  logic [              63:0] batch_cmd_m_tdata;
+
+  logic                      batch_resp_s_tvalid;
+  logic                      batch_resp_m_tvalid;
+  logic [              31:0] batch_resp_m_tdata;
+
+  logic [              15:0] batch_outstanding;
+  logic [$clog2(BATCH_RESP_DEPTH):0] batch_credits_used;  // commands issued, responses not yet popped
+
+  // DMA command qualifier and response write (see gen_ctrl_dma)
+  logic                      dma_cmd_valid;
+  logic                      dma_resp_s_tvalid;
+
+  assign m02_axis_ctrl_ready   = 1'b1;
+
+  assign batch_cmd_valid       = batch_cmd_m_tvalid & (batch_credits_used < BATCH_RESP_DEPTH);
+
+  assign s02_axis_ctrl_valid   = regs_cmd_valid | batch_cmd_valid | dma_cmd_valid;
+  assign s02_axis_ctrl_ipAddr  = regs_cmd_valid  ? regs_cmd_ipAddr
+                               : batch_cmd_valid ? batch_cmd_m_tdata[31:0]  : ctrl_s_axis_tdata[31:0];
+  assign s02_axis_ctrl_udpPort = regs_cmd_valid  ? regs_cmd_udpPort
+                               : batch_cmd_valid ? batch_cmd_m_tdata[47:32] : ctrl_s_axis_tdata[47:32];
+  assign s02_axis_ctrl_bind    = regs_cmd_valid  ? regs_cmd_bind
+                               : batch_cmd_valid ? batch_cmd_m_tdata[48]    : ctrl_s_axis_tdata[48];
+  assign s02_axis_ctrl_user    = regs_cmd_valid  ? CTRL_SRC_REGS
+                               : batch_cmd_valid ? CTRL_SRC_BATCH
+                               : ctrl_s_axis_tlast ? CTRL_SRC_DMA_LAST      : CTRL_SRC_DMA;
+  assign batch_cmd_m_tready    = s02_axis_ctrl_ready & !regs_cmd_valid
+                               & (batch_credits_used < BATCH_RESP_DEPTH);
+
+  assign batch_resp_s_tvalid   = m02_axis_ctrl_valid & (m02_axis_ctrl_user == CTRL_SRC_BATCH);
+  assign dma_resp_s_tvalid     = m02_axis_ctrl_valid & m02_axis_ctrl_user[1];
+
+  assign csr_udp_engine_100g__connManager_batch_resp   = {batch_resp_m_tvalid, batch_resp_m_tdata[30:0]};
+  assign csr_udp_engine_100g__connManager_batch_status = {!batch_cmd_s_tready, 15'b0, batch_outstanding};
+
+  fifo_axis_wrapper #(
+      .FIFO_DEPTH (BATCH_DEPTH),
+      .TDATA_WIDTH(64)
+  ) batch_cmd_fifo (
+      .m_aclk       (s_axi_aclk),
+      .s_aclk       (s_axi_aclk),
+      .s_aresetn    (s_axi_aresetn),
+
+      .m_axis_tready(batch_cmd_m_tready),
+      .m_axis_tlast (),
+      .m_axis_tvalid(batch_cmd_m_tvalid),
+      .m_axis_tdata (batch_cmd_m_tdata),
+      .m_axis_tkeep (),
+
+      .s_axis_tdata ({
+        15'b0,
+        csr_udp_engine_100g__connManager_batch_push[16],
+        csr_udp_engine_100g__connManager_batch_push[15:0],
+        csr_udp_engine_100g__connManager_batch_ipAddr
+      }),
+      .s_axis_tkeep ('1),
+      .s_axis_tlast (1'b1),
+      .s_axis_tvalid(csr_udp_engine_100g__connManager_batch_push_pulse[0]),
+      .s_axis_tready(batch_cmd_s_tready)
+  );
+
+  fifo_axis_wrapper #(
+      .FIFO_DEPTH (BATCH_RESP_DEPTH),
+      .TDATA_WIDTH(32)
+  ) batch_resp_fifo (
+      .m_aclk       (s_axi_aclk),
+      .s_aclk       (s_axi_aclk),
+      .s_aresetn    (s_axi_aresetn),
+
+      .m_axis_tready(csr_udp_engine_100g__connManager_batch_pop[0]),
+      .m_axis_tlast (),
+      .m_axis_tvalid(batch_resp_m_tvalid),
+      .m_axis_tdata (batch_resp_m_tdata),
+      .m_axis_tkeep (),
+
+      .s_axis_tdata ({
+        {(32 - CONN_ID_WIDTH - 2) {1'b0}},
+        m02_axis_ctrl_full,
+        m02_axis_ctrl_ack,
+        m02_axis_ctrl_connectionId
+      }),
+      .s_axis_tkeep ('1),
+      .s_axis_tlast (1'b1),
+      .s_axis_tvalid(batch_resp_s_tvalid),
+      .s_axis_tready()   // always has room: batch issue is gated on batch_credits_used
+  );
+
+  generate
+    if (ENABLE_CTRL_DMA) begin : gen_ctrl_dma
+      // DMA response FIFO and its credit counter (commands accepted, responses not yet drained)
+      logic [$clog2(DMA_RESP_DEPTH):0] dma_credits_used;
+
+      assign dma_cmd_valid      = ctrl_s_axis_tvalid & (dma_credits_used < DMA_RESP_DEPTH);
+      assign ctrl_s_axis_tready = s02_axis_ctrl_ready & !regs_cmd_valid & !batch_cmd_valid
+                                & (dma_credits_used < DMA_RESP_DEPTH);
+
+      fifo_axis_wrapper #(
+          .FIFO_DEPTH (DMA_RESP_DEPTH),
+          .TDATA_WIDTH(32)
+      ) dma_resp_fifo (
+          .m_aclk       (s_axi_aclk),
+          .s_aclk       (s_axi_aclk),
+          .s_aresetn    (s_axi_aresetn),
+
+          .m_axis_tready(ctrl_m_axis_tready),
+          .m_axis_tlast (ctrl_m_axis_tlast),
+          .m_axis_tvalid(ctrl_m_axis_tvalid),
+          .m_axis_tdata (ctrl_m_axis_tdata),
+          .m_axis_tkeep (ctrl_m_axis_tkeep),
+
+          .s_axis_tdata ({
+            {(32 - CONN_ID_WIDTH - 2) {1'b0}},
+            m02_axis_ctrl_full,
+            m02_axis_ctrl_ack,
+            m02_axis_ctrl_connectionId
+          }),
+          .s_axis_tkeep ('1),
+          .s_axis_tlast (m02_axis_ctrl_user == CTRL_SRC_DMA_LAST),
+          .s_axis_tvalid(dma_resp_s_tvalid),
+          .s_axis_tready()   // always has room: DMA issue is gated on dma_credits_used
+      );
+
+      always_ff @(posedge s_axi_aclk) begin
+        if (!s_axi_aresetn) begin
+          dma_credits_used <= 'b0;
+        end else begin
+          dma_credits_used <= dma_credits_used
+                              + (ctrl_s_axis_tvalid & ctrl_s_axis_tready)
+                              - (ctrl_m_axis_tvalid & ctrl_m_axis_tready);
+        end
+      end
+    end else begin : gen_no_ctrl_dma
+      // bulk interface not built: never accept a command, never emit a response
+      assign dma_cmd_valid      = 1'b0;
+      assign ctrl_s_axis_tready = 1'b0;
+      assign ctrl_m_axis_tdata  = 'b0;
+      assign ctrl_m_axis_tkeep  = 'b0;
+      assign ctrl_m_axis_tvalid = 1'b0;
+      assign ctrl_m_axis_tlast  = 1'b0;
+    end
+  endgenerate
 
-  assign m02_axis_ctrl_ready = 1'b1;
   always_ff @(posedge s_axi_aclk) begin
     if (!s_axi_aresetn) begin
-      s02_axis_ctrl_valid   <= 1'b0;
-      s02_axis_ctrl_ipAddr  <= 'b0;
-      s02_axis_ctrl_udpPort <= 'b0;
-      s02_axis_ctrl_bind    <= 'b0;
+      batch_credits_used <= 'b0;
     end else begin
-      if (s02_axis_ctrl_ready & csr_udp_engine_100g__connManager_wr_trigger) begin
-        s02_axis_ctrl_valid   <= 1'b1;
-        s02_axis_ctrl_ipAddr  <= csr_udp_engine_100g__connManager_wr_ip_addr;
-        s02_axis_ctrl_udpPort <= csr_udp_engine_100g__connManager_wr_port;
-        s02_axis_ctrl_bind    <= csr_udp_engine_100g__connManager_wr_bind;
-      end else begin
-        s02_axis_ctrl_valid   <= 1'b0;
-        s02_axis_ctrl_ipAddr  <= 'b0;
-        s02_axis_ctrl_udpPort <= 'b0;
-        s02_axis_ctrl_bind    <= 'b0;
+      batch_credits_used <= batch_credits_used
+                            + (batch_cmd_m_tvalid & batch_cmd_m_tready)
+                            - (csr_udp_engine_100g__connManager_batch_pop[0] & batch_resp_m_tvalid);
+    end
+  end
+
+  always_ff @(posedge s_axi_aclk) begin
+    if (!s_axi_aresetn) begin
+      regs_cmd_valid    <= 1'b0;
+      regs_cmd_ipAddr   <= 'b0;
+      regs_cmd_udpPort  <= 'b0;
+      regs_cmd_bind     <= 'b0;
+      batch_outstanding <= 'b0;
+    end else begin
+      if (csr_udp_engine_100g__connManager_wr_trigger) begin
+        regs_cmd_valid   <= 1'b1;
+        regs_cmd_ipAddr  <= csr_udp_engine_100g__connManager_wr_ip_addr;
+        regs_cmd_udpPort <= csr_udp_engine_100g__connManager_wr_port;
+        regs_cmd_bind    <= csr_udp_engine_100g__connManager_wr_bind;
+      end else if (regs_cmd_valid & s02_axis_ctrl_ready) begin
+        regs_cmd_valid <= 1'b0;
       end
+
+      batch_outstanding <= batch_outstanding
+                           + (csr_udp_engine_100g__connManager_batch_push_pulse[0] & batch_cmd_s_tready)
+                           - (csr_udp_engine_100g__connManager_batch_pop[0] & batch_resp_m_tvalid);
     end
 
     if (!s_axi_aresetn) begin
       csr_udp_engine_100g__connManager_wr_status      <= 'b0;
       csr_udp_engine_100g__connManager_wr_connectedId <= 'b0;
     end else begin
-      if (m02_axis_ctrl_valid & m02_axis_ctrl_ready) begin
+      if (m02_axis_ctrl_valid & m02_axis_ctrl_ready & (m02_axis_ctrl_user == CTRL_SRC_REGS)) begin
         csr_udp_engine_100g__connManager_wr_connectedId[CONN_ID_WIDTH-1:0]  <= m02_axis_ctrl_connectionId;
         csr_udp_engine_100g__connManager_wr_status[0] <= m02_axis_ctrl_ack;
         csr_udp_engine_100g__connManager_wr_status[1] <= m02_axis_ctrl_full;
         csr_udp_engine_100g__connManager_wr_status[31:2] <= 30'b0;
       end else begin
-        if (s02_axis_ctrl_ready & csr_udp_engine_100g__connManager_wr_trigger) begin
+        if (csr_udp_engine_100g__connManager_wr_trigger) begin
           csr_udp_engine_100g__connManager_wr_status      <= 32'b0;
           csr_udp_engine_100g__connManager_wr_connectedId <= 32'b0;
         end
@@ -348,6 +593,87 @@ module udp_engine_100g #(
   end
 
 
+  // -------------------------------------------------------------------------
+  // Registers -> Connection Manager Table Dump Channel
+  // -------------------------------------------------------------------------
+  //   seek (0x38): find the first valid entry at or after the cursor (0x34)
+  //   next (0x3C): find the first valid entry after the last one returned
+  //
+  //   dump_status (0x3C read):
+  //     [31]       done, result registers are valid
+  //     [30]       end, no more valid entries (ip/port/connId are 0)
+  //     [..:16]    way of the entry (CONN_ID_WIDTH - HASH_WIDTH bits)
+  //     [15:0]     udpPort of the entry
+  //   dump_ipAddr (0x40), dump_connectedId (0x44)
+  //
+  //   The hash index is a function of {ipAddr, udpPort}, so software only
+  //   needs dump_status and dump_ipAddr to rebuild an entry.
+
+  logic                     s03_axis_dump_valid;
+  logic [CONN_ID_WIDTH-1:0] s03_axis_dump_cursor;
+  logic                     s03_axis_dump_ready;
+
+  logic                      m03_axis_dump_ready;
+  logic                      m03_axis_dump_valid;
+  logic                      m03_axis_dump_hit;
+  logic [ CONN_ID_WIDTH-1:0] m03_axis_dump_connectionId;
+  logic [ IP_ADDR_WIDTH-1:0] m03_axis_dump_ipAddr;
+  logic [UDP_PORT_WIDTH-1:0] m03_axis_dump_udpPort;
+
+  logic                     dump_exhausted;
+
+  assign m03_axis_dump_ready = 1'b1;
+  always_ff @(posedge s_axi_aclk) begin
+    if (!s_axi_aresetn) begin
+      s03_axis_dump_valid                               <= 1'b0;
+      s03_axis_dump_cursor                              <= 'b0;
+      dump_exhausted                                    <= 1'b0;
+      csr_udp_engine_100g__connManager_dump_status      <= 'b0;
+      csr_udp_engine_100g__connManager_dump_ipAddr      <= 'b0;
+      csr_udp_engine_100g__connManager_dump_connectedId <= 'b0;
+    end else begin
+      if (s03_axis_dump_valid & s03_axis_dump_ready) begin
+        s03_axis_dump_valid <= 1'b0;
+      end
+
+      if (csr_udp_engine_100g__connManager_dump_seek[0] | csr_udp_engine_100g__connManager_dump_next[0]) begin
+        csr_udp_engine_100g__connManager_dump_status      <= 'b0;
+        csr_udp_engine_100g__connManager_dump_ipAddr      <= 'b0;
+        csr_udp_engine_100g__connManager_dump_connectedId <= 'b0;
+
+        if (csr_udp_engine_100g__connManager_dump_seek[0]) begin
+          s03_axis_dump_valid  <= 1'b1;
+          s03_axis_dump_cursor <= csr_udp_engine_100g__connManager_dump_cursor[CONN_ID_WIDTH-1:0];
+          dump_exhausted       <= 1'b0;
+        end else if (dump_exhausted) begin
+          csr_udp_engine_100g__connManager_dump_status[31] <= 1'b1;
+          csr_udp_engine_100g__connManager_dump_status[30] <= 1'b1;
+        end else begin
+          s03_axis_dump_valid <= 1'b1;
+        end
+
+      end else if (m03_axis_dump_valid & m03_axis_dump_ready) begin
+        csr_udp_engine_100g__connManager_dump_status[31]                 <= 1'b1;
+        csr_udp_engine_100g__connManager_dump_status[30]                 <= !m03_axis_dump_hit;
+        csr_udp_engine_100g__connManager_dump_status[CONN_ID_WIDTH-HASH_WIDTH+15:16]     <= m03_axis_dump_connectionId[CONN_ID_WIDTH-1:HASH_WIDTH];
+        csr_udp_engine_100g__connManager_dump_status[15:0]               <= m03_axis_dump_udpPort;
+        csr_udp_engine_100g__connManager_dump_ipAddr                     <= m03_axis_dump_ipAddr;
+        csr_udp_engine_100g__connManager_dump_connectedId[CONN_ID_WIDTH-1:0] <= m03_axis_dump_connectionId;
+
+        // auto-advance the cursor past the returned entry (hash-major, way-minor)
+        if (!m03_axis_dump_hit) begin
+          dump_exhausted <= 1'b1;
+        end else if (m03_axis_dump_connectionId[CONN_ID_WIDTH-1:HASH_WIDTH] == WAYS - 1) begin
+          s03_axis_dump_cursor <= {{(CONN_ID_WIDTH-HASH_WIDTH){1'b0}}, m03_axis_dump_connectionId[HASH_WIDTH-1:0] + 1'b1};
+          dump_exhausted       <= (m03_axis_dump_connectionId[HASH_WIDTH-1:0] == {HASH_WIDTH{1'b1}});
+        end else begin
+          s03_axis_dump_cursor <= m03_axis_dump_connectionId + (1 << HASH_WIDTH);
+        end
+      end
+    end
+  end
+
+
   // -------------------------------------------------------------------------
   // Connection Manager
   // -------------------------------------------------------------------------
@@ -411,13 +737,27 @@ module udp_engine_100g #(
       .s02_axis_ctrl_ipAddr(s02_axis_ctrl_ipAddr),
       .s02_axis_ctrl_udpPort(s02_axis_ctrl_udpPort),
       .s02_axis_ctrl_bind(s02_axis_ctrl_bind),
+      .s02_axis_ctrl_user(s02_axis_ctrl_user),
       .s02_axis_ctrl_ready(s02_axis_ctrl_ready),
 
       .m02_axis_ctrl_ready(m02_axis_ctrl_ready),
       .m02_axis_ctrl_valid(m02_axis_ctrl_valid),
       .m02_axis_ctrl_ack(m02_axis_ctrl_ack),
       .m02_axis_ctrl_connectionId(m02_axis_ctrl_connectionId),
-      .m02_axis_ctrl_full(m02_axis_ctrl_full)
+      .m02_axis_ctrl_full(m02_axis_ctrl_full),
+      .m02_axis_ctrl_user(m02_axis_ctrl_user),
+
+      // Table Dump Channel
+      .s03_axis_dump_valid(s03_axis_dump_valid),
+      .s03_axis_dump_cursor(s03_axis_dump_cursor),
+      .s03_axis_dump_ready(s03_axis_dump_ready),
+
+      .m03_axis_dump_ready(m03_axis_dump_ready),
+      .m03_axis_dump_valid(m03_axis_dump_valid),
+      .m03_axis_dump_hit(m03_axis_dump_hit),
+      .m03_axis_dump_connectionId(m03_axis_dump_connectionId),
+      .m03_axis_dump_ipAddr(m03_axis_dump_ipAddr),
+      .m03_axis_dump_udpPort(m03_axis_dump_udpPort)
   );
 
 
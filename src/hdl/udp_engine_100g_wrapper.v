@@ -7,6 +7,7 @@ module udp_engine_100g_wrapper #(
     // user parameters
     parameter WAYS                          = 4,
     parameter CONNECTION_MANAGER_LATENCY    = 5,
+    parameter ENABLE_CTRL_DMA               = 0,     // build the ctrl_s_axis / ctrl_m_axis bulk path
 
     // implementation parameters
     parameter DATA_WIDTH                    = 512,
@@ -61,6 +62,24 @@ module udp_engine_100g_wrapper #(
     output wire                                 udp_rx_axis_tlast,
     input  wire                                 udp_rx_axis_tready,
 
+    // ----------------------------------------------------------------
+    // CONNECTION MANAGER BULK INTERFACE (AXI-STREAM, s_axi_aclk)
+    // ----------------------------------------------------------------
+
+    // Command Channel (from DMA MM2S)
+    input  wire [63:0]                          ctrl_s_axis_tdata,
+    input  wire [7:0]                           ctrl_s_axis_tkeep,
+    input  wire                                 ctrl_s_axis_tvalid,
+    input  wire                                 ctrl_s_axis_tlast,
+    output wire                                 ctrl_s_axis_tready,
+
+    // Response Channel (to DMA S2MM)
+    output wire [31:0]                          ctrl_m_axis_tdata,
+    output wire [3:0]                           ctrl_m_axis_tkeep,
+    output wire                                 ctrl_m_axis_tvalid,
+    output wire                                 ctrl_m_axis_tlast,
+    input  wire                                 ctrl_m_axis_tready,
+
     // ----------------------------------------------------------------
     // CONTROL INTERFACE (AXI-LITE)
     // ----------------------------------------------------------------
@@ -94,7 +113,8 @@ module udp_engine_100g_wrapper #(
     // =========================================================================
     udp_engine_100g #(
         .WAYS                       (WAYS),
-        .CONNECTION_MANAGER_LATENCY (CONNECTION_MANAGER_LATENCY)
+        .CONNECTION_MANAGER_LATENCY (CONNECTION_MANAGER_LATENCY),
+        .ENABLE_CTRL_DMA            (ENABLE_CTRL_DMA)
     ) udp_engine_100g_unit (
         // ----------------------------------------------------------------
         // CLOCKS AND RESETS
@@ -143,6 +163,24 @@ module udp_engine_100g_wrapper #(
         .udp_rx_axis_tlast          (udp_rx_axis_tlast),
         .udp_rx_axis_tready         (udp_rx_axis_tready),
 
+        // ----------------------------------------------------------------
+        // CONNECTION MANAGER BULK INTERFACE (AXI-STREAM)
+        // ----------------------------------------------------------------
+
+        // Command Channel
+        .ctrl_s_axis_tdata          (ctrl_s_axis_tdata),
+        .ctrl_s_axis_tkeep          (ctrl_s_axis_tkeep),
+        .ctrl_s_axis_tvalid         (ctrl_s_axis_tvalid),
+        .ctrl_s_axis_tlast          (ctrl_s_axis_tlast),
+        .ctrl_s_axis_tready         (ctrl_s_axis_tready),
+
+        // Response Channel
+        .ctrl_m_axis_tdata          (ctrl_m_axis_tdata),
+        .ctrl_m_axis_tkeep          (ctrl_m_axis_tkeep),
+        .ctrl_m_axis_tvalid         (ctrl_m_axis_tvalid),
+        .ctrl_m_axis_tlast          (ctrl_m_axis_tlast),
+        .ctrl_m_axis_tready         (ctrl_m_axis_tready),
+
         // ----------------------------------------------------------------
         // CONTROL INTERFACE (AXI-LITE)
         // ----------------------------------------------------------------
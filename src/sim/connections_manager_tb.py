@@ -175,6 +175,53 @@ class S_AXIS_Driver(BusDriver):
 
 
 
+class DMA_Standin:
+    """
+    stands in for the AXI DMA pair on the bulk control path of udp_engine_100g:
+        MM2S: streams a uint64 command buffer {bind, udpPort, ipAddr} into s02, tagged
+              CTRL_SRC_DMA (CTRL_SRC_DMA_LAST on the final word) like the top-level mux
+        S2MM: collects the DMA-tagged m02 responses into a uint32 buffer until the LAST tag
+    """
+    CTRL_SRC_DMA      = 2
+    CTRL_SRC_DMA_LAST = 3
+    USER_SHIFT_CMD    = 49
+    USER_SHIFT_RESP   = 20
+
+    def __init__(self, dut, clk):
+        self.clock  = clk
+        self.mm2s   = M_AXIS_Driver(dut,'s02',clk)
+        self.s2mm   = S_AXIS_Driver(dut,'m02',clk)
+        self.recv   = AXIS_Monitor(dut,'m02',clk,callback = self._recv)
+        self.responses  = []
+        self.done       = False
+
+    def _recv(self, val):
+        user = (val >> self.USER_SHIFT_RESP) & 0x3
+        if user in (self.CTRL_SRC_DMA, self.CTRL_SRC_DMA_LAST):
+            self.responses.append(val & ((1 << self.USER_SHIFT_RESP) - 1))
+            self.done = (user == self.CTRL_SRC_DMA_LAST)
+
+    async def transfer(self, commands, timeout_cycles):
+        """send the command buffer, return (uint32 responses, cycles until the LAST response)"""
+        tags            = np.full(len(commands), self.CTRL_SRC_DMA, dtype=np.uint64)
+        tags[-1]        = self.CTRL_SRC_DMA_LAST
+        words           = np.asarray(commands, dtype=np.uint64) | (tags << np.uint64(self.USER_SHIFT_CMD))
+
+        self.responses  = []
+        self.done       = False
+        self.s2mm.append({'type':'read', "duration": timeout_cycles})
+        self.mm2s.append({'type':'write_burst', "contents":{"data": [int(w) for w in words]}})
+        self.mm2s.append({"type":"pause", "duration": 1})     # drop tvalid after the last beat
+
+        cycles = 0
+        while not self.done and cycles < timeout_cycles:
+            await RisingEdge(self.clock)
+            cycles += 1
+        return np.array(self.responses, dtype=np.uint32), cycles
+
+
+
+
 # =====================================================================================================================================
 # PYTHON MODEL
 # =====================================================================================================================================
@@ -271,6 +318,10 @@ wr_sig_in           = []
 wr_sig_out_exp      = []
 wr_sig_out_act      = []
 
+dump_sig_in         = []
+dump_sig_out_exp    = []
+dump_sig_out_act    = []
+
 existing_connection_ids = []
 
 
@@ -383,6 +434,55 @@ def appending_values_wr(val):
 
 
 
+def connection_manager_model_dump(cursor):
+    """
+    Expected dump response: first valid slot at or after cursor = {way, hash_key},
+    scanning hash-index major, way minor.
+    """
+    hash_key = cursor & 0xFFFF
+    hash_way = cursor >> 16
+
+    dump_sig_in.append({"cursor": cursor})
+
+    expected = {"hit": 0, "connectionId": 0, "ipAddr": 0, "udpPort": 0}
+    while hash_key < TABLE_SIZE:
+        for w in range(hash_way, WAYS):
+            if my_hash_table_vlds[w][hash_key]:
+                expected = {"hit"           : 1,
+                            "connectionId"  : (w << 16) | hash_key,
+                            "ipAddr"        : my_hash_table_ipAddr[w][hash_key],
+                            "udpPort"       : my_hash_table_udpPort[w][hash_key]}
+                dump_sig_out_exp.append(expected)
+                return
+        hash_key += 1
+        hash_way = 0
+
+    dump_sig_out_exp.append(expected)
+
+
+
+def appending_values_dump(val):
+    ipAddr       = val & 0xFFFFFFFF
+    udpPort      = (val >> 32) & 0xFFFF
+    connectionId = (val >> 48) & 0x3FFFF
+    hit          = (val >> 66) & 0x1
+
+    dump_sig_out_act.append({"hit": hit, "connectionId": connectionId, "ipAddr": ipAddr, "udpPort": udpPort})
+
+
+
+def next_dump_cursor(connectionId):
+    """Slot right after connectionId in dump order, or None past the last slot."""
+    hash_key = connectionId & 0xFFFF
+    hash_way = connectionId >> 16
+    if hash_way < WAYS - 1:
+        return ((hash_way + 1) << 16) | hash_key
+    if hash_key < TABLE_SIZE - 1:
+        return hash_key + 1
+    return None
+
+
+
 # =====================================================================================================================================
 # TESTING LOGIC
 # =====================================================================================================================================
@@ -412,6 +512,9 @@ async def test_structure(dut, WR_NUM_OPERATIONS = 300, RD_NUM_OPERATIONS = 1000,
     wr_in_driver        = M_AXIS_Driver(dut,'s02',dut.s00_axis_aclk)
     wr_out_driver       = S_AXIS_Driver(dut,'m02',dut.s00_axis_aclk)
 
+    dump_in_driver      = M_AXIS_Driver(dut,'s03',dut.s00_axis_aclk)    # idle, keeps tvalid low
+    dump_out_driver     = S_AXIS_Driver(dut,'m03',dut.s00_axis_aclk)
+
     cocotb.start_soon(Clock(dut.s00_axis_aclk, 10, units="ns").start())
     await reset(dut.s00_axis_aclk, dut.s00_axis_aresetn, cycles_held=5, polarity=0)
 
@@ -532,6 +635,226 @@ async def test_structure(dut, WR_NUM_OPERATIONS = 300, RD_NUM_OPERATIONS = 1000,
             )
 
 
+async def test_dump_structure(dut, WR_NUM_OPERATIONS = 300, NUM_CHAINS=128, CHAIN_LEN=8, BRAM_LATENCY=5):
+    """
+    Populate the table through the control channel, then walk it with the dump channel:
+    one request per valid entry, each resuming right after the previously returned slot.
+    """
+    wr_in_monitor       = AXIS_Monitor(dut,'s02',dut.s00_axis_aclk,callback = connection_manager_model_wr)
+    wr_out_monitor      = AXIS_Monitor(dut,'m02',dut.s00_axis_aclk,callback = lambda x: appending_values_wr(x))
+
+    dump_in_monitor     = AXIS_Monitor(dut,'s03',dut.s00_axis_aclk,callback = connection_manager_model_dump)
+    dump_out_monitor    = AXIS_Monitor(dut,'m03',dut.s00_axis_aclk,callback = lambda x: appending_values_dump(x))
+
+    fw_rd_in_driver     = M_AXIS_Driver(dut,'s00',dut.s00_axis_aclk)    # idle, keeps tvalid low
+    rv_rd_in_driver     = M_AXIS_Driver(dut,'s01',dut.s00_axis_aclk)    # idle, keeps tvalid low
+
+    wr_in_driver        = M_AXIS_Driver(dut,'s02',dut.s00_axis_aclk)
+    wr_out_driver       = S_AXIS_Driver(dut,'m02',dut.s00_axis_aclk)
+
+    dump_in_driver      = M_AXIS_Driver(dut,'s03',dut.s00_axis_aclk)
+    dump_out_driver     = S_AXIS_Driver(dut,'m03',dut.s00_axis_aclk)
+
+    cocotb.start_soon(Clock(dut.s00_axis_aclk, 10, units="ns").start())
+    await reset(dut.s00_axis_aclk, dut.s00_axis_aresetn, cycles_held=5, polarity=0)
+
+    #
+    # ----------------------------- MAIN TEST ----------------------------------
+    #
+
+    COLLISION_POOL = list(generate_collision_entries(NUM_CHAINS, CHAIN_LEN))
+
+    for _ in range(WR_NUM_OPERATIONS):
+        pick = random.choice(COLLISION_POOL)
+        bind = (random.random() < 0.8)
+        val  = pick['ip'] | (pick['port'] << 32) | (bind << 48)
+        wr_in_driver.append({'type':'write_single', "contents":{"data": val, "last":1}})
+        wr_in_driver.append({"type":"pause", "duration": random.randint(0,3)})
+    wr_out_driver.append({'type':'read', "duration": WR_NUM_OPERATIONS * 30 + 5000})
+
+    await ClockCycles(dut.s00_axis_aclk, WR_NUM_OPERATIONS * 30 + 1000)
+
+    dump_out_driver.append({'type':'read', "duration": TABLE_SIZE * (BRAM_LATENCY + 2) * 4})
+
+    cursor   = 0
+    requests = 0
+    while cursor is not None:
+        dump_in_driver.append({'type':'write_single', "contents":{"data": cursor, "last":1}})
+        dump_in_driver.append({"type":"pause", "duration": 1})
+        requests += 1
+
+        for _ in range(TABLE_SIZE * (BRAM_LATENCY + 2)):
+            if len(dump_sig_out_act) >= requests:
+                break
+            await RisingEdge(dut.s00_axis_aclk)
+        assert len(dump_sig_out_act) >= requests, f"DUMP request {requests} timed out (cursor=0x{cursor:X})"
+
+        response = dump_sig_out_act[-1]
+        cursor   = next_dump_cursor(response["connectionId"]) if response["hit"] else None
+
+    #
+    # ------------------------------- CHECKING ---------------------------------
+    #
+    print("\nVALIDATION:")
+    assert wr_in_monitor.transactions == wr_out_monitor.transactions,     f"WR transaction count mismatch!"
+    assert dump_in_monitor.transactions == dump_out_monitor.transactions, f"DUMP transaction count mismatch!"
+    assert len(dump_sig_in) == len(dump_sig_out_exp) == len(dump_sig_out_act), "DUMP bookkeeping mismatch!"
+
+    for idx, (sig_in, expected, actual) in enumerate(zip(dump_sig_in, dump_sig_out_exp, dump_sig_out_act)):
+        if expected != actual:
+            raise RuntimeError(
+                f"ERROR:    DUMP mismatch {idx}: cursor=0x{sig_in['cursor']:X} "
+                f"expected {expected}, got {actual}"
+            )
+
+    valid_entries = sum(my_hash_table_vlds[w][h] for w in range(WAYS) for h in range(TABLE_SIZE))
+    dumped        = [a for a in dump_sig_out_act if a["hit"]]
+    assert len(dumped) == valid_entries, f"DUMP returned {len(dumped)} entries, table holds {valid_entries}"
+    assert requests == valid_entries + 1, f"DUMP took {requests} requests for {valid_entries} entries"
+
+
+async def test_throughput_structure(dut, NUM_BINDS = 1024, NUM_CHAINS=16, CHAIN_LEN=16, BRAM_LATENCY=5):
+    """
+    Sustained control channel rate: a back-to-back burst of binds to distinct hash indexes
+    overlaps in the pipeline, then a burst of same-index binds/unbinds exercises the hazard
+    stall. Every response is checked against the sequential model.
+    """
+    wr_in_monitor       = AXIS_Monitor(dut,'s02',dut.s00_axis_aclk,callback = connection_manager_model_wr)
+    wr_out_monitor      = AXIS_Monitor(dut,'m02',dut.s00_axis_aclk,callback = lambda x: appending_values_wr(x))
+
+    fw_rd_in_driver     = M_AXIS_Driver(dut,'s00',dut.s00_axis_aclk)    # idle, keeps tvalid low
+    rv_rd_in_driver     = M_AXIS_Driver(dut,'s01',dut.s00_axis_aclk)    # idle, keeps tvalid low
+    dump_in_driver      = M_AXIS_Driver(dut,'s03',dut.s00_axis_aclk)    # idle, keeps tvalid low
+
+    wr_in_driver        = M_AXIS_Driver(dut,'s02',dut.s00_axis_aclk)
+    wr_out_driver       = S_AXIS_Driver(dut,'m02',dut.s00_axis_aclk)
+
+    cocotb.start_soon(Clock(dut.s00_axis_aclk, 10, units="ns").start())
+    await reset(dut.s00_axis_aclk, dut.s00_axis_aresetn, cycles_held=5, polarity=0)
+
+    SERIAL_CYCLES = BRAM_LATENCY + WAYS + 1     # one bind in flight at a time
+
+    async def burst(values):
+        start    = len(wr_sig_out_act)
+        expected = start + len(values)
+        wr_in_driver.append({'type':'write_burst', "contents":{"data": values}})
+        wr_in_driver.append({"type":"pause", "duration": 1})     # drop tvalid after the last beat
+        cycles   = 0
+        while len(wr_sig_out_act) < expected and cycles < len(values) * SERIAL_CYCLES * 4:
+            await RisingEdge(dut.s00_axis_aclk)
+            cycles += 1
+        assert len(wr_sig_out_act) == expected, f"WR burst timed out ({len(wr_sig_out_act) - start}/{len(values)})"
+        return cycles
+
+    wr_out_driver.append({'type':'read', "duration": NUM_BINDS * SERIAL_CYCLES * 8 + 5000})
+
+    #
+    # ----------------------------- MAIN TEST ----------------------------------
+    #
+
+    # distinct hash indexes: no hazards, every bind overlaps with its neighbours
+    unique = {}
+    while len(unique) < NUM_BINDS:
+        ip, port = random.getrandbits(32), random.getrandbits(16)
+        unique.setdefault(hash_fun_ip_port(ip, port), (ip, port))
+    values = [ip | (port << 32) | (1 << 48) for ip, port in unique.values()]
+
+    cycles          = await burst(values)
+    cycles_per_bind = cycles / NUM_BINDS
+    print(f"\nTHROUGHPUT: {NUM_BINDS} binds in {cycles} cycles = {cycles_per_bind:.2f} cycles/bind "
+          f"(serialized {SERIAL_CYCLES}, speedup {SERIAL_CYCLES / cycles_per_bind:.1f}x)")
+
+    # same hash indexes: hazards stall, results must still match the sequential model
+    COLLISION_POOL = list(generate_collision_entries(NUM_CHAINS, CHAIN_LEN))
+    values = []
+    for _ in range(NUM_BINDS):
+        pick = random.choice(COLLISION_POOL)
+        bind = (random.random() < 0.7)
+        values.append(pick['ip'] | (pick['port'] << 32) | (bind << 48))
+    collision_cycles = await burst(values)
+    print(f"COLLISIONS: {NUM_BINDS} commands in {collision_cycles} cycles")
+
+    #
+    # ------------------------------- CHECKING ---------------------------------
+    #
+    print("\nVALIDATION:")
+    assert wr_in_monitor.transactions == wr_out_monitor.transactions, f"WR transaction count mismatch!"
+    assert len(wr_sig_in) == len(wr_sig_out_exp) == len(wr_sig_out_act), "WR bookkeeping mismatch!"
+
+    for idx, (sig_in, expected, actual) in enumerate(zip(wr_sig_in, wr_sig_out_exp, wr_sig_out_act)):
+        if expected != actual:
+            raise RuntimeError(
+                f"ERROR:    WR mismatch {idx}: ipAddr=0x{hex(sig_in['ipAddr'])} "
+                f"hash=0x{hex(sig_in['hash_key'])} "
+                f"bind={sig_in['bind']}"
+                f"expected {expected}, got {actual}"
+            )
+
+    assert cycles_per_bind <= 2.5, f"control channel not pipelined: {cycles_per_bind:.2f} cycles/bind"
+
+
+async def test_dma_structure(dut, NUM_ENTRIES = 4096, BRAM_LATENCY=5):
+    """
+    Bulk table initialization through a DMA stand-in: one packed command buffer in, one
+    response buffer out, responses in command order and matching the sequential model.
+    """
+    wr_in_monitor       = AXIS_Monitor(dut,'s02',dut.s00_axis_aclk,callback = connection_manager_model_wr)
+    wr_out_monitor      = AXIS_Monitor(dut,'m02',dut.s00_axis_aclk,callback = lambda x: appending_values_wr(x))
+
+    fw_rd_in_driver     = M_AXIS_Driver(dut,'s00',dut.s00_axis_aclk)    # idle, keeps tvalid low
+    rv_rd_in_driver     = M_AXIS_Driver(dut,'s01',dut.s00_axis_aclk)    # idle, keeps tvalid low
+    dump_in_driver      = M_AXIS_Driver(dut,'s03',dut.s00_axis_aclk)    # idle, keeps tvalid low
+
+    dma                 = DMA_Standin(dut, dut.s00_axis_aclk)
+
+    cocotb.start_soon(Clock(dut.s00_axis_aclk, 10, units="ns").start())
+    await reset(dut.s00_axis_aclk, dut.s00_axis_aresetn, cycles_held=5, polarity=0)
+
+    SERIAL_CYCLES = BRAM_LATENCY + WAYS + 1
+
+    #
+    # ----------------------------- MAIN TEST ----------------------------------
+    #
+
+    # random entries plus a slice of repeats (existing binds) and a few full buckets
+    ipAddr   = np.array([random.getrandbits(32) for _ in range(NUM_ENTRIES)], dtype=np.uint64)
+    udpPort  = np.array([random.getrandbits(16) for _ in range(NUM_ENTRIES)], dtype=np.uint64)
+    repeats  = np.array(random.sample(range(NUM_ENTRIES), NUM_ENTRIES // 16))
+    ipAddr[repeats[1:]]  = ipAddr[repeats[:-1]]
+    udpPort[repeats[1:]] = udpPort[repeats[:-1]]
+
+    collisions = list(generate_collision_entries(4, WAYS + 2))
+    ipAddr   = np.concatenate([ipAddr,  np.array([c['ip']   for c in collisions], dtype=np.uint64)])
+    udpPort  = np.concatenate([udpPort, np.array([c['port'] for c in collisions], dtype=np.uint64)])
+
+    commands = ipAddr | (udpPort << np.uint64(32)) | np.uint64(1 << 48)
+    first    = len(wr_sig_in)    # the model lists are shared with earlier tests
+
+    responses, cycles = await dma.transfer(commands, timeout_cycles=len(commands) * SERIAL_CYCLES * 4)
+    print(f"\nDMA BULK: {len(commands)} binds in {cycles} cycles = {cycles / len(commands):.2f} cycles/bind")
+
+    #
+    # ------------------------------- CHECKING ---------------------------------
+    #
+    print("\nVALIDATION:")
+    assert dma.done, f"DMA response stream did not end ({len(responses)}/{len(commands)})"
+    assert len(responses) == len(commands), f"DMA returned {len(responses)} responses for {len(commands)} commands"
+    assert wr_in_monitor.transactions == wr_out_monitor.transactions, f"WR transaction count mismatch!"
+    assert len(wr_sig_in) == len(wr_sig_out_exp) == len(wr_sig_out_act), "WR bookkeeping mismatch!"
+
+    dma_sig = zip(wr_sig_in[first:], wr_sig_out_exp[first:], wr_sig_out_act[first:], responses)
+    for idx, (sig_in, expected, actual, resp) in enumerate(dma_sig):
+        packed = (expected["full"] << 19) | (expected["ack"] << 18) | expected["connectionId"]
+        if expected != actual or packed != int(resp):
+            raise RuntimeError(
+                f"ERROR:    DMA mismatch {idx}: ipAddr=0x{hex(sig_in['ipAddr'])} "
+                f"hash=0x{hex(sig_in['hash_key'])} "
+                f"expected {expected}, got {actual} / 0x{int(resp):X}"
+            )
+
+    assert any((int(r) >> 19) & 1 for r in responses), "no full bucket exercised"
+
+
 # =====================================================================================================================================
 # TEST CASES
 # =====================================================================================================================================
@@ -570,6 +893,32 @@ async def test_4(dut):
 
 
 
+@cocotb.test()
+async def test_dump(dut):
+    """
+    table dump channel: one request per valid entry returns exactly the model's valid slots
+    """
+    await test_dump_structure(dut, WR_NUM_OPERATIONS = 300, NUM_CHAINS=128, CHAIN_LEN=8)
+
+
+@cocotb.test()
+async def test_throughput(dut):
+    """
+    pipelined control channel: distinct-index binds sustain well under the serialized rate
+    """
+    await test_throughput_structure(dut, NUM_BINDS = 1024, NUM_CHAINS=16, CHAIN_LEN=16)
+
+
+@cocotb.test()
+async def test_dma_bulk(dut):
+    """
+    bulk table initialization: a DMA command buffer in, a DMA response buffer out
+    """
+    await test_dma_structure(dut, NUM_ENTRIES = 4096)
+
+
+
+
 # =====================================================================================================================================
 # TEST RUNNER
 # =====================================================================================================================================
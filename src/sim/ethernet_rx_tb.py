@@ -1,12 +1,10 @@
 import cocotb
 import os
-import random
 import sys
 import numpy
 import logging
 import numpy as np
 import math
-import random
 
 
 from math import log
@@ -32,6 +30,14 @@ from cocotb_bus.monitors import BusMonitor
 from cocotb_bus.scoreboard import Scoreboard
 from cocotb.binary import BinaryValue
 
+from tb_payload import make_payload_generator
+
+
+# SEED reproduces a run: every random draw of the bench comes from rng (the seed is logged at test start)
+SEED = int(os.getenv("SEED", np.random.SeedSequence().entropy))
+rng = np.random.default_rng(SEED)
+generate_payload = make_payload_generator(rng)
+
 
 import os
 
@@ -258,12 +264,12 @@ def generate_collision_entries(num_chains=5, chain_len=5):
 	used_ips = set()
 
 	for _ in range(num_chains):
-		target_hash = random.getrandbits(16)
+		target_hash = int(rng.integers(1 << 16))
 		chain = []
 
 		while len(chain) < chain_len:
-			ip = random.getrandbits(32)
-			port = random.getrandbits(16)
+			ip = int(rng.integers(1 << 32))
+			port = int(rng.integers(1 << 16))
 			hash_v = hash_fun_ip_port(ip, port)
 			if hash_v == target_hash and (ip, port) not in used_ips:
 				entry = {
@@ -367,10 +373,10 @@ def appending_values_wr(val):
 # =====================================================================================================================================
 # PYTHON MODEL (UDP)
 # =====================================================================================================================================
-MY_CONFIG_SRC_MAC = random.getrandbits(48)
-MY_CONFIG_MAC = random.getrandbits(48)
-MY_CONFIG_IP = random.getrandbits(32)
-MY_CONFIG_PORT = random.getrandbits(16)
+MY_CONFIG_SRC_MAC = int(rng.integers(1 << 48))
+MY_CONFIG_MAC = int(rng.integers(1 << 48))
+MY_CONFIG_IP = int(rng.integers(1 << 32))
+MY_CONFIG_PORT = int(rng.integers(1 << 16))
 
 IP_UDP_DSCP = 0
 IP_UDP_ENC = 0
@@ -393,15 +399,15 @@ def generate_random_packet(existing_connection_ids):
 	# ------------------------------------------------------------
 	# 1. Generate packet length
 	# ------------------------------------------------------------
-	n = random.randint(0, 3)
-	mode = random.randint(0, 2)
+	n = int(rng.integers(0, 4))
+	mode = int(rng.integers(0, 3))
 
 	if mode == 0:
-		base_len = random.randrange(8, 176, 8)
+		base_len = 8 * int(rng.integers(1, 22))
 	elif mode == 1:
 		base_len = 176
 	else:
-		base_len = random.randrange(184, 513, 8)
+		base_len = 184 + 8 * int(rng.integers(0, 42))
 
 	payload_length_bits = base_len + n * 512
 	assert payload_length_bits % 8 == 0
@@ -410,15 +416,15 @@ def generate_random_packet(existing_connection_ids):
 	# ------------------------------------------------------------
 	# 2. Payload bytes (list of ints)
 	# ------------------------------------------------------------
-	payload = [random.getrandbits(8) for _ in range(payload_length_bytes)]
+	payload = generate_payload(payload_length_bytes)
 
 	# ------------------------------------------------------------
 	# 3. Pick connectionId
 	# ------------------------------------------------------------
-	if existing_connection_ids and random.random() < 0.9:
-		connection_id = random.choice(existing_connection_ids)
+	if existing_connection_ids and rng.random() < 0.9:
+		connection_id = existing_connection_ids[rng.integers(len(existing_connection_ids))]
 	else:
-		connection_id = random.getrandbits(18)
+		connection_id = int(rng.integers(1 << 18))
 
 	# Convert connectionId to 4 big-endian bytes
 	conn_bytes = [
@@ -638,7 +644,7 @@ def model_udp(
 	BEAT_BYTES = 64
 	num_beats = (len(full_packet_bytes) + BEAT_BYTES - 1) // BEAT_BYTES
 
-	drop_beat = random.randint(0, 100) < 50
+	drop_beat = int(rng.integers(0, 101)) < 50
 	for b in range(num_beats):
 		start = b * BEAT_BYTES
 		end = min(start + BEAT_BYTES, len(full_packet_bytes))
@@ -728,6 +734,7 @@ async def reset(clk, rst, cycles_held=3, polarity=1):
 async def test_structure(
 	dut, NUM_TEST_PACKETS=100, WR_NUM_OPERATIONS=300, NUM_CHAINS=128, CHAIN_LEN=8, loopback_enable=0
 ):
+	dut._log.info(f"SEED={SEED} (set SEED to reproduce this run)")
 
 	wr_in_monitor = AXIS_Monitor(
 		dut, "s02", dut.s00_axis_aclk, callback=connection_manager_model_wr
@@ -769,8 +776,8 @@ async def test_structure(
 
 		for _ in range(num_operations):
 
-			pick = random.choice(COLLISION_POOL)
-			bind = random.random() < 0.9
+			pick = COLLISION_POOL[rng.integers(len(COLLISION_POOL))]
+			bind = rng.random() < 0.9
 
 			val = 0
 			val |= pick["ip"]
@@ -780,7 +787,7 @@ async def test_structure(
 			wr_in_driver.append(
 				{"type": "write_single", "contents": {"data": val, "last": 1}}
 			)
-			wr_in_driver.append({"type": "pause", "duration": random.randint(0, 3)})
+			wr_in_driver.append({"type": "pause", "duration": int(rng.integers(0, 4))})
 
 	#
 	# -------------------- Pre-fill connection manager -------------------------
@@ -851,9 +858,9 @@ async def test_structure(
 		if not invalid_packet:
 			valid_packets += 1
 
-		if random.random() < 0.1:
+		if rng.random() < 0.1:
 			continue
-		udp_in_driver.append({"type": "pause", "duration": random.randint(0, 10)})
+		udp_in_driver.append({"type": "pause", "duration": int(rng.integers(0, 11))})
 
 	udp_in_driver.append({"type": "pause", "duration": 5})
 	udp_out_driver.append({"type": "read", "duration": NUM_TEST_PACKETS * 10})
@@ -0,0 +1,43 @@
+import os
+
+
+# =====================================================================================================================================
+# PAYLOAD CONTENT (shared by ethernet_tx_tb, ethernet_rx_tb and full_tx_rx_tb)
+# =====================================================================================================================================
+
+# payload content, selectable with PAYLOAD_MODE for throughput runs where content doesn't matter:
+#   random (default), zero, counter (byte i = i & 0xFF) or pool (slices of a pre-generated random pool)
+PAYLOAD_MODES       = ("random", "zero", "counter", "pool")
+PAYLOAD_MODE        = os.getenv("PAYLOAD_MODE", "random")
+if PAYLOAD_MODE not in PAYLOAD_MODES:
+    raise ValueError(f"PAYLOAD_MODE must be one of {PAYLOAD_MODES}, got {PAYLOAD_MODE!r}")
+
+PAYLOAD_POOL_BYTES  = 1 << 16
+COUNTER_PATTERN     = bytes(range(256)) * 16
+
+
+def make_payload_generator(rng, mode=PAYLOAD_MODE):
+    """
+    generate_payload(payload_length_bytes) for one bench, drawing from rng (np.random.Generator)
+
+    the pool of the 'pool' mode is drawn from rng here, so a seeded rng reproduces every payload
+    """
+    if mode not in PAYLOAD_MODES:
+        raise ValueError(f"payload mode must be one of {PAYLOAD_MODES}, got {mode!r}")
+
+    pool = rng.bytes(PAYLOAD_POOL_BYTES) if mode == "pool" else b""
+
+    def generate_payload(payload_length_bytes):
+        """
+        payload bytes (list of ints) drawn in bulk according to mode
+        """
+        if mode == "zero":
+            return [0] * payload_length_bytes
+        if mode == "counter":
+            return list(COUNTER_PATTERN[:payload_length_bytes])
+        if mode == "pool":
+            start = int(rng.integers(len(pool) - payload_length_bytes + 1))
+            return list(pool[start:start + payload_length_bytes])
+        return list(rng.bytes(payload_length_bytes))
+
+    return generate_payload
@@ -5,6 +5,7 @@ This module provides software models and hardware controllers for managing UDP c
 and packet processing on PYNQ FPGA platforms. It includes:
 - Connection management with hash-based lookup tables
 - Hardware register control via MMIO
+- Direct /dev/mem register access without the pynq MMIO layer
 - UDP packet generation and modeling
 
 Authors:          M.Subhi Abordan (msubhi_a@mit.edu)
@@ -12,9 +13,25 @@ Authors:          M.Subhi Abordan (msubhi_a@mit.edu)
 Last Modified:    Dec 5, 2025
 """
 
+import asyncio
+import bisect
+import collections.abc
+import concurrent.futures
+import csv
+import hashlib
+import mmap
+import multiprocessing.resource_tracker
+import multiprocessing.shared_memory
+import os
+import queue
 import random
+import socket
+import struct
+import threading
 import time
 
+import numpy as np
+
 from pynq import PL
 from pynq import Overlay
 from pynq import Clocks
@@ -42,6 +59,12 @@ class connection_manager_sw:
         my_hash_table_udpPort   (list): UDP port numbers stored in table
         my_hash_table_ipAddr    (list): IP addresses stored in table
         existing_connection_ids (list): List of currently active connection IDs
+        modified_buckets         (set): Hash indexes written since last drained
+                                        (consumed by connection_table_merkle)
+        slot_generation         (dict): {connectionId: count} bumped whenever a valid
+                                        slot is cleared or overwritten (lets per-connection
+                                        caches such as udp_model's header templates
+                                        detect stale entries)
     """
 
     def __init__(self, WAYS=4, HASH_WIDTH=16):
@@ -53,6 +76,8 @@ class connection_manager_sw:
         self.my_hash_table_udpPort = [[0] * self.TABLE_SIZE for _ in range(WAYS)]
         self.my_hash_table_ipAddr = [[0] * self.TABLE_SIZE for _ in range(WAYS)]
         self.existing_connection_ids = []
+        self.modified_buckets = set()
+        self.slot_generation = {}
 
     @staticmethod
     def _hash_fun_ip_port(ip, port):
@@ -111,6 +136,7 @@ class connection_manager_sw:
 
         hash_key = connection_manager_sw._hash_fun_ip_port(ipAddr, udpPort)
         connectionId = 0
+        self.modified_buckets.add(hash_key)
 
         if bind:
             inserted = False
@@ -153,6 +179,8 @@ class connection_manager_sw:
                     self.my_hash_table_vlds[w][hash_key] = 0
                     self.my_hash_table_ipAddr[w][hash_key] = 0
                     self.my_hash_table_udpPort[w][hash_key] = 0
+                    slot = (w << 16) | hash_key
+                    self.slot_generation[slot] = self.slot_generation.get(slot, 0) + 1
             expected = {"ack": 1, "full": 0, "connectionId": 0}
 
         return expected
@@ -210,8 +238,53 @@ class connection_manager_sw:
 
         return expected
 
+    def live_bindings(self):
+        """
+        Snapshot of all valid entries.
+
+        Returns:
+            dict: {(ipAddr, udpPort): connectionId} for every valid entry
+        """
+        bindings = {}
+        for connectionId in set(self.existing_connection_ids):
+            entry = self.read_rv(connectionId)
+            if entry["hit"]:
+                bindings[(entry["ipAddr"], entry["udpPort"])] = connectionId
+        return bindings
+
+    def restore_bindings(self, entries):
+        """
+        Place entries directly at their recorded slots, without re-running placement.
+
+        Args:
+            entries: Iterable of (connectionId, ipAddr, udpPort)
+        """
+        for connectionId, ipAddr, udpPort in entries:
+            hash_key = connectionId & 0xFFFF
+            hash_way = connectionId >> 16
+            if self.my_hash_table_vlds[hash_way][hash_key]:
+                self.slot_generation[connectionId] = self.slot_generation.get(connectionId, 0) + 1
+            self.my_hash_table_vlds[hash_way][hash_key] = 1
+            self.my_hash_table_ipAddr[hash_way][hash_key] = ipAddr
+            self.my_hash_table_udpPort[hash_way][hash_key] = udpPort
+            self.existing_connection_ids.append(connectionId)
+            self.modified_buckets.add(hash_key)
+
+    def bucket_entries(self, hash_key):
+        """
+        Valid entries at one hash index.
+
+        Returns:
+            list: (way, ipAddr, udpPort) tuples in way order
+        """
+        return [
+            (w, self.my_hash_table_ipAddr[w][hash_key], self.my_hash_table_udpPort[w][hash_key])
+            for w in range(self.WAYS)
+            if self.my_hash_table_vlds[w][hash_key]
+        ]
+
     @staticmethod
-    def generate_collision_entries(num_chains=5, chain_len=5):
+    def generate_collision_entries(num_chains=5, chain_len=5, rng=None):
         """
         Generate test entries that intentionally collide in the hash table.
 
@@ -222,6 +295,10 @@ class connection_manager_sw:
         Args:
             num_chains: Number of collision chains to generate (default: 5)
             chain_len: Number of entries per chain (default: 5)
+            rng: None to draw from the global random module (follows random.seed()),
+                 a random.Random, or a seed / np.random.SeedSequence / Generator
+                 turned into a random.Random the same way as udp_model, so entries
+                 can come from a spawned or stream()-ed SeedSequence
 
         Returns:
             list: List of dictionaries, each containing:
@@ -232,16 +309,23 @@ class connection_manager_sw:
             All generated IP/port combinations are unique across all chains.
         """
 
+        if rng is None:
+            rand = random
+        elif isinstance(rng, random.Random):
+            rand = rng
+        else:
+            rand = udp_model._scalar_random(udp_model._make_rng(rng)[0])
+
         result = []
         used_ips = set()
 
         for _ in range(num_chains):
-            target_hash = random.getrandbits(16)
+            target_hash = rand.getrandbits(16)
             chain = []
 
             while len(chain) < chain_len:
-                ip = random.getrandbits(32)
-                port = random.getrandbits(16)
+                ip = rand.getrandbits(32)
+                port = rand.getrandbits(16)
                 hash_v = connection_manager_sw._hash_fun_ip_port(ip, port)
                 if hash_v == target_hash and (ip, port) not in used_ips:
                     entry = {
@@ -257,6 +341,715 @@ class connection_manager_sw:
         return result
 
 
+# ======================================================================================================
+# MMIO BACKEND - Direct Memory-Mapped Register Access
+# ======================================================================================================
+
+
+class udp_engine_mmio:
+    """
+    Direct memory-mapped register access, bypassing the pynq MMIO object.
+
+    Mirrors the DMA_Driver in test_dma.cpp: the register window is mapped once with
+    mmap and every access is a single indexed load/store on a 32-bit memoryview.
+    Exposes the same read(offset) / write(offset, value) interface as pynq MMIO, so
+    it can be handed to udp_engine_controller as-is.
+
+    On the board the device is /dev/mem and base_addr is the physical address of the
+    AXI-Lite slave. Any regular file of sufficient size (e.g. under /dev/shm) can be
+    used instead, which is how the per-register access cost is measured off-board.
+
+    Attributes:
+        device_path:    File that is mapped (default: /dev/mem)
+        base_addr:      Physical (or file) offset of the register window
+        length:         Size of the register window in bytes
+    """
+
+    def __init__(self, base_addr, length, device_path="/dev/mem"):
+        self.device_path = device_path
+        self.base_addr = base_addr
+        self.length = length
+
+        # mmap offsets must be page aligned, keep the remainder like test_dma.cpp
+        page_base = base_addr & ~(mmap.PAGESIZE - 1)
+        page_offset = base_addr - page_base
+
+        self._fd = os.open(device_path, os.O_RDWR | os.O_SYNC)
+        self._mmap = mmap.mmap(
+            self._fd,
+            length + page_offset,
+            flags=mmap.MAP_SHARED,
+            prot=mmap.PROT_READ | mmap.PROT_WRITE,
+            offset=page_base,
+        )
+        self._regs = memoryview(self._mmap)[page_offset : page_offset + length].cast("I")
+
+    @classmethod
+    def from_ip_dict(cls, ip_description, device_path="/dev/mem"):
+        """
+        Map the register window of an overlay IP, e.g. ol.ip_dict['udp_engine_100g_ip'].
+        """
+        return cls(
+            ip_description["phys_addr"], ip_description["addr_range"], device_path
+        )
+
+    def read(self, offset):
+        """Read the 32-bit register at byte offset."""
+        return self._regs[offset >> 2]
+
+    def write(self, offset, value):
+        """Write a 32-bit value to the register at byte offset."""
+        self._regs[offset >> 2] = value & 0xFFFFFFFF
+
+    def close(self):
+        """Release the mapping and the underlying file descriptor."""
+        if self._mmap is None:
+            return
+        self._regs.release()
+        self._mmap.close()
+        os.close(self._fd)
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# ======================================================================================================
+# CONNECTION OP VERIFIER - Deferred Model-vs-Hardware Checking
+# ======================================================================================================
+
+
+class connection_op_verifier:
+    """
+    Deferred verification of bind/unbind results against the software model.
+
+    The controller records every hardware response into an op log instead of
+    updating and comparing the model inline. flush() replays the log through the
+    connection_manager_sw in order and collects mismatches as structured records,
+    so the foreground bind path only costs the MMIO sequence.
+
+    Note that the software model (and therefore udp_model) only reflects the
+    recorded operations once they have been flushed.
+
+    Attributes:
+        connection_manager: Software connection manager the log is replayed into
+        batch_size:         Flush automatically after this many ops (None: manual)
+        op_log (list):      Recorded (seq, ipAddr, udpPort, bind, actual) tuples
+        mismatches (list):  One dict per mismatch, see report()
+        checked:            Number of ops replayed so far
+        admission_stats:    Bind outcome counters updated during replay (see
+                            tally_bind); a controller shares its own dict here
+    """
+
+    def __init__(self, connection_manager, batch_size=None):
+        self.connection_manager = connection_manager
+        self.batch_size = batch_size
+        self.op_log = []
+        self.mismatches = []
+        self.checked = 0
+        self.admission_stats = {
+            "predicted_failures": 0,
+            "actual_failures": 0,
+            "rejected": 0,
+            "mispredicted": 0,
+        }
+        self._seq = 0
+
+    @staticmethod
+    def tally_bind(stats, bind, expected, actual):
+        """
+        Count a bind's model prediction (expected) against the hardware response.
+
+        The model is applied in command order, so expected is exactly what a
+        preflight check would have predicted; counting here keeps the prediction
+        off the foreground bind path.
+        """
+        if not bind or not actual["ack"]:
+            return
+        if expected["full"]:
+            stats["predicted_failures"] += 1
+        if actual["full"]:
+            stats["actual_failures"] += 1
+        if bool(expected["full"]) != bool(actual["full"]):
+            stats["mispredicted"] += 1
+
+    def record(self, ipAddr, udpPort, bind, actual):
+        """Append a hardware response to the op log."""
+        self.op_log.append((self._seq, ipAddr, udpPort, bind, actual))
+        self._seq += 1
+        if self.batch_size is not None and len(self.op_log) >= self.batch_size:
+            self.flush()
+
+    def _check(self, seq, ipAddr, udpPort, bind, actual):
+        expected = self.connection_manager.write(ipAddr, udpPort, bind=bind)
+        self.checked += 1
+        connection_op_verifier.tally_bind(self.admission_stats, bind, expected, actual)
+        if expected != actual:
+            self.mismatches.append(
+                {
+                    "seq": seq,
+                    "ipAddr": ipAddr,
+                    "udpPort": udpPort,
+                    "bind": bind,
+                    "expected": expected,
+                    "actual": actual,
+                }
+            )
+
+    def flush(self):
+        """Replay all recorded ops into the model and compare."""
+        op_log, self.op_log = self.op_log, []
+        for op in op_log:
+            self._check(*op)
+
+    def report(self):
+        """
+        Flush pending ops and summarize the verification results.
+
+        Returns:
+            dict: Report with keys:
+                - 'checked':    Number of ops verified
+                - 'mismatches': List of dicts with keys 'seq', 'ipAddr', 'udpPort',
+                                'bind', 'expected' and 'actual'
+        """
+        self.flush()
+        return {"checked": self.checked, "mismatches": list(self.mismatches)}
+
+    def close(self):
+        self.flush()
+
+
+class connection_op_verifier_threaded(connection_op_verifier):
+    """
+    connection_op_verifier that replays the op log on a background thread.
+
+    record() only enqueues the response; a daemon thread applies it to the model
+    and compares. flush() blocks until everything recorded so far is checked.
+    """
+
+    def __init__(self, connection_manager):
+        super().__init__(connection_manager)
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            op = self._queue.get()
+            try:
+                if op is None:
+                    return
+                self._check(*op)
+            finally:
+                self._queue.task_done()
+
+    def record(self, ipAddr, udpPort, bind, actual):
+        self._queue.put((self._seq, ipAddr, udpPort, bind, actual))
+        self._seq += 1
+
+    def flush(self):
+        self._queue.join()
+
+    def close(self):
+        """Check all pending ops and stop the background thread."""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join()
+
+
+# ======================================================================================================
+# CONNECTION JOURNAL - Crash-Safe Bind Log
+# ======================================================================================================
+
+
+class connection_journal:
+    """
+    Append-only journal of bind/unbind operations with snapshot compaction.
+
+    The hardware table survives a restart of the controller process, the software
+    model does not. Every bind/unbind sent to hardware is appended to the journal
+    (fsync'ed every fsync_every records); on startup replay() rebuilds the model
+    from the latest snapshot plus the journal tail instead of rebinding everything.
+
+    compact() writes the live bindings with their exact connectionIds to a snapshot
+    and starts an empty journal, so replay cost stays bounded: snapshot entries are
+    restored in place, only the journal tail goes through placement again. Both
+    files carry a generation number; a journal older than the snapshot is already
+    contained in it and is ignored, which makes a crash during compaction safe.
+
+    Files:
+        <path>:         Journal, header + (bind, ipAddr, udpPort) records
+        <path>.snap:    Snapshot, header + (connectionId, ipAddr, udpPort) records
+
+    Attributes:
+        path:               Journal file path
+        connection_manager: Software model that is replayed into and compacted from
+        fsync_every:        Records between fsyncs
+        compact_every:      Records between automatic compactions (None: manual)
+        model_sync:         Optional callable that brings the model up to date before
+                            a compaction (e.g. a deferred verifier's flush)
+        generation:         Current journal generation
+    """
+
+    MAGIC_JOURNAL = b"ZUJ1"
+    MAGIC_SNAPSHOT = b"ZUS1"
+
+    header = struct.Struct("<4sQ")
+    journal_record = struct.Struct("<BIH")
+    snapshot_record = struct.Struct("<IIH")
+
+    def __init__(self, path, connection_manager, fsync_every=256, compact_every=65536):
+        self.path = str(path)
+        self.snapshot_path = self.path + ".snap"
+        self.connection_manager = connection_manager
+        self.fsync_every = fsync_every
+        self.compact_every = compact_every
+        self.model_sync = None
+
+        self.generation = 0
+        self._file = None
+        self._unsynced = 0
+        self._records = 0
+        self._compact_due = False
+
+    @staticmethod
+    def _fsync_dir(path):
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _read_header(self, f, magic):
+        raw = f.read(self.header.size)
+        if len(raw) < self.header.size:
+            return None
+        file_magic, generation = self.header.unpack(raw)
+        if file_magic != magic:
+            raise ValueError(f"{f.name}: not a connection journal/snapshot file")
+        return generation
+
+    def _open_journal(self, generation):
+        """Start a fresh journal file for the given generation."""
+        if self._file is not None:
+            self._file.close()
+        self._file = open(self.path, "wb")
+        self._file.write(self.header.pack(self.MAGIC_JOURNAL, generation))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._fsync_dir(self.path)
+        self.generation = generation
+        self._unsynced = 0
+        self._records = 0
+        self._compact_due = False
+
+    def replay(self):
+        """
+        Rebuild the software model from snapshot + journal, then reopen the journal
+        for appending.
+
+        Returns:
+            dict: Replay statistics with keys 'snapshot_entries', 'journal_records'
+                  and 'elapsed_s'
+        """
+        start = time.perf_counter()
+        stats = {"snapshot_entries": 0, "journal_records": 0, "elapsed_s": 0.0}
+
+        snapshot_generation = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "rb") as f:
+                snapshot_generation = self._read_header(f, self.MAGIC_SNAPSHOT) or 0
+                data = f.read()
+            usable = len(data) - len(data) % self.snapshot_record.size
+            entries = list(self.snapshot_record.iter_unpack(data[:usable]))
+            self.connection_manager.restore_bindings(entries)
+            stats["snapshot_entries"] = len(entries)
+
+        journal_generation = None
+        records = []
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                journal_generation = self._read_header(f, self.MAGIC_JOURNAL)
+                data = f.read()
+            if journal_generation is not None and journal_generation >= snapshot_generation:
+                # a torn record at the tail was never acknowledged, drop it
+                usable = len(data) - len(data) % self.journal_record.size
+                records = list(self.journal_record.iter_unpack(data[:usable]))
+
+        write = self.connection_manager.write
+        for bind, ipAddr, udpPort in records:
+            write(ipAddr, udpPort, bind=bind)
+        stats["journal_records"] = len(records)
+
+        # keep appending to a valid current journal, otherwise start a new one
+        if records or journal_generation == snapshot_generation:
+            self._file = open(self.path, "r+b")
+            self._file.seek(self.header.size + len(records) * self.journal_record.size)
+            self._file.truncate()
+            self.generation = journal_generation
+            self._records = len(records)
+        else:
+            self._open_journal(snapshot_generation)
+
+        stats["elapsed_s"] = time.perf_counter() - start
+        return stats
+
+    def append(self, ipAddr, udpPort, bind):
+        """Log one bind/unbind that was applied to hardware."""
+        if self._file is None:
+            self._open_journal(self.generation)
+        elif self._compact_due:
+            # deferred to the next append: by now the model has seen every earlier record
+            self.compact()
+
+        self._file.write(self.journal_record.pack(1 if bind else 0, ipAddr, udpPort))
+        self._unsynced += 1
+        self._records += 1
+
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+        if self.compact_every is not None and self._records >= self.compact_every:
+            self._compact_due = True
+
+    def sync(self):
+        """Flush and fsync all appended records."""
+        if self._file is None or not self._unsynced:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def compact(self):
+        """
+        Write the live bindings of the model to a new snapshot and truncate the
+        journal. The model must reflect every record appended so far.
+        """
+        if self.model_sync is not None:
+            self.model_sync()
+
+        generation = self.generation + 1
+        tmp_path = self.snapshot_path + ".tmp"
+
+        pack = self.snapshot_record.pack
+        with open(tmp_path, "wb") as f:
+            f.write(self.header.pack(self.MAGIC_SNAPSHOT, generation))
+            f.write(
+                b"".join(
+                    pack(connectionId, ipAddr, udpPort)
+                    for (ipAddr, udpPort), connectionId in self.connection_manager.live_bindings().items()
+                )
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self._fsync_dir(self.snapshot_path)
+
+        self._open_journal(generation)
+
+    def close(self):
+        if self._file is None:
+            return
+        self.sync()
+        self._file.close()
+        self._file = None
+
+
+# ======================================================================================================
+# CONNECTION TABLE DIGEST - Merkle Divergence Detection
+# ======================================================================================================
+
+
+class connection_table_merkle:
+    """
+    Merkle tree of digests over bucket ranges of the software connection table.
+
+    Each leaf covers buckets_per_leaf consecutive hash indexes and hashes their valid
+    (way, ipAddr, udpPort) entries; inner nodes hash their two children. Comparing
+    against a remote copy of the same tree (level by level, only descending into
+    mismatching nodes) finds the diverged bucket ranges in one round-trip per tree
+    level instead of one lookup per slot.
+
+    The remote side is any callable remote(level, indexes) -> list of digests, e.g.
+    node_digests of a tree built from a table dump, or an on-chip digest where one
+    is available. Without a remote tree, audit_sample() spot-checks random leaves
+    through per-bucket lookups.
+
+    Level 0 is the root; level `depth` holds the leaves.
+
+    Attributes:
+        connection_manager: Software model the tree is built over
+        buckets_per_leaf:   Hash indexes per leaf (power of two)
+        num_leaves:         Number of leaves
+        depth:              Number of levels below the root
+        levels (list):      levels[d] is the list of node digests at level d
+    """
+
+    DIGEST_SIZE = 8
+
+    entry_record = struct.Struct("<IBIH")
+
+    def __init__(self, connection_manager, buckets_per_leaf=16):
+        self.connection_manager = connection_manager
+        self.buckets_per_leaf = buckets_per_leaf
+        self.num_leaves = connection_manager.TABLE_SIZE // buckets_per_leaf
+        self.depth = self.num_leaves.bit_length() - 1
+        self.levels = [None] * (self.depth + 1)
+        self.rebuild()
+
+    @classmethod
+    def _hash(cls, data):
+        return hashlib.blake2b(data, digest_size=cls.DIGEST_SIZE).digest()
+
+    @classmethod
+    def leaf_digest(cls, entries):
+        """
+        Digest of one leaf.
+
+        Args:
+            entries: Iterable of (hash_key, way, ipAddr, udpPort) for every valid entry
+                     of the leaf, ordered by hash_key then way
+        """
+        pack = cls.entry_record.pack
+        return cls._hash(b"".join(pack(*entry) for entry in entries))
+
+    def _leaf_entries(self, leaf):
+        bucket_entries = self.connection_manager.bucket_entries
+        base = leaf * self.buckets_per_leaf
+        for hash_key in range(base, base + self.buckets_per_leaf):
+            for way, ipAddr, udpPort in bucket_entries(hash_key):
+                yield hash_key, way, ipAddr, udpPort
+
+    def leaf_buckets(self, leaf):
+        """Hash indexes covered by a leaf."""
+        base = leaf * self.buckets_per_leaf
+        return range(base, base + self.buckets_per_leaf)
+
+    def rebuild(self):
+        """Recompute every node from the model."""
+        self.connection_manager.modified_buckets.clear()
+        self.levels[self.depth] = [
+            self.leaf_digest(self._leaf_entries(leaf)) for leaf in range(self.num_leaves)
+        ]
+        for level in range(self.depth - 1, -1, -1):
+            below = self.levels[level + 1]
+            self.levels[level] = [
+                self._hash(below[2 * i] + below[2 * i + 1]) for i in range(len(below) // 2)
+            ]
+
+    def refresh(self):
+        """Recompute only the leaves touched since the last refresh and their ancestors."""
+        modified = self.connection_manager.modified_buckets
+        if not modified:
+            return
+        dirty = {hash_key // self.buckets_per_leaf for hash_key in modified}
+        modified.clear()
+
+        leaves = self.levels[self.depth]
+        for leaf in dirty:
+            leaves[leaf] = self.leaf_digest(self._leaf_entries(leaf))
+
+        for level in range(self.depth - 1, -1, -1):
+            dirty = {i >> 1 for i in dirty}
+            below = self.levels[level + 1]
+            nodes = self.levels[level]
+            for i in dirty:
+                nodes[i] = self._hash(below[2 * i] + below[2 * i + 1])
+
+    @property
+    def root(self):
+        self.refresh()
+        return self.levels[0][0]
+
+    def node_digests(self, level, indexes):
+        """Digests of the given nodes at a level (usable as a remote for diff())."""
+        self.refresh()
+        nodes = self.levels[level]
+        return [nodes[i] for i in indexes]
+
+    def diff(self, remote):
+        """
+        Find the leaves whose digest differs from a remote tree.
+
+        Args:
+            remote: Callable remote(level, indexes) -> list of digests; called once
+                    per level, only for children of mismatching nodes
+
+        Returns:
+            list: Diverged leaf indexes (see leaf_buckets())
+        """
+        self.refresh()
+        frontier = [0]
+        for level in range(self.depth + 1):
+            if level:
+                frontier = [child for parent in frontier for child in (2 * parent, 2 * parent + 1)]
+            if not frontier:
+                break
+            local = self.levels[level]
+            frontier = [
+                i for i, digest in zip(frontier, remote(level, frontier)) if digest != local[i]
+            ]
+        return frontier
+
+    def audit_sample(self, lookup_bucket, samples=64, rng=random):
+        """
+        Spot-check random leaves against per-bucket lookups of the other side.
+
+        Args:
+            lookup_bucket:  Callable lookup_bucket(hash_key) -> list of (way, ipAddr,
+                            udpPort) valid entries at that index
+            samples:        Number of leaves to check
+            rng:            Random source
+
+        Returns:
+            list: Diverged leaf indexes among the sampled ones
+        """
+        self.refresh()
+        leaves = self.levels[self.depth]
+        diverged = []
+        for leaf in rng.sample(range(self.num_leaves), min(samples, self.num_leaves)):
+            remote = self.leaf_digest(
+                (hash_key, way, ipAddr, udpPort)
+                for hash_key in self.leaf_buckets(leaf)
+                for way, ipAddr, udpPort in lookup_bucket(hash_key)
+            )
+            if remote != leaves[leaf]:
+                diverged.append(leaf)
+        return diverged
+
+
+# ======================================================================================================
+# CONTROLLER TRACING - Per-Operation Latency Histograms
+# ======================================================================================================
+
+
+class latency_histogram:
+    """
+    Fixed-bucket log-linear histogram of nanosecond latencies.
+
+    Each power of two is split into 2**SUB_BITS linear sub-buckets, so recording is a
+    bit_length, a shift and a list increment, and quantiles are accurate to within
+    one sub-bucket (12.5% with SUB_BITS = 3).
+    """
+
+    SUB_BITS = 3
+
+    def __init__(self):
+        self.counts = [0] * (66 << self.SUB_BITS)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    @classmethod
+    def _index(cls, value):
+        bits = value.bit_length()
+        if bits <= cls.SUB_BITS:
+            return value
+        return ((bits - cls.SUB_BITS) << cls.SUB_BITS) + (value >> (bits - cls.SUB_BITS - 1)) - (1 << cls.SUB_BITS)
+
+    @classmethod
+    def _upper_bound(cls, index):
+        if index < (1 << cls.SUB_BITS):
+            return index
+        shift = (index >> cls.SUB_BITS) - 1
+        top = (index & ((1 << cls.SUB_BITS) - 1)) + (1 << cls.SUB_BITS)
+        return ((top + 1) << shift) - 1
+
+    def record(self, value_ns):
+        self.counts[self._index(value_ns)] += 1
+        self.count += 1
+        self.total_ns += value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-quantile (capped at the max seen)."""
+        if not self.count:
+            return 0
+        rank = max(1, int(q * self.count + 0.999999))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max_ns)
+        return self.max_ns
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "p50_ns": self.quantile(0.50),
+            "p99_ns": self.quantile(0.99),
+            "max_ns": self.max_ns,
+            "mean_ns": self.total_ns // self.count if self.count else 0,
+        }
+
+
+class controller_tracer:
+    """
+    Per-operation latency histograms for udp_engine_controller.
+
+    Passing a tracer to the controller wraps its MMIO object and its configure,
+    bind/unbind, status-wait and model-check methods with perf_counter_ns timers.
+    Without a tracer nothing is wrapped, so tracing costs nothing when disabled.
+    (The asyncio coroutines are not wrapped; their MMIO accesses still are.)
+
+    Attributes:
+        histograms (dict): {operation name: latency_histogram}
+    """
+
+    def __init__(self):
+        self.histograms = {}
+
+    def histogram(self, op):
+        hist = self.histograms.get(op)
+        if hist is None:
+            hist = self.histograms[op] = latency_histogram()
+        return hist
+
+    def record(self, op, elapsed_ns):
+        self.histogram(op).record(elapsed_ns)
+
+    def timed(self, op, fn):
+        """Wrap fn so every call is recorded under op."""
+        hist = self.histogram(op)
+        clock = time.perf_counter_ns
+
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                hist.record(clock() - start)
+
+        wrapper.__wrapped__ = fn
+        return wrapper
+
+    def report(self):
+        """
+        Returns:
+            dict: {operation: {'count', 'p50_ns', 'p99_ns', 'max_ns', 'mean_ns'}}
+        """
+        return {op: hist.summary() for op, hist in sorted(self.histograms.items()) if hist.count}
+
+    def reset(self):
+        self.histograms.clear()
+
+
+class _traced_mmio:
+    """MMIO proxy recording every read and write into a controller_tracer."""
+
+    def __init__(self, mmio, tracer):
+        self._mmio = mmio
+        self.read = tracer.timed("mmio_read", mmio.read)
+        self.write = tracer.timed("mmio_write", mmio.write)
+
+    def __getattr__(self, name):
+        return getattr(self._mmio, name)
+
+
 # ======================================================================================================
 # UDP ENGINE CONTROLLER - Hardware Interface
 # ======================================================================================================
@@ -271,8 +1064,22 @@ class udp_engine_controller:
     and compares hardware behavior against the software model.
 
     Attributes:
-        udp_mmio: PYNQ MMIO object for register access
+        udp_mmio: PYNQ MMIO object (or udp_engine_mmio) for register access
         connection_manager: Software connection manager for validation
+        verifier: Optional connection_op_verifier; when set, bind/unbind results are
+                  recorded for deferred checking instead of compared inline
+        bind_cache: Optional {(ipAddr, udpPort): connectionId} index of live hardware
+                    entries used to answer redundant bind/unbinds without MMIO
+        shadow_regs: {addr: value} of the last confirmed register writes
+        journal: Optional connection_journal every hardware bind/unbind is logged to
+        fail_fast: Refuse binds the model predicts as full without touching hardware
+        tracer: Optional controller_tracer collecting per-operation latencies
+        ctrl_dma: Optional pynq AxiDMA wired to the bulk control streams
+                  (ctrl_s_axis / ctrl_m_axis), used by bulk_bind()/bulk_unbind().
+                  The engine has to be built with ENABLE_CTRL_DMA=1 and the DMA
+                  added to the block design; otherwise the streams are tied off
+        admission_stats: Counters of predicted/actual bind failures, fail-fast
+                         rejections and model mispredictions (drift indicator)
 
     Register Map:
         0x00:       Control register (bit 0: TX enable)
@@ -281,6 +1088,8 @@ class udp_engine_controller:
         0x10:       Source UDP port
         0x14-0x18:  Destination MAC address
         0x1C-0x30:  Connection manager control/status registers
+        0x34-0x44:  Connection table dump window (cursor, seek, next/status, ip, connId)
+        0x48-0x54:  Pipelined batch command FIFO (ip, push, response/pop, status)
     """
 
     addr_csr_udp_engine_100g__ctrl = 0x00
@@ -299,9 +1108,106 @@ class udp_engine_controller:
     addr_csr_udp_engine_100g__connManager_wr_status = 0x2C
     addr_csr_udp_engine_100g__connManager_wr_connectedId = 0x30
 
-    def __init__(self, udp_mmio, connection_manager):
+    addr_csr_udp_engine_100g__connManager_dump_cursor = 0x34
+    addr_csr_udp_engine_100g__connManager_dump_seek = 0x38
+    addr_csr_udp_engine_100g__connManager_dump_next = 0x3C
+    addr_csr_udp_engine_100g__connManager_dump_status = 0x3C
+    addr_csr_udp_engine_100g__connManager_dump_ipAddr = 0x40
+    addr_csr_udp_engine_100g__connManager_dump_connectedId = 0x44
+
+    addr_csr_udp_engine_100g__connManager_batch_ipAddr = 0x48
+    addr_csr_udp_engine_100g__connManager_batch_push = 0x4C
+    addr_csr_udp_engine_100g__connManager_batch_resp = 0x50
+    addr_csr_udp_engine_100g__connManager_batch_pop = 0x50
+    addr_csr_udp_engine_100g__connManager_batch_status = 0x54
+
+    # Commands per DMA transfer on the bulk control path (8 MiB of command words)
+    ctrl_dma_chunk_entries = 1 << 20
+
+    # Upper bound on the wait for a bind/unbind ack
+    ctrl_ack_timeout_s = 0.5
+
+    # Ack poll backoff of the asyncio API (first sleep, doubled up to the cap)
+    ctrl_ack_poll_s = 50e-6
+    ctrl_ack_poll_max_s = 1e-3
+
+    # Upper bound on one table-dump step (a full sweep of empty hash indexes)
+    dump_timeout_s = 0.1
+
+    def __init__(
+        self,
+        udp_mmio,
+        connection_manager,
+        verifier=None,
+        bind_cache=False,
+        journal=None,
+        fail_fast=False,
+        tracer=None,
+        ctrl_dma=None,
+    ):
+        self.tracer = tracer
+        self.ctrl_dma = ctrl_dma
+        if tracer is not None:
+            udp_mmio = _traced_mmio(udp_mmio, tracer)
+            self._install_tracing(tracer)
         self.udp_mmio = udp_mmio
         self.connection_manager = connection_manager
+        self.verifier = verifier
+        self.journal = journal
+        if journal is not None and verifier is not None:
+            journal.model_sync = verifier.flush
+
+        # read-through cache of live bindings, only valid if every bind/unbind since
+        # the last hardware reset went through this controller
+        # (seeded from the model, which may have been rebuilt from a journal)
+        self.bind_cache = connection_manager.live_bindings() if bind_cache else None
+        self.bind_cache_hits = 0
+        self.bind_cache_misses = 0
+
+        self.shadow_regs = {}
+
+        # preflight admission: reject binds the model predicts as full without MMIO;
+        # predicted/actual failures are tallied where the model is applied (inline
+        # or in the verifier's replay), never on the bind path itself
+        self.fail_fast = fail_fast
+        self.admission_stats = {
+            "predicted_failures": 0,
+            "actual_failures": 0,
+            "rejected": 0,
+            "mispredicted": 0,
+        }
+        if verifier is not None:
+            verifier.admission_stats = self.admission_stats
+
+        # asyncio command queue, created on first use inside a running loop
+        self._ctrl_queue = None
+        self._ctrl_worker_task = None
+
+    def _install_tracing(self, tracer):
+        """Shadow the traced methods on this instance with timed wrappers."""
+        for op, name in (
+            ("configure", "configure"),
+            ("apply_config", "apply_config"),
+            ("bind", "bind_connection"),
+            ("unbind", "unbind_connection"),
+            ("load_connections", "load_connections"),
+            ("ctrl_batch", "ctrl_batch"),
+            ("bulk_bind", "bulk_bind"),
+            ("bulk_unbind", "bulk_unbind"),
+            ("wait_ack", "_wait_ctrl_ack"),
+            ("model_check", "_check_ctrl_response"),
+        ):
+            setattr(self, name, tracer.timed(op, getattr(self, name)))
+
+        ctrl_command = self._ctrl_command
+        bind_op = tracer.timed("ctrl_bind", ctrl_command)
+        unbind_op = tracer.timed("ctrl_unbind", ctrl_command)
+
+        def _ctrl_command(dst_ipAddr, dst_udpPort, bind, use_cache=True):
+            op = bind_op if bind else unbind_op
+            return op(dst_ipAddr, dst_udpPort, bind, use_cache)
+
+        self._ctrl_command = _ctrl_command
 
     def _write_confirmed(self, addr, value):
         """
@@ -313,6 +1219,7 @@ class udp_engine_controller:
             print(
                 f"ERROR: Write confirmation failed at 0x{addr:X}: wrote 0x{value:X}, read back 0x{readback:X}"
             )
+        self.shadow_regs[addr] = readback
         return readback
 
     def tx_enable(self):
@@ -359,22 +1266,103 @@ class udp_engine_controller:
         )
         self.tx_enable()
 
-    def bind_connection(self, dst_ipAddr, dst_udpPort):
+    def _identity_registers(self, src_macAddr, src_ipAddr, src_udpPort, dst_macAddr):
+        """Register values written by configure(), as {addr: value}."""
+        return {
+            self.addr_csr_udp_engine_100g__myConfig_macAddr_upper: (src_macAddr >> 32) & 0xFFFFFFFF,
+            self.addr_csr_udp_engine_100g__myConfig_macAddr_lower: src_macAddr & 0xFFFFFFFF,
+            self.addr_csr_udp_engine_100g__myConfig_ipAddr: src_ipAddr,
+            self.addr_csr_udp_engine_100g__myConfig_udpPort: src_udpPort,
+            self.addr_csr_udp_engine_100g__myConfig_macAddr_upper_dst: (dst_macAddr >> 32) & 0xFFFFFFFF,
+            self.addr_csr_udp_engine_100g__myConfig_macAddr_lower_dst: dst_macAddr & 0xFFFFFFFF,
+        }
+
+    def apply_config(self, spec):
         """
-        Bind a new UDP connection in hardware and validate against software model.
+        Bring the engine to a desired state, touching only what differs.
 
-        Sends a bind request to the hardware connection manager and waits for response.
-        Compares hardware result with software model to detect discrepancies.
+        The identity registers are diffed against the shadow copy of the last writes
+        (read from hardware the first time); TX is only disabled if at least one of
+        them changes, and is re-enabled afterwards only if it was enabled before.
+        Bindings are diffed against the live entries of the software
+        model: stale entries are unbound first to free their ways, then missing
+        entries are bound. Applying the same spec twice issues no MMIO writes.
 
         Args:
-            dst_ipAddr: 32-bit destination IP address
-            dst_udpPort: 16-bit destination UDP port
+            spec: dict with optional keys:
+                - 'src_macAddr', 'src_ipAddr', 'src_udpPort', 'dst_macAddr': Engine
+                  identity, as passed to configure() (all four or none)
+                - 'bindings': Iterable of (ipAddr, udpPort) pairs (tuples, or lists
+                  as loaded from JSON) that should be bound; anything else currently
+                  bound is unbound
 
         Returns:
-            dict: Hardware response with keys:
-                - 'ack': Acknowledgment bit
-                - 'full': Table full indicator
-                - 'connectionId': Assigned connection ID (0 if failed)
+            dict: Report with keys:
+                - 'registers_written':  Addresses of the identity registers written
+                - 'tx_outage':          True if TX was disabled to apply the identity
+                - 'bound':              Number of new bindings
+                - 'unbound':            Number of removed bindings
+                - 'failed':             List of (ipAddr, udpPort, response) for binds
+                                        that did not succeed
+        """
+        report = {
+            "registers_written": [],
+            "tx_outage": False,
+            "bound": 0,
+            "unbound": 0,
+            "failed": [],
+        }
+
+        if "src_macAddr" in spec:
+            desired = self._identity_registers(
+                spec["src_macAddr"],
+                spec["src_ipAddr"],
+                spec["src_udpPort"],
+                spec["dst_macAddr"],
+            )
+            changed = {}
+            for addr, value in desired.items():
+                if addr not in self.shadow_regs:
+                    self.shadow_regs[addr] = self.udp_mmio.read(addr)
+                if self.shadow_regs[addr] != value:
+                    changed[addr] = value
+
+            if changed:
+                tx_enabled = self.udp_mmio.read(self.addr_csr_udp_engine_100g__ctrl) & 1
+                self.tx_disable()
+                for addr, value in changed.items():
+                    self._write_confirmed(addr, value)
+                if tx_enabled:
+                    self.tx_enable()
+                report["registers_written"] = list(changed)
+                report["tx_outage"] = True
+
+        if "bindings" in spec:
+            if self.verifier is not None:
+                self.verifier.flush()  # the model must be current to diff against
+
+            desired = {tuple(binding) for binding in spec["bindings"]}
+            current = self.connection_manager.live_bindings()
+
+            for ipAddr, udpPort in current.keys() - desired:
+                self._ctrl_command(ipAddr, udpPort, 0)
+                report["unbound"] += 1
+
+            for ipAddr, udpPort in desired - current.keys():
+                response = self._ctrl_command(ipAddr, udpPort, 1)
+                if response["ack"] and not response["full"]:
+                    report["bound"] += 1
+                else:
+                    report["failed"].append((ipAddr, udpPort, response))
+
+        return report
+
+    def _start_ctrl_command(self, dst_ipAddr, dst_udpPort, bind):
+        """
+        Load the connection manager write registers and pulse the trigger.
+
+        The hardware clears the status register when the trigger is accepted and sets
+        the ack bit once the bind/unbind response is back.
         """
         self._write_confirmed(
             self.addr_csr_udp_engine_100g__connManager_wr_ip_addr, dst_ipAddr
@@ -382,69 +1370,833 @@ class udp_engine_controller:
         self._write_confirmed(
             self.addr_csr_udp_engine_100g__connManager_wr_port, dst_udpPort
         )
-        self._write_confirmed(self.addr_csr_udp_engine_100g__connManager_wr_bind, 1)
+        self._write_confirmed(
+            self.addr_csr_udp_engine_100g__connManager_wr_bind, 1 if bind else 0
+        )
         self._write_confirmed(self.addr_csr_udp_engine_100g__connManager_wr_trigger, 1)
 
-        time.sleep(0.5)
+    def _read_ctrl_response(self):
+        """Read back the status and connectionId of the last bind/unbind command."""
         tmp = self.udp_mmio.read(self.addr_csr_udp_engine_100g__connManager_wr_status)
         ack = tmp & 0x1
         full = (tmp >> 1) & 0x1
         connectionId = self.udp_mmio.read(
             self.addr_csr_udp_engine_100g__connManager_wr_connectedId
         )
+        return {"ack": ack, "full": full, "connectionId": connectionId}
+
+    def _wait_ctrl_ack(self):
+        """Busy-poll the status register until the ack bit is set or timeout."""
+        deadline = time.monotonic() + self.ctrl_ack_timeout_s
+        while True:
+            status = self.udp_mmio.read(
+                self.addr_csr_udp_engine_100g__connManager_wr_status
+            )
+            if status & 0x1 or time.monotonic() > deadline:
+                return status
 
-        actual = {"ack": ack, "full": full, "connectionId": connectionId}
-        expected = self.connection_manager.write(dst_ipAddr, dst_udpPort, bind=1)
+    def _preflight_ctrl_command(self, dst_ipAddr, dst_udpPort, bind, use_cache=True):
+        """
+        Answer a bind/unbind without hardware if possible (bind cache, fail-fast).
 
-        if expected != actual:
-            print(f"ERROR: expected = {expected}, actual = {actual}")
+        Returns:
+            dict: Response if the command needs no MMIO, else None
+        """
+        if use_cache:
+            cached = self._lookup_bind_cache(dst_ipAddr, dst_udpPort, bind)
+            if cached is not None:
+                return cached
+        return self._admit(dst_ipAddr, dst_udpPort, bind)
+
+    def _finish_ctrl_command(self, dst_ipAddr, dst_udpPort, bind):
+        """Read the response of an acked command, record it and check it against the model."""
+        actual = self._read_ctrl_response()
+        self._record_ctrl_response(dst_ipAddr, dst_udpPort, bind, actual)
+        return self._check_ctrl_response(dst_ipAddr, dst_udpPort, bind, actual)
+
+    def _ctrl_command(self, dst_ipAddr, dst_udpPort, bind, use_cache=True):
+        """Issue a bind/unbind and poll for its response instead of sleeping."""
+        response = self._preflight_ctrl_command(dst_ipAddr, dst_udpPort, bind, use_cache)
+        if response is not None:
+            return response
+
+        self._start_ctrl_command(dst_ipAddr, dst_udpPort, bind)
+        self._wait_ctrl_ack()
+        return self._finish_ctrl_command(dst_ipAddr, dst_udpPort, bind)
+
+    def can_bind(self, dst_ipAddr, dst_udpPort):
+        """
+        Predict from the software model whether a bind would succeed.
 
-        return actual
+        Placement in the RTL is deterministic (an existing entry is returned, else the
+        lowest free way of the bucket is taken), so a bind fails exactly when the
+        entry is absent and all ways of its bucket are valid.
 
-    def unbind_connection(self, dst_ipAddr, dst_udpPort):
+        Returns:
+            bool: True if the bind is predicted to succeed
         """
-        Unbind (remove) a UDP connection from hardware and validate against software model.
+        if self.verifier is not None:
+            self.verifier.flush()  # the model must be current to predict placements
 
-        Sends an unbind request to the hardware connection manager and waits for response.
-        Compares hardware result with software model to detect discrepancies.
+        if self.connection_manager.read_fw(dst_ipAddr, dst_udpPort)["hit"]:
+            return True
+        hash_key = connection_manager_sw._hash_fun_ip_port(dst_ipAddr, dst_udpPort)
+        return len(self.connection_manager.bucket_entries(hash_key)) < self.connection_manager.WAYS
 
-        Args:
-            dst_ipAddr: 32-bit destination IP address
-            dst_udpPort: 16-bit destination UDP port
+    def _admit(self, dst_ipAddr, dst_udpPort, bind):
+        """
+        Preflight a bind against the model in fail-fast mode.
+
+        Without fail_fast this is a no-op, so the bind path stays MMIO only (no
+        verifier flush); the prediction is counted later by tally_bind.
 
         Returns:
-            dict: Hardware response with keys:
-                - 'ack': Acknowledgment bit
-                - 'full': Always 0 for unbind
-                - 'connectionId': Always 0 for unbind
+            dict: Full response if the bind is refused, else None
         """
-        self._write_confirmed(
-            self.addr_csr_udp_engine_100g__connManager_wr_ip_addr, dst_ipAddr
-        )
-        self._write_confirmed(
-            self.addr_csr_udp_engine_100g__connManager_wr_port, dst_udpPort
-        )
-        self._write_confirmed(self.addr_csr_udp_engine_100g__connManager_wr_bind, 0)
-        self._write_confirmed(self.addr_csr_udp_engine_100g__connManager_wr_trigger, 1)
+        if not bind or not self.fail_fast:
+            return None
+        if self.can_bind(dst_ipAddr, dst_udpPort):
+            return None
 
-        time.sleep(0.5)
+        self.admission_stats["predicted_failures"] += 1
+        self.admission_stats["rejected"] += 1
+        return {"ack": 1, "full": 1, "connectionId": 0}
 
-        tmp = self.udp_mmio.read(self.addr_csr_udp_engine_100g__connManager_wr_status)
-        ack = tmp & 0x1
-        full = (tmp >> 1) & 0x1
-        connectionId = self.udp_mmio.read(
-            self.addr_csr_udp_engine_100g__connManager_wr_connectedId
-        )
+    def _lookup_bind_cache(self, dst_ipAddr, dst_udpPort, bind):
+        """
+        Answer a bind of a live entry or an unbind of an unknown entry from the cache.
+
+        Both are no-ops in the RTL (a bind returns the existing connectionId, an unbind
+        matches nothing), so the response is known without touching hardware.
+
+        Returns:
+            dict: Response in the same format as the hardware, or None on a miss
+        """
+        if self.bind_cache is None:
+            return None
+
+        connectionId = self.bind_cache.get((dst_ipAddr, dst_udpPort))
+        if bind and connectionId is not None:
+            self.bind_cache_hits += 1
+            return {"ack": 1, "full": 0, "connectionId": connectionId}
+        if not bind and connectionId is None:
+            self.bind_cache_hits += 1
+            return {"ack": 1, "full": 0, "connectionId": 0}
+
+        self.bind_cache_misses += 1
+        return None
+
+    def _update_bind_cache(self, dst_ipAddr, dst_udpPort, bind, actual):
+        """Keep the cache coherent with the hardware response of a bind/unbind."""
+        if self.bind_cache is None or not actual["ack"]:
+            return
+        if bind:
+            if not actual["full"]:
+                self.bind_cache[(dst_ipAddr, dst_udpPort)] = actual["connectionId"]
+        else:
+            self.bind_cache.pop((dst_ipAddr, dst_udpPort), None)
+
+    def _record_ctrl_response(self, dst_ipAddr, dst_udpPort, bind, actual):
+        """Propagate a hardware bind/unbind response to the cache and journal."""
+        self._update_bind_cache(dst_ipAddr, dst_udpPort, bind, actual)
+        if self.journal is not None and actual["ack"]:
+            self.journal.append(dst_ipAddr, dst_udpPort, bind)
+
+    def invalidate_bind_cache(self):
+        """Drop all cached bindings, e.g. after the hardware table was reset."""
+        if self.bind_cache is not None:
+            self.bind_cache.clear()
+
+    def bind_cache_stats(self):
+        """
+        Returns:
+            dict: Cache statistics with keys 'hits', 'misses' and 'entries'
+        """
+        return {
+            "hits": self.bind_cache_hits,
+            "misses": self.bind_cache_misses,
+            "entries": len(self.bind_cache) if self.bind_cache is not None else 0,
+        }
 
-        actual = {"ack": ack, "full": full, "connectionId": connectionId}
-        expected = self.connection_manager.write(dst_ipAddr, dst_udpPort, bind=0)
+    def _check_ctrl_response(self, dst_ipAddr, dst_udpPort, bind, actual):
+        """
+        Apply the command to the software model and compare with hardware, or hand
+        the response to the verifier when one is installed.
+        """
+        if self.verifier is not None:
+            self.verifier.record(dst_ipAddr, dst_udpPort, bind, actual)
+            return actual
+
+        expected = self.connection_manager.write(dst_ipAddr, dst_udpPort, bind=bind)
+        connection_op_verifier.tally_bind(self.admission_stats, bind, expected, actual)
 
         if expected != actual:
             print(f"ERROR: expected = {expected}, actual = {actual}")
 
         return actual
 
-    def rx_internal_loopback_enable(self):
+    def bind_connection(self, dst_ipAddr, dst_udpPort):
+        """
+        Bind a new UDP connection in hardware and validate against software model.
+
+        Sends a bind request to the hardware connection manager and polls for the
+        response. Compares hardware result with software model to detect discrepancies.
+
+        Args:
+            dst_ipAddr: 32-bit destination IP address
+            dst_udpPort: 16-bit destination UDP port
+
+        Returns:
+            dict: Hardware response with keys:
+                - 'ack': Acknowledgment bit
+                - 'full': Table full indicator
+                - 'connectionId': Assigned connection ID (0 if failed)
+        """
+        return self._ctrl_command(dst_ipAddr, dst_udpPort, 1)
+
+    def unbind_connection(self, dst_ipAddr, dst_udpPort):
+        """
+        Unbind (remove) a UDP connection from hardware and validate against software model.
+
+        Sends an unbind request to the hardware connection manager and polls for the
+        response. Compares hardware result with software model to detect discrepancies.
+
+        Args:
+            dst_ipAddr: 32-bit destination IP address
+            dst_udpPort: 16-bit destination UDP port
+
+        Returns:
+            dict: Hardware response with keys:
+                - 'ack': Acknowledgment bit
+                - 'full': Always 0 for unbind
+                - 'connectionId': Always 0 for unbind
+        """
+        return self._ctrl_command(dst_ipAddr, dst_udpPort, 0)
+
+    # --------------------------------------------------------------------------------------------------
+    # asyncio API
+    # --------------------------------------------------------------------------------------------------
+
+    async def _ctrl_worker(self):
+        """
+        Drain the command queue in order, one command in flight at a time.
+
+        The hardware control channel only accepts a trigger while the connection
+        manager FSM is idle, so commands are never overlapped.
+        """
+        while True:
+            command, args, future = await self._ctrl_queue.get()
+            try:
+                result = await command(*args)
+            except Exception as exc:
+                if not future.cancelled():
+                    future.set_exception(exc)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+            finally:
+                self._ctrl_queue.task_done()
+
+    async def _submit_ctrl(self, command, *args):
+        """Queue a control-plane command and wait for its result."""
+        loop = asyncio.get_running_loop()
+        if self._ctrl_worker_task is None or self._ctrl_worker_task.get_loop() is not loop:
+            self._ctrl_queue = asyncio.Queue()
+            self._ctrl_worker_task = loop.create_task(self._ctrl_worker())
+
+        future = loop.create_future()
+        self._ctrl_queue.put_nowait((command, args, future))
+        return await future
+
+    async def _ctrl_command_async(self, dst_ipAddr, dst_udpPort, bind):
+        """
+        Issue a bind/unbind and sleep on the event loop until the status ack is set.
+
+        The poll interval starts at ctrl_ack_poll_s and doubles up to
+        ctrl_ack_poll_max_s, so a slow ack does not spin a core.
+        """
+        response = self._preflight_ctrl_command(dst_ipAddr, dst_udpPort, bind)
+        if response is not None:
+            return response
+
+        self._start_ctrl_command(dst_ipAddr, dst_udpPort, bind)
+
+        delay = self.ctrl_ack_poll_s
+        deadline = time.monotonic() + self.ctrl_ack_timeout_s
+        while not (
+            self.udp_mmio.read(self.addr_csr_udp_engine_100g__connManager_wr_status)
+            & 0x1
+        ):
+            if time.monotonic() > deadline:
+                print(
+                    f"ERROR: no ack from connection manager for ipAddr = {hex(dst_ipAddr)}, "
+                    f"port = {hex(dst_udpPort)}"
+                )
+                break
+            await asyncio.sleep(delay)
+            delay = min(2 * delay, self.ctrl_ack_poll_max_s)
+
+        return self._finish_ctrl_command(dst_ipAddr, dst_udpPort, bind)
+
+    async def _configure_async(self, src_macAddr, src_ipAddr, src_udpPort, dst_macAddr):
+        self.configure(src_macAddr, src_ipAddr, src_udpPort, dst_macAddr)
+
+    async def bind_connection_async(self, dst_ipAddr, dst_udpPort):
+        """
+        asyncio variant of bind_connection.
+
+        The command is queued behind any in-flight control operations and the
+        coroutine yields while waiting for the hardware ack, so many concurrent
+        binds are issued back-to-back in submission order without blocking the loop.
+        """
+        return await self._submit_ctrl(
+            self._ctrl_command_async, dst_ipAddr, dst_udpPort, 1
+        )
+
+    async def unbind_connection_async(self, dst_ipAddr, dst_udpPort):
+        """asyncio variant of unbind_connection (see bind_connection_async)."""
+        return await self._submit_ctrl(
+            self._ctrl_command_async, dst_ipAddr, dst_udpPort, 0
+        )
+
+    async def configure_async(self, src_macAddr, src_ipAddr, src_udpPort, dst_macAddr):
+        """
+        asyncio variant of configure, ordered with respect to queued bind/unbinds.
+        """
+        return await self._submit_ctrl(
+            self._configure_async, src_macAddr, src_ipAddr, src_udpPort, dst_macAddr
+        )
+
+    async def aclose(self):
+        """Wait for all queued control commands to finish and stop the worker."""
+        if self._ctrl_worker_task is None:
+            return
+        await self._ctrl_queue.join()
+        self._ctrl_worker_task.cancel()
+        try:
+            await self._ctrl_worker_task
+        except asyncio.CancelledError:
+            pass
+        self._ctrl_worker_task = None
+        self._ctrl_queue = None
+
+    # --------------------------------------------------------------------------------------------------
+    # Pipelined batch commands
+    # --------------------------------------------------------------------------------------------------
+
+    def ctrl_batch(self, commands):
+        """
+        Issue bind/unbind commands through the batch FIFO of the control channel.
+
+        The connection manager overlaps commands to different hash indexes, so
+        commands are pushed (two writes each) for as long as the command FIFO full
+        bit in batch_status stays clear, and responses are only collected once it is
+        set or every command has been pushed. The hardware stops draining the command
+        FIFO while its response FIFO has no room, so the full bit also covers
+        responses that have not been popped yet. Same-index commands are stalled in
+        hardware, never reordered: responses come back in command order and match the
+        software model applied sequentially. The bind cache and fail-fast admission are
+        bypassed, every command reaches the hardware.
+
+        Args:
+            commands: Iterable of (dst_ipAddr, dst_udpPort, bind)
+
+        Returns:
+            list: Responses in command order, same format as bind_connection()
+
+        Raises:
+            TimeoutError: If a response does not arrive within ctrl_ack_timeout_s
+        """
+        read = self.udp_mmio.read
+        write = self.udp_mmio.write
+        addr_ipAddr = self.addr_csr_udp_engine_100g__connManager_batch_ipAddr
+        addr_push = self.addr_csr_udp_engine_100g__connManager_batch_push
+        addr_resp = self.addr_csr_udp_engine_100g__connManager_batch_resp
+        addr_pop = self.addr_csr_udp_engine_100g__connManager_batch_pop
+        addr_status = self.addr_csr_udp_engine_100g__connManager_batch_status
+
+        pending = collections.deque()
+        responses = []
+
+        def collect():
+            dst_ipAddr, dst_udpPort, bind = pending.popleft()
+            deadline = time.monotonic() + self.ctrl_ack_timeout_s
+            resp = read(addr_resp)
+            while not (resp >> 31):
+                if time.monotonic() > deadline:
+                    raise TimeoutError("connection manager batch response did not arrive")
+                resp = read(addr_resp)
+            write(addr_pop, 1)
+
+            actual = {
+                "ack": (resp >> 18) & 0x1,
+                "full": (resp >> 19) & 0x1,
+                "connectionId": resp & 0x3FFFF,
+            }
+            self._record_ctrl_response(dst_ipAddr, dst_udpPort, bind, actual)
+            responses.append(self._check_ctrl_response(dst_ipAddr, dst_udpPort, bind, actual))
+
+        for dst_ipAddr, dst_udpPort, bind in commands:
+            while pending and (read(addr_status) >> 31):
+                collect()
+            write(addr_ipAddr, dst_ipAddr)
+            write(addr_push, (0x10000 if bind else 0) | (dst_udpPort & 0xFFFF))
+            pending.append((dst_ipAddr, dst_udpPort, bind))
+
+        while pending:
+            collect()
+
+        return responses
+
+    def bind_connections(self, entries):
+        """
+        Bind many (dst_ipAddr, dst_udpPort) pairs through the batch interface.
+
+        Returns:
+            list: Responses in entry order
+        """
+        return self.ctrl_batch((ipAddr, udpPort, 1) for ipAddr, udpPort in entries)
+
+    def unbind_connections(self, entries):
+        """
+        Unbind many (dst_ipAddr, dst_udpPort) pairs through the batch interface.
+
+        Returns:
+            list: Responses in entry order
+        """
+        return self.ctrl_batch((ipAddr, udpPort, 0) for ipAddr, udpPort in entries)
+
+    # --------------------------------------------------------------------------------------------------
+    # DMA bulk commands
+    # --------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def pack_ctrl_commands(entries, bind):
+        """
+        Pack (ipAddr, udpPort) entries into bulk control stream words.
+
+        Args:
+            entries: (N, 2) integer array, or a structured array with 'ipAddr' and
+                     'udpPort' fields
+            bind:    1 to bind, 0 to unbind every entry
+
+        Returns:
+            np.ndarray: uint64 words {15'b0, bind, udpPort, ipAddr}
+        """
+        entries = np.asarray(entries)
+        if entries.dtype.names:
+            ipAddr, udpPort = entries["ipAddr"], entries["udpPort"]
+        else:
+            ipAddr, udpPort = entries[:, 0], entries[:, 1]
+
+        words = ipAddr.astype(np.uint64) & np.uint64(0xFFFFFFFF)
+        words |= (udpPort.astype(np.uint64) & np.uint64(0xFFFF)) << np.uint64(32)
+        if bind:
+            words |= np.uint64(1 << 48)
+        return words
+
+    def _bulk_ctrl(self, entries, bind):
+        """
+        Stream packed commands through ctrl_dma and collect the responses.
+
+        Commands and responses travel as one MM2S / S2MM transfer per chunk of
+        ctrl_dma_chunk_entries, so the hardware sees a back-to-back command stream
+        and the per-command cost is the pipeline rate of the control channel. The
+        responses are then applied to the bind cache, journal and software model
+        (or verifier) in command order.
+
+        Returns:
+            dict: 'ack', 'full' and 'connectionId' arrays in entry order
+        """
+        if self.ctrl_dma is None:
+            raise RuntimeError("bulk control path needs a ctrl_dma (and ENABLE_CTRL_DMA=1)")
+
+        words = self.pack_ctrl_commands(entries, bind)
+        count = len(words)
+        responses = np.empty(count, dtype=np.uint32)
+
+        chunk = min(count, self.ctrl_dma_chunk_entries)
+        if chunk:
+            cmd_buf = allocate(shape=(chunk,), dtype=np.uint64)
+            resp_buf = allocate(shape=(chunk,), dtype=np.uint32)
+            try:
+                for start in range(0, count, chunk):
+                    n = min(chunk, count - start)
+                    cmd_buf[:n] = words[start : start + n]
+                    self.ctrl_dma.recvchannel.transfer(resp_buf, nbytes=4 * n)
+                    self.ctrl_dma.sendchannel.transfer(cmd_buf, nbytes=8 * n)
+                    self.ctrl_dma.sendchannel.wait()
+                    self.ctrl_dma.recvchannel.wait()
+                    responses[start : start + n] = resp_buf[:n]
+            finally:
+                cmd_buf.freebuffer()
+                resp_buf.freebuffer()
+
+        result = {
+            "ack": (responses >> 18) & 0x1,
+            "full": (responses >> 19) & 0x1,
+            "connectionId": responses & 0x3FFFF,
+        }
+
+        ipAddrs = (words & np.uint64(0xFFFFFFFF)).tolist()
+        udpPorts = ((words >> np.uint64(32)) & np.uint64(0xFFFF)).tolist()
+        for ipAddr, udpPort, ack, full, connectionId in zip(
+            ipAddrs,
+            udpPorts,
+            result["ack"].tolist(),
+            result["full"].tolist(),
+            result["connectionId"].tolist(),
+        ):
+            actual = {"ack": ack, "full": full, "connectionId": connectionId}
+            self._record_ctrl_response(ipAddr, udpPort, bind, actual)
+            self._check_ctrl_response(ipAddr, udpPort, bind, actual)
+
+        return result
+
+    def bulk_bind(self, entries):
+        """
+        Bind an array of (ipAddr, udpPort) entries over the DMA control stream.
+
+        Args:
+            entries: (N, 2) integer array or structured array with 'ipAddr' and
+                     'udpPort' fields (see pack_ctrl_commands)
+
+        Returns:
+            dict: 'ack', 'full' and 'connectionId' arrays in entry order
+        """
+        return self._bulk_ctrl(entries, 1)
+
+    def bulk_unbind(self, entries):
+        """
+        Unbind an array of (ipAddr, udpPort) entries over the DMA control stream.
+
+        Returns:
+            dict: 'ack', 'full' and 'connectionId' arrays in entry order
+        """
+        return self._bulk_ctrl(entries, 0)
+
+    # --------------------------------------------------------------------------------------------------
+    # Table dump / reconciliation
+    # --------------------------------------------------------------------------------------------------
+
+    def iter_table(self, start_connectionId=0):
+        """
+        Iterate the valid entries of the hardware table through the dump window.
+
+        Each step is one trigger write, a status poll (which also carries the way
+        and udpPort) and one ipAddr read; the hardware skips empty slots itself and
+        auto-advances its cursor, so the cost is per valid entry, not per slot.
+
+        Args:
+            start_connectionId: First slot to examine ({way, hash_index})
+
+        Yields:
+            tuple: (connectionId, ipAddr, udpPort) in hash-index-major order
+        """
+        read = self.udp_mmio.read
+        write = self.udp_mmio.write
+        addr_status = self.addr_csr_udp_engine_100g__connManager_dump_status
+        addr_ipAddr = self.addr_csr_udp_engine_100g__connManager_dump_ipAddr
+
+        write(self.addr_csr_udp_engine_100g__connManager_dump_cursor, start_connectionId)
+        write(self.addr_csr_udp_engine_100g__connManager_dump_seek, 1)
+
+        while True:
+            deadline = time.monotonic() + self.dump_timeout_s
+            status = read(addr_status)
+            while not (status >> 31):
+                if time.monotonic() > deadline:
+                    raise TimeoutError("connection table dump did not complete")
+                status = read(addr_status)
+
+            if (status >> 30) & 0x1:
+                return
+
+            udpPort = status & 0xFFFF
+            way = (status >> 16) & 0x3FFF
+            ipAddr = read(addr_ipAddr)
+            hash_key = connection_manager_sw._hash_fun_ip_port(ipAddr, udpPort)
+            yield (way << 16) | hash_key, ipAddr, udpPort
+
+            write(self.addr_csr_udp_engine_100g__connManager_dump_next, 1)
+
+    def dump_table(self):
+        """
+        Read back every valid entry of the hardware table.
+
+        Returns:
+            list: (connectionId, ipAddr, udpPort) tuples
+        """
+        return list(self.iter_table())
+
+    def reconcile(self, repair=True):
+        """
+        Compare the hardware table with the software model and optionally repair it.
+
+        The hardware table is dumped once into a mirror model; every hash index where
+        the (connectionId, ipAddr, udpPort) entries differ is re-synchronized with
+        repair_buckets().
+
+        Returns:
+            dict: 'entries' (valid hardware entries), 'diverged' (hash indexes that
+                  differed) and 'repaired' (rebind responses, empty if repair=False)
+        """
+        if self.verifier is not None:
+            self.verifier.flush()
+
+        mirror = connection_manager_sw(
+            WAYS=self.connection_manager.WAYS, HASH_WIDTH=self.connection_manager.HASH_WIDTH
+        )
+        hardware = set(self.iter_table())
+        mirror.restore_bindings(hardware)
+
+        model = {
+            (connectionId, ipAddr, udpPort)
+            for (ipAddr, udpPort), connectionId in self.connection_manager.live_bindings().items()
+        }
+        diverged = sorted({connectionId & 0xFFFF for connectionId, _, _ in hardware ^ model})
+
+        repaired = self.repair_buckets(diverged, mirror.bucket_entries) if repair else {}
+        if repair and self.bind_cache is not None:
+            self.bind_cache = self.connection_manager.live_bindings()
+        return {
+            "entries": len(hardware),
+            "diverged": diverged,
+            "repaired": repaired,
+        }
+
+    def repair_buckets(self, hash_keys, lookup_bucket):
+        """
+        Re-synchronize diverged hash indexes between hardware and the software model.
+
+        Every entry known to either side at the index is unbound, then the model's
+        entries are bound again in way order. Both sides end up with identical
+        buckets (connectionIds may move to lower ways if the bucket had holes).
+
+        Args:
+            hash_keys:      Hash indexes to repair (e.g. from connection_table_merkle)
+            lookup_bucket:  Callable lookup_bucket(hash_key) -> list of (way, ipAddr,
+                            udpPort) valid entries in hardware at that index
+
+        Returns:
+            dict: {(ipAddr, udpPort): response} of the rebinds
+        """
+        if self.verifier is not None:
+            self.verifier.flush()
+
+        rebinds = {}
+        for hash_key in hash_keys:
+            model_entries = self.connection_manager.bucket_entries(hash_key)
+            stale = {(ipAddr, udpPort) for _, ipAddr, udpPort in lookup_bucket(hash_key)}
+            stale.update((ipAddr, udpPort) for _, ipAddr, udpPort in model_entries)
+
+            for ipAddr, udpPort in stale:
+                self._ctrl_command(ipAddr, udpPort, 0, use_cache=False)
+            for _, ipAddr, udpPort in model_entries:
+                rebinds[(ipAddr, udpPort)] = self._ctrl_command(ipAddr, udpPort, 1, use_cache=False)
+
+        if self.verifier is not None:
+            self.verifier.flush()
+        return rebinds
+
+    # --------------------------------------------------------------------------------------------------
+    # Bulk load
+    # --------------------------------------------------------------------------------------------------
+
+    # Binary connection file record: 32-bit IP address, 16-bit UDP port (little-endian)
+    connection_record_format = "<IH"
+
+    @staticmethod
+    def _parse_ipAddr(field):
+        """Parse a dotted-quad or integer (decimal / 0x-hex) IP address."""
+        field = field.strip()
+        if "." in field:
+            return int.from_bytes(socket.inet_aton(field), "big")
+        return int(field, 0)
+
+    @classmethod
+    def iter_connection_file(cls, path, fmt=None, chunk_records=4096):
+        """
+        Stream (ipAddr, udpPort) pairs from a connection file.
+
+        Args:
+            path:           File to read
+            fmt:            'csv' or 'bin'; inferred from the .csv suffix when None
+            chunk_records:  Records read per chunk for binary files
+
+        CSV files hold one 'ip,port' pair per row (dotted-quad or integer IPs);
+        blank rows, '#' comments and a non-numeric header row are skipped. Binary
+        files are a flat array of connection_record_format records.
+        """
+        if fmt is None:
+            fmt = "csv" if str(path).lower().endswith(".csv") else "bin"
+
+        if fmt == "csv":
+            with open(path, newline="") as f:
+                for row in csv.reader(f):
+                    if not row or row[0].lstrip().startswith("#"):
+                        continue
+                    try:
+                        yield cls._parse_ipAddr(row[0]), int(row[1], 0)
+                    except ValueError:
+                        continue  # header row
+        else:
+            record = struct.Struct(cls.connection_record_format)
+            with open(path, "rb") as f:
+                while True:
+                    chunk = f.read(record.size * chunk_records)
+                    if not chunk:
+                        break
+                    usable = len(chunk) - len(chunk) % record.size
+                    yield from record.iter_unpack(chunk[:usable])
+
+    def load_connections(
+        self, path, fmt=None, progress=None, progress_interval=10000, verify_every=64
+    ):
+        """
+        Bulk-bind every (ip, port) of a connection file, e.g. after an FPGA reload.
+
+        Placements are predicted with the software model before anything is sent:
+        entries that are already bound or that the model predicts to land in a full
+        index are resolved without MMIO. The remaining binds use the minimal register
+        sequence (ip, port, trigger, status poll); the bind register is written once
+        for the whole load.
+
+        Whenever the hardware disagrees with the prediction the model follows the
+        hardware: a bind that failed (full or no ack) is rolled back, a bind placed at
+        another connectionId is moved to that slot with restore_bindings(). The bind
+        cache and journal record the same hardware response.
+
+        Only the connectionId of every verify_every-th successful bind is read back;
+        the others are assumed to sit at the predicted slot. A bind placed elsewhere
+        between two readbacks is neither corrected nor reported. It stays bound on
+        both sides, so reconcile() finds and repairs the bucket. Pass verify_every=1
+        to check every bind (one more register read each).
+
+        Args:
+            path:               CSV or binary connection file (see iter_connection_file)
+            fmt:                'csv' or 'bin', inferred from the suffix when None
+            progress:           Optional callable receiving the running report dict
+            progress_interval:  Number of entries between progress callbacks
+            verify_every:       Read back the connectionId of every n-th successful
+                                bind (1: all of them, None: never)
+
+        Returns:
+            dict: Report with keys:
+                - 'total':          Entries read from the file
+                - 'bound':          New bindings written to hardware
+                - 'existing':       Entries that were already bound
+                - 'failed':         Entries that could not be bound
+                - 'failures':       List of dicts with 'ipAddr', 'udpPort', 'predicted',
+                                    'actual' ('actual' is None if hardware was skipped)
+                - 'readbacks':      Successful binds whose connectionId was read back
+                - 'mismatches':     Binds the hardware made at another connectionId than
+                                    predicted (counted in 'bound'), same dict format
+                - 'elapsed_s':      Wall time of the load
+                - 'binds_per_sec':  New bindings written to hardware per second
+        """
+        if self.verifier is not None:
+            self.verifier.flush()  # the model must be current to predict placements
+
+        report = {
+            "total": 0,
+            "bound": 0,
+            "existing": 0,
+            "failed": 0,
+            "failures": [],
+            "readbacks": 0,
+            "mismatches": [],
+            "elapsed_s": 0.0,
+            "binds_per_sec": 0.0,
+        }
+
+        mmio_write = self.udp_mmio.write
+        mmio_read = self.udp_mmio.read
+        addr_ip = self.addr_csr_udp_engine_100g__connManager_wr_ip_addr
+        addr_port = self.addr_csr_udp_engine_100g__connManager_wr_port
+        addr_trigger = self.addr_csr_udp_engine_100g__connManager_wr_trigger
+        addr_connectionId = self.addr_csr_udp_engine_100g__connManager_wr_connectedId
+
+        self._write_confirmed(self.addr_csr_udp_engine_100g__connManager_wr_bind, 1)
+
+        start = time.perf_counter()
+        for ipAddr, udpPort in self.iter_connection_file(path, fmt):
+            report["total"] += 1
+
+            existing = self.connection_manager.read_fw(ipAddr, udpPort)
+            if existing["hit"]:
+                report["existing"] += 1
+                self._update_bind_cache(
+                    ipAddr,
+                    udpPort,
+                    1,
+                    {"ack": 1, "full": 0, "connectionId": existing["connectionId"]},
+                )
+            else:
+                predicted = self.connection_manager.write(ipAddr, udpPort, bind=1)
+
+                if predicted["full"]:
+                    self.admission_stats["predicted_failures"] += 1
+                    self.admission_stats["rejected"] += 1
+                    report["failed"] += 1
+                    report["failures"].append(
+                        {
+                            "ipAddr": ipAddr,
+                            "udpPort": udpPort,
+                            "predicted": predicted,
+                            "actual": None,
+                        }
+                    )
+                else:
+                    mmio_write(addr_ip, ipAddr)
+                    mmio_write(addr_port, udpPort)
+                    mmio_write(addr_trigger, 1)
+                    status = self._wait_ctrl_ack()
+
+                    if (status & 0x3) == 0x1:
+                        actual = dict(predicted)
+                        report["bound"] += 1
+                        if verify_every and report["bound"] % verify_every == 0:
+                            actual["connectionId"] = mmio_read(addr_connectionId)
+                            report["readbacks"] += 1
+                    else:
+                        actual = self._read_ctrl_response()
+
+                    if actual != predicted:
+                        # the model follows the hardware: drop the predicted slot and,
+                        # if the bind did land, place it where the hardware put it
+                        self.connection_manager.write(ipAddr, udpPort, bind=0)
+                        connection_op_verifier.tally_bind(
+                            self.admission_stats, 1, predicted, actual
+                        )
+                        record = {
+                            "ipAddr": ipAddr,
+                            "udpPort": udpPort,
+                            "predicted": predicted,
+                            "actual": actual,
+                        }
+                        if actual["ack"] and not actual["full"]:
+                            self.connection_manager.restore_bindings(
+                                [(actual["connectionId"], ipAddr, udpPort)]
+                            )
+                            report["mismatches"].append(record)
+                        else:
+                            report["failed"] += 1
+                            report["failures"].append(record)
+                    self._record_ctrl_response(ipAddr, udpPort, 1, actual)
+
+            if progress is not None and report["total"] % progress_interval == 0:
+                elapsed = time.perf_counter() - start
+                report["elapsed_s"] = elapsed
+                report["binds_per_sec"] = report["bound"] / elapsed if elapsed else 0.0
+                progress(report)
+
+        elapsed = time.perf_counter() - start
+        report["elapsed_s"] = elapsed
+        report["binds_per_sec"] = report["bound"] / elapsed if elapsed else 0.0
+        return report
+
+    def rx_internal_loopback_enable(self):
         old = self.udp_mmio.read(self.addr_csr_udp_engine_100g__ctrl)
         old |= 1 << 3
         self._write_confirmed(self.addr_csr_udp_engine_100g__ctrl, old)
@@ -455,11 +2207,415 @@ class udp_engine_controller:
         self._write_confirmed(self.addr_csr_udp_engine_100g__ctrl, old)
 
 
+# ======================================================================================================
+# SHARDED CONTROLLER - Multi-Engine Consistent Hashing
+# ======================================================================================================
+
+
+class udp_engine_shard_controller:
+    """
+    Spread connections over several udp_engine_controller instances (IP blocks or boards).
+
+    Engines are placed on a consistent-hash ring with vnodes points each. The key space
+    is cut into a fixed number of slots whose owner is precomputed from the ring, so
+    routing a connection is one multiply, shift and table lookup. Adding or removing
+    an engine only changes the owner of the slots that fall into its ring arcs, and
+    only the bindings of those slots are moved.
+
+    The slot of a connection is taken from a multiplicative hash of (ipAddr, udpPort),
+    independent of the XOR hash the engines use for bucket selection, so every engine
+    still sees uniformly spread buckets.
+
+    Attributes:
+        engines (dict):         {name: udp_engine_controller}
+        vnodes:                 Ring points per engine
+        slot_owner (list):      Engine name owning each slot
+        slot_bindings (list):   Per slot, the set of (ipAddr, udpPort) bound through it
+        stranded (dict):        {(ipAddr, udpPort): engine name} of bindings whose move
+                                to a new owner failed and that are still served by
+                                their previous engine
+    """
+
+    SLOT_BITS = 12
+
+    def __init__(self, engines=None, vnodes=128):
+        self.engines = {}
+        self.vnodes = vnodes
+        self.num_slots = 1 << self.SLOT_BITS
+        self.slot_owner = [None] * self.num_slots
+        self.slot_bindings = [set() for _ in range(self.num_slots)]
+        self.stranded = {}
+        self._ring = []
+        for name, controller in (engines or {}).items():
+            self.engines[name] = controller
+        self._rebuild_slots()
+
+    @classmethod
+    def _slot(cls, ipAddr, udpPort):
+        key = ((ipAddr & 0xFFFFFFFF) << 16) | (udpPort & 0xFFFF)
+        return ((key * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> (64 - cls.SLOT_BITS)
+
+    @staticmethod
+    def _ring_point(name, replica):
+        digest = hashlib.blake2b(f"{name}#{replica}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    def _rebuild_slots(self):
+        """Recompute the ring and the owner of every slot; returns the previous owners."""
+        previous = self.slot_owner
+        self._ring = sorted(
+            (self._ring_point(name, r), name) for name in self.engines for r in range(self.vnodes)
+        )
+        if not self._ring:
+            self.slot_owner = [None] * self.num_slots
+            return previous
+
+        points = [point for point, _ in self._ring]
+        stride = 1 << (64 - self.SLOT_BITS)
+        owner = []
+        for slot in range(self.num_slots):
+            i = bisect.bisect_left(points, slot * stride)
+            owner.append(self._ring[i % len(self._ring)][1])
+        self.slot_owner = owner
+        return previous
+
+    def engine_for(self, dst_ipAddr, dst_udpPort):
+        """Name of the engine a connection is placed on."""
+        return self.slot_owner[self._slot(dst_ipAddr, dst_udpPort)]
+
+    def _ctrl_command(self, dst_ipAddr, dst_udpPort, bind):
+        key = (dst_ipAddr, dst_udpPort)
+        slot = self._slot(dst_ipAddr, dst_udpPort)
+        name = self.slot_owner[slot]
+        if name is None:
+            raise RuntimeError("no engines registered with the shard controller")
+
+        if not bind and key in self.stranded:
+            name = self.stranded.pop(key)  # never moved, unbind where it still lives
+        engine = self.engines[name]
+        if bind:
+            response = dict(engine.bind_connection(dst_ipAddr, dst_udpPort))
+        else:
+            response = dict(engine.unbind_connection(dst_ipAddr, dst_udpPort))
+        if response["ack"] and not response["full"]:
+            if bind:
+                if key in self.stranded:  # placed on the owner now, drop the old copy
+                    self.engines[self.stranded.pop(key)].unbind_connection(dst_ipAddr, dst_udpPort)
+                self.slot_bindings[slot].add((dst_ipAddr, dst_udpPort))
+            else:
+                self.slot_bindings[slot].discard((dst_ipAddr, dst_udpPort))
+        response["engine"] = name
+        return response
+
+    def bind_connection(self, dst_ipAddr, dst_udpPort):
+        """
+        Bind a connection on the engine that owns it.
+
+        Returns:
+            dict: Engine response plus 'engine' (the name it was placed on); the
+                  connectionId is local to that engine
+        """
+        return self._ctrl_command(dst_ipAddr, dst_udpPort, 1)
+
+    def unbind_connection(self, dst_ipAddr, dst_udpPort):
+        """Unbind a connection from the engine that owns it."""
+        return self._ctrl_command(dst_ipAddr, dst_udpPort, 0)
+
+    def unbind_connections(self, entries):
+        """
+        Unbind many connections, as one batch per engine.
+
+        Returns:
+            list: Responses in entry order, each with 'engine' added
+        """
+        entries = list(entries)
+        groups = {}
+        for index, key in enumerate(entries):
+            name = self.stranded.pop(key, None) or self.engine_for(*key)
+            if name is None:
+                raise RuntimeError("no engines registered with the shard controller")
+            groups.setdefault(name, []).append((index, key))
+
+        responses = [None] * len(entries)
+        for name, items in groups.items():
+            batch = self.engines[name].unbind_connections(key for _, key in items)
+            for (index, key), response in zip(items, batch):
+                response = dict(response)
+                if response["ack"]:
+                    self.slot_bindings[self._slot(*key)].discard(key)
+                response["engine"] = name
+                responses[index] = response
+        return responses
+
+    def lookup(self, dst_ipAddr, dst_udpPort):
+        """
+        Find a bound connection.
+
+        Returns:
+            tuple: (engine name, connectionId), or None if not bound
+        """
+        name = self.stranded.get((dst_ipAddr, dst_udpPort))
+        if name is None:
+            name = self.engine_for(dst_ipAddr, dst_udpPort)
+        if name is None:
+            return None
+        hit = self.engines[name].connection_manager.read_fw(dst_ipAddr, dst_udpPort)
+        return (name, hit["connectionId"]) if hit["hit"] else None
+
+    def _rebalance(self, previous, unbind_old=True):
+        """
+        Move the bindings of every slot whose owner changed.
+
+        Each binding is made on the new owner first and only unbound from the old
+        one after a good ack. A binding that cannot be placed on the new owner
+        stays on the old engine and is listed in stranded; a previously stranded
+        binding is retried whenever its slot changes owner again.
+
+        Returns:
+            dict: 'moved' count and 'failed' list of (ipAddr, udpPort, response)
+        """
+        report = {"moved": 0, "failed": []}
+        for slot, (old, new) in enumerate(zip(previous, self.slot_owner)):
+            if old == new or not self.slot_bindings[slot]:
+                continue
+            for key in list(self.slot_bindings[slot]):
+                ipAddr, udpPort = key
+                source = self.stranded.pop(key, old)
+                if source == new:
+                    continue  # stranded on the engine that owns the slot again
+                if new is None:
+                    if unbind_old and source in self.engines:
+                        self.engines[source].unbind_connection(ipAddr, udpPort)
+                    self.slot_bindings[slot].discard(key)
+                    continue
+                response = self.engines[new].bind_connection(ipAddr, udpPort)
+                if response["ack"] and not response["full"]:
+                    if unbind_old and source in self.engines:
+                        self.engines[source].unbind_connection(ipAddr, udpPort)
+                    report["moved"] += 1
+                else:
+                    self.stranded[key] = source
+                    report["failed"].append((ipAddr, udpPort, response))
+        return report
+
+    def add_engine(self, name, controller):
+        """
+        Register an engine and move the bindings of the slots it takes over.
+
+        Returns:
+            dict: Rebalance report ('moved', 'failed')
+        """
+        self.engines[name] = controller
+        return self._rebalance(self._rebuild_slots())
+
+    def remove_engine(self, name, unbind=True):
+        """
+        Drop an engine and re-place its bindings on the remaining ones.
+
+        Args:
+            name:   Engine to remove
+            unbind: Unbind the moved entries on the removed engine (False if it is
+                    no longer reachable)
+
+        Returns:
+            dict: Rebalance report ('moved', 'failed')
+        """
+        previous = self.slot_owner
+        controller = self.engines.pop(name)
+        self._rebuild_slots()
+        if unbind:
+            self.engines[name] = controller  # still reachable while its entries move
+        try:
+            return self._rebalance(previous, unbind_old=unbind)
+        finally:
+            self.engines.pop(name, None)
+            # bindings that could not leave the removed engine are gone with it
+            for key in [key for key, owner in self.stranded.items() if owner == name]:
+                del self.stranded[key]
+                self.slot_bindings[self._slot(*key)].discard(key)
+
+    def stats(self):
+        """Number of bindings placed on each engine."""
+        counts = {name: 0 for name in self.engines}
+        for slot, owner in enumerate(self.slot_owner):
+            if owner is not None:
+                counts[owner] += len(self.slot_bindings[slot])
+        return counts
+
+
+# ======================================================================================================
+# CONNECTION LEASES - TTL Expiry Timer Wheel
+# ======================================================================================================
+
+
+class connection_lease_manager:
+    """
+    Optional lease layer over udp_engine_controller that unbinds idle connections.
+
+    Every binding made through the manager holds a lease of ttl_s seconds, refreshed by
+    touch() (API call) or touch_many() (observed traffic). Expiry uses a hashed timer
+    wheel: a lease sits in the slot of its deadline tick, and a refresh only moves the
+    deadline in the lease table. When a slot comes due, refreshed leases are re-slotted
+    and expired ones are unbound as one batch, so a tick costs O(1) plus the leases
+    that actually come due, independent of the total number of leases.
+
+    Attributes:
+        controller:     udp_engine_controller issuing the binds/unbinds
+        ttl_s:          Default lease duration in seconds
+        tick_s:         Wheel resolution in seconds
+        wheel (list):   Slots of (ipAddr, udpPort) keys, indexed by deadline tick
+        leases (dict):  {(ipAddr, udpPort): deadline tick}
+        expired:        Total number of leases expired so far
+    """
+
+    def __init__(self, controller, ttl_s=60.0, tick_s=1.0, wheel_slots=None, clock=time.monotonic):
+        self.controller = controller
+        self.ttl_s = ttl_s
+        self.tick_s = tick_s
+        self.clock = clock
+        if wheel_slots is None:
+            wheel_slots = max(1, int(ttl_s / tick_s)) + 1
+        self.wheel = [set() for _ in range(wheel_slots)]
+        self.leases = {}
+        self.expired = 0
+        self.current_tick = self._now_tick()
+
+    def __len__(self):
+        return len(self.leases)
+
+    def __contains__(self, key):
+        return key in self.leases
+
+    def _now_tick(self):
+        return int(self.clock() / self.tick_s)
+
+    def _deadline(self, ttl_s):
+        ttl_s = self.ttl_s if ttl_s is None else ttl_s
+        return self.current_tick + max(1, -(-ttl_s // self.tick_s))
+
+    def _schedule(self, key, deadline):
+        self.leases[key] = deadline
+        self.wheel[int(deadline) % len(self.wheel)].add(key)
+
+    def bind(self, dst_ipAddr, dst_udpPort, ttl_s=None):
+        """
+        Bind a connection and start (or refresh) its lease.
+
+        Returns:
+            dict: Response from the controller; no lease is taken if the bind failed
+        """
+        response = self.controller.bind_connection(dst_ipAddr, dst_udpPort)
+        if response["ack"] and not response["full"]:
+            self._schedule((dst_ipAddr, dst_udpPort), self._deadline(ttl_s))
+        return response
+
+    def unbind(self, dst_ipAddr, dst_udpPort):
+        """Unbind a connection and drop its lease."""
+        self.leases.pop((dst_ipAddr, dst_udpPort), None)
+        return self.controller.unbind_connection(dst_ipAddr, dst_udpPort)
+
+    def touch(self, dst_ipAddr, dst_udpPort, ttl_s=None):
+        """
+        Extend a lease; O(1), the wheel slot is only corrected when it comes due.
+
+        Returns:
+            bool: False if the connection holds no lease
+        """
+        key = (dst_ipAddr, dst_udpPort)
+        if key not in self.leases:
+            return False
+        deadline = self._deadline(ttl_s)
+        if deadline > self.leases[key]:
+            self.leases[key] = deadline
+        return True
+
+    def touch_many(self, keys, ttl_s=None):
+        """Extend the leases of all (ipAddr, udpPort) keys seen in traffic."""
+        deadline = self._deadline(ttl_s)
+        leases = self.leases
+        for key in keys:
+            if leases.get(key, deadline) < deadline:
+                leases[key] = deadline
+
+    def advance(self, now=None):
+        """
+        Process every tick up to now and unbind the expired connections.
+
+        At most one turn of the wheel is walked, so a long idle gap or a clock jump
+        costs no more than a full sweep. The expired connections are unbound as one
+        batch through the controller's batch FIFO.
+
+        Args:
+            now: Clock value to advance to (defaults to clock())
+
+        Returns:
+            list: (ipAddr, udpPort) keys that were expired
+        """
+        target = self._now_tick() if now is None else int(now / self.tick_s)
+        num_slots = len(self.wheel)
+        leases = self.leases
+        due = []
+
+        # every lease sits in the slot of a deadline at or before its own, so walking
+        # the slots of (current_tick, target] (all of them after a full turn) and
+        # comparing against target finds every lease due by then
+        first = self.current_tick + 1
+        for tick in range(first, first + min(target - self.current_tick, num_slots)):
+            slot = tick % num_slots
+            entries = self.wheel[slot]
+            if not entries:
+                continue
+            self.wheel[slot] = set()
+            for key in entries:
+                deadline = leases.get(key)
+                if deadline is None:
+                    continue
+                if deadline <= target:
+                    del leases[key]
+                    due.append(key)
+                else:
+                    self.wheel[int(deadline) % num_slots].add(key)
+        self.current_tick = max(self.current_tick, target)
+
+        if due:
+            self.controller.unbind_connections(due)
+        self.expired += len(due)
+        return due
+
+
 # ======================================================================================================
 # UDP MODEL - Packet Generation and Processing
 # ======================================================================================================
 
 
+class _lazy_test_vector(collections.abc.Mapping):
+    """
+    Read-only test-vector dict whose expensive entries are built on first access.
+
+    values holds the entries known up front; factories maps the remaining keys to
+    zero-argument callables, each called at most once.
+    """
+
+    def __init__(self, values, factories):
+        self._values = dict(values)
+        self._factories = dict(factories)
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            self._values[key] = self._factories.pop(key)()
+        return self._values[key]
+
+    def __iter__(self):
+        yield from self._values
+        yield from list(self._factories)
+
+    def __len__(self):
+        return len(self._values) + len(self._factories)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._values!r}, pending={list(self._factories)!r})"
+
+
 class udp_model:
     """
     Software model for UDP packet generation and encapsulation.
@@ -485,6 +2641,22 @@ class udp_model:
         MY_CONFIG_SRC_MAC: Source MAC address
         MY_CONFIG_SRC_IP: Source IP address
         MY_CONFIG_SRC_PORT: Source UDP port
+        header_cache: {connectionId: (slot_generation, 42-byte header template)};
+                      entries go stale when the slot is unbound/overwritten and the
+                      whole cache is dropped when any MY_CONFIG_* field is assigned
+        payload_mode: Payload content, one of PAYLOAD_MODES:
+                      'random'  - fresh random bytes per packet (default)
+                      'zero'    - all zero bytes
+                      'counter' - byte i of the payload is i & 0xFF
+                      'pool'    - random slice of a pre-generated random pool of
+                                  payload_pool_bytes (cheap, content still varies)
+        rng: np.random.Generator of the batch paths; the scalar paths use a
+             random.Random seeded from the same SeedSequence. Pass a seed, a
+             SeedSequence or a Generator to make a model reproducible; spawn() and
+             stream() derive statistically independent models for parallel workers
+        ip_checksum:  Fill in the IPv4 header checksum (default False: 0, like the RTL)
+        udp_checksum: Fill in the UDP checksum over the pseudo-header, UDP header and
+                      payload (default False: 0, like the RTL)
     """
 
     ETHTYPE_IP = 0x0800
@@ -499,19 +2671,185 @@ class udp_model:
     IP_UDP_FRAG_OFFSET = 0
     IP_UDP_TTL = 64
 
-    def __init__(
-        self,
-        connection_manager,
-        MY_CONFIG_DST_MAC,
-        MY_CONFIG_SRC_MAC,
-        MY_CONFIG_SRC_IP,
-        MY_CONFIG_SRC_PORT,
-    ):
-        self.connection_manager = connection_manager
-        self.MY_CONFIG_DST_MAC = MY_CONFIG_DST_MAC
-        self.MY_CONFIG_SRC_MAC = MY_CONFIG_SRC_MAC
-        self.MY_CONFIG_SRC_IP = MY_CONFIG_SRC_IP
-        self.MY_CONFIG_SRC_PORT = MY_CONFIG_SRC_PORT
+    ALL_HDR_BYTES = 42
+
+    # Ethernet (dst MAC, src MAC, EtherType) + IPv4 + UDP headers in network byte order
+    HEADER_STRUCT = struct.Struct("!6s6sH" "BBHHHBBHII" "HHHH")
+    IPV4_HEADER_STRUCT = struct.Struct("!BBHHHBBHII")
+
+    # Frame offsets of the per-packet length fields (big-endian) in a header template
+    IP_TOTAL_LEN_OFFSET = 14 + 2
+    UDP_LEN_OFFSET = 14 + 20 + 4
+
+    # Frame offsets of the per-connection fields (big-endian) in a header template
+    IP_DST_OFFSET = 14 + 16
+    UDP_DST_PORT_OFFSET = 14 + 20 + 2
+
+    # Frame offsets of the checksum fields and of the pseudo-header source/destination IPs
+    IP_CHECKSUM_OFFSET = 14 + 10
+    IP_SRC_OFFSET = 14 + 12
+    UDP_CHECKSUM_OFFSET = 14 + 20 + 6
+
+    PAYLOAD_MODES = ("random", "zero", "counter", "pool")
+
+    # Longest payload _generate_random_packet can draw (4 x 512 bits)
+    MAX_PAYLOAD_BYTES = 256
+
+    # Longest test input (connectionId prefix + payload), e.g. to size a reusable DMA buffer
+    MAX_INPUT_BYTES = MAX_PAYLOAD_BYTES + 4
+
+    def __init__(
+        self,
+        connection_manager,
+        MY_CONFIG_DST_MAC,
+        MY_CONFIG_SRC_MAC,
+        MY_CONFIG_SRC_IP,
+        MY_CONFIG_SRC_PORT,
+        payload_mode="random",
+        payload_pool_bytes=1 << 20,
+        rng=None,
+        ip_checksum=False,
+        udp_checksum=False,
+    ):
+        if payload_mode not in udp_model.PAYLOAD_MODES:
+            raise ValueError(f"payload_mode must be one of {udp_model.PAYLOAD_MODES}")
+
+        self.header_cache = {}
+        self.connection_manager = connection_manager
+        self.MY_CONFIG_DST_MAC = MY_CONFIG_DST_MAC
+        self.MY_CONFIG_SRC_MAC = MY_CONFIG_SRC_MAC
+        self.MY_CONFIG_SRC_IP = MY_CONFIG_SRC_IP
+        self.MY_CONFIG_SRC_PORT = MY_CONFIG_SRC_PORT
+
+        self.seed_sequence, self.rng = udp_model._make_rng(rng)
+        self._random = udp_model._scalar_random(self.seed_sequence)
+
+        self.payload_mode = payload_mode
+        self.payload_pool_bytes = payload_pool_bytes
+        self.ip_checksum = ip_checksum
+        self.udp_checksum = udp_checksum
+        self._payload_pool = (
+            self.rng.bytes(max(payload_pool_bytes, udp_model.MAX_PAYLOAD_BYTES))
+            if payload_mode == "pool"
+            else None
+        )
+        self._counter_pattern = bytes(range(256)) * (udp_model.MAX_PAYLOAD_BYTES // 256 + 1)
+
+    def __setattr__(self, name, value):
+        # the source/destination configuration is baked into every header template
+        if name.startswith("MY_CONFIG_"):
+            self.header_cache.clear()
+        object.__setattr__(self, name, value)
+
+    @staticmethod
+    def _make_rng(rng):
+        """
+        Normalize a seed argument to (SeedSequence, Generator).
+
+        None draws the seed from the global random module, so random.seed() still
+        makes a default model reproducible.
+        """
+        if isinstance(rng, np.random.Generator):
+            bit_generator = rng.bit_generator
+            seed_sequence = getattr(bit_generator, "seed_seq", None) or bit_generator._seed_seq
+            return seed_sequence, rng
+        if rng is None:
+            rng = random.getrandbits(128)
+        seed_sequence = rng if isinstance(rng, np.random.SeedSequence) else np.random.SeedSequence(rng)
+        return seed_sequence, np.random.default_rng(seed_sequence)
+
+    @staticmethod
+    def _scalar_random(seed_sequence):
+        """random.Random for the per-item scalar paths, seeded from a SeedSequence."""
+        return random.Random(int.from_bytes(seed_sequence.generate_state(4).tobytes(), "little"))
+
+    def _with_seed_sequence(self, seed_sequence):
+        """Copy of this model (same table and configuration) on another RNG stream."""
+        return udp_model(
+            self.connection_manager,
+            self.MY_CONFIG_DST_MAC,
+            self.MY_CONFIG_SRC_MAC,
+            self.MY_CONFIG_SRC_IP,
+            self.MY_CONFIG_SRC_PORT,
+            payload_mode=self.payload_mode,
+            payload_pool_bytes=self.payload_pool_bytes,
+            rng=seed_sequence,
+            ip_checksum=self.ip_checksum,
+            udp_checksum=self.udp_checksum,
+        )
+
+    def spawn(self, n):
+        """
+        Derive n models on independent RNG streams (SeedSequence.spawn).
+
+        Returns:
+            list: udp_model instances sharing this model's connection manager
+        """
+        return [self._with_seed_sequence(child) for child in self.seed_sequence.spawn(n)]
+
+    def stream(self, index):
+        """
+        Model on the index-th child stream of this model's SeedSequence.
+
+        Unlike spawn(), this does not depend on how many children were spawned
+        before: assigning work unit i to stream(i) gives the same vectors for unit i
+        whatever the number of workers or the order they run in.
+        """
+        seed_sequence = np.random.SeedSequence(
+            self.seed_sequence.entropy,
+            spawn_key=tuple(self.seed_sequence.spawn_key) + (index,),
+            pool_size=self.seed_sequence.pool_size,
+        )
+        return self._with_seed_sequence(seed_sequence)
+
+    def invalidate_header_cache(self, connection_id=None):
+        """Drop the header template of one connection, or all of them."""
+        if connection_id is None:
+            self.header_cache.clear()
+        else:
+            self.header_cache.pop(connection_id, None)
+
+    def _payload(self, length):
+        """Payload bytes of one packet according to payload_mode (list of ints)."""
+        return list(self._payload_view(length))
+
+    def _payload_view(self, length):
+        """Payload bytes of one packet according to payload_mode (bytes-like, no list)."""
+        if self.payload_mode == "random":
+            return self._random.randbytes(length)
+        if self.payload_mode == "zero":
+            return bytes(length)
+        if self.payload_mode == "counter":
+            if length > len(self._counter_pattern):
+                return bytes(i & 0xFF for i in range(length))
+            return memoryview(self._counter_pattern)[:length]
+
+        start = self._random.randrange(len(self._payload_pool) - length + 1)
+        return memoryview(self._payload_pool)[start : start + length]
+
+    def _payload_buffer(self, rng, lengths, offsets, lead=0):
+        """
+        Payload bytes of many packets laid out back to back (uint8 buffer).
+
+        Args:
+            rng:     np.random.Generator for the random/pool modes
+            lengths: Byte length of each packet's region
+            offsets: Start of each region in the buffer
+            lead:    Bytes at the start of each region reserved for the caller
+                     (e.g. the connectionId prefix); the payload pattern starts after
+        """
+        total = int(lengths.sum())
+        if self.payload_mode == "random":
+            return np.frombuffer(rng.bytes(total), dtype=np.uint8).copy()
+        if self.payload_mode == "zero":
+            return np.zeros(total, dtype=np.uint8)
+        if self.payload_mode == "counter":
+            index = np.arange(total, dtype=np.int64) - np.repeat(offsets + lead, lengths)
+            return (index & 0xFF).astype(np.uint8)
+
+        pool = np.frombuffer(self._payload_pool, dtype=np.uint8)
+        starts = rng.integers(0, len(pool) - lengths + 1)
+        return udp_model._gather_segments(pool, starts, lengths)
 
     def _generate_random_packet(self):
         """
@@ -541,54 +2879,56 @@ class udp_model:
         # ------------------------------------------------------------
         # 1. Generate packet length
         # ------------------------------------------------------------
-        n = random.randint(0, 3)
-        mode = random.randint(0, 2)
-
-        if mode == 0:
-            base_len = random.randrange(0, 176, 8)
-        elif mode == 1:
-            base_len = 176
-        else:
-            base_len = random.randrange(184, 513, 8)
-
-        payload_length_bits = base_len + n * 512
-        assert payload_length_bits % 8 == 0
-        payload_length_bytes = payload_length_bits // 8
-        payload_length_bytes = max(payload_length_bytes, 60)
+        payload_length_bytes = self._random_payload_length()
 
         # ------------------------------------------------------------
         # 2. Payload bytes (list of ints)
         # ------------------------------------------------------------
-        payload = [random.getrandbits(8) for _ in range(payload_length_bytes)]
+        payload = self._payload(payload_length_bytes)
 
         # ------------------------------------------------------------
         # 3. Pick connectionId
         # ------------------------------------------------------------
-        if self.connection_manager.existing_connection_ids and random.random() < 0.9:
-            connection_id = random.choice(
-                self.connection_manager.existing_connection_ids
-            )
-        else:
-            connection_id = random.getrandbits(18)
-
-        full_packet_bytes = []
+        connection_id = self._random_connection_id()
 
-        # append connectionId as MSB → LSB (like your IP header builder)
-        for i in reversed(range(4)):  # MSB → LSB
-            full_packet_bytes.append((connection_id >> (8 * i)) & 0xFF)
+        # connectionId as MSB → LSB (like your IP header builder)
+        full_packet_bytes = list(struct.pack(">I", connection_id))
 
         # append payload bytes (already LSB-first from RAM)
         full_packet_bytes.extend(payload)
 
         return connection_id, payload_length_bytes + 4, full_packet_bytes
 
+    def _random_payload_length(self):
+        """Payload length in bytes of one random packet (see _generate_random_packet)."""
+        rand = self._random
+        n = rand.randint(0, 3)
+        mode = rand.randint(0, 2)
+
+        if mode == 0:
+            base_len = rand.randrange(0, 176, 8)
+        elif mode == 1:
+            base_len = 176
+        else:
+            base_len = rand.randrange(184, 513, 8)
+
+        payload_length_bits = base_len + n * 512
+        assert payload_length_bits % 8 == 0
+        payload_length_bytes = payload_length_bits // 8
+        return max(payload_length_bytes, 60)
+
+    def _random_connection_id(self):
+        """ConnectionId of one random packet: 90% existing, 10% random 18-bit."""
+        rand = self._random
+        if self.connection_manager.existing_connection_ids and rand.random() < 0.9:
+            return rand.choice(self.connection_manager.existing_connection_ids)
+        return rand.getrandbits(18)
+
     @staticmethod
     def _swap_bytes(val, num_bytes):
         """Convert between little-endian and big-endian byte order."""
-        out = 0
-        for i in range(num_bytes):
-            out = (out << 8) | ((val >> (8 * i)) & 0xFF)
-        return out
+        val &= (1 << (8 * num_bytes)) - 1
+        return int.from_bytes(val.to_bytes(num_bytes, "little"), "big")
 
     @staticmethod
     def _build_ipv4_header(
@@ -612,6 +2952,9 @@ class udp_model:
         byte ordering and field positioning. The header layout matches the RTL
         implementation for bit-accurate verification.
 
+        The header is packed in wire order with struct (see _pack_ipv4_header); the
+        integer form keeps byte 0 of the header in bits [7:0], like the RTL vector.
+
         Returns:
             int: 160-bit IPv4 header as a single integer
 
@@ -627,40 +2970,85 @@ class udp_model:
             Bytes 16-19: Destination IP
         """
 
+        return int.from_bytes(
+            udp_model._pack_ipv4_header(
+                payload_length_bytes,
+                src_ip,
+                dst_ip,
+                dscp,
+                ecn,
+                identification,
+                flags,
+                frag_offset,
+                ttl,
+                protocol,
+                IP_HEADER_BYTES,
+                UDP_HEADER_BYTES,
+            ),
+            "little",
+        )
+
+    @staticmethod
+    def _ipv4_header_fields(
+        payload_length_bytes,
+        src_ip,
+        dst_ip,
+        dscp,
+        ecn,
+        identification,
+        flags,
+        frag_offset,
+        ttl,
+        protocol,
+        IP_HEADER_BYTES=20,
+        UDP_HEADER_BYTES=8,
+    ):
+        """IPv4 header fields in IPV4_HEADER_STRUCT order (checksum 0)."""
         version_ihl = (4 << 4) | (IP_HEADER_BYTES // 4)
-        dscp_ecn = (dscp << 2) | ecn
+        dscp_ecn = ((dscp << 2) | ecn) & 0xFF
 
         # Total length = header + UDP + payload
-        total_len = payload_length_bytes + IP_HEADER_BYTES + UDP_HEADER_BYTES
+        total_len = (payload_length_bytes + IP_HEADER_BYTES + UDP_HEADER_BYTES) & 0xFFFF
 
         # Flags (3 bits) + Fragment offset (13 bits)
         flags_frag = ((flags & 0x7) << 13) | (frag_offset & 0x1FFF)
 
-        # Build header exactly in the same field order as the Verilog
-        ip_header = 0
-        ip_header |= version_ihl
-        ip_header |= dscp_ecn << 8
-        ip_header |= udp_model._swap_bytes(total_len, 2) << 16
-        ip_header |= udp_model._swap_bytes(identification, 2) << 32
-        ip_header |= udp_model._swap_bytes(flags_frag, 2) << 48
-        ip_header |= ttl << 64
-        ip_header |= protocol << 72
-        ip_header |= 0 << 80
-        ip_header |= udp_model._swap_bytes(src_ip, 4) << 96
-        ip_header |= udp_model._swap_bytes(dst_ip, 4) << 128
-
-        return ip_header
+        return (
+            version_ihl,
+            dscp_ecn,
+            total_len,
+            identification & 0xFFFF,
+            flags_frag,
+            ttl & 0xFF,
+            protocol & 0xFF,
+            0,
+            src_ip & 0xFFFFFFFF,
+            dst_ip & 0xFFFFFFFF,
+        )
+
+    @staticmethod
+    def _pack_ipv4_header(*args, **kwargs):
+        """
+        Build the 20-byte IPv4 header in network byte order (wire order).
+
+        Takes the same arguments as _build_ipv4_header.
+
+        Returns:
+            bytes: 20-byte IPv4 header
+        """
+        return udp_model.IPV4_HEADER_STRUCT.pack(
+            *udp_model._ipv4_header_fields(*args, **kwargs)
+        )
 
     def _model_udp(self, connection_id, payload_length_bytes, payload_bytes):
         """
         Model complete UDP packet encapsulation (Ethernet + IP + UDP + Payload).
 
         This method performs the complete packet construction process:
-        1. Look up connection metadata (destination IP/port)
-        2. Build Ethernet header (14 bytes)
-        3. Build IPv4 header (20 bytes)
-        4. Build UDP header (8 bytes)
-        5. Append payload data
+        1. Fetch the connection's 42-byte header template (built from the
+           connection metadata on first use, see _header_template)
+        2. Patch the IPv4 total length and UDP length fields
+        3. Append payload data
 
         The packet structure mirrors the hardware implementation exactly for
         verification purposes.
@@ -672,27 +3060,124 @@ class udp_model:
             [42-end]:  Payload data
         """
 
-        connection_meta_data = self.connection_manager.read_rv(connection_id)
-        if not connection_meta_data["hit"]:
+        template = self._header_template(connection_id)
+        if template is None:
             return {"dropped": 1, "packet": []}
 
-        dst_ipAddr = connection_meta_data["ipAddr"]
-        dst_udpPort = connection_meta_data["udpPort"]
+        full_packet_bytes = list(
+            self._frame_headers(template, payload_length_bytes, payload_bytes)
+        )
+
+        # append payload (already LSB-first chunks)
+        full_packet_bytes.extend(payload_bytes)
+
+        return {"dropped": 0, "packet": full_packet_bytes}
+
+    @staticmethod
+    def _patch_lengths(template, payload_length_bytes):
+        """Header template with the IPv4 total length and UDP length filled in (bytearray)."""
+        # only the two length fields differ between packets of one connection
+        headers = bytearray(template)
+        struct.pack_into(
+            ">H",
+            headers,
+            udp_model.IP_TOTAL_LEN_OFFSET,
+            (payload_length_bytes + udp_model.IP_HEADER_BYTES + udp_model.UDP_HEADER_BYTES)
+            & 0xFFFF,
+        )
+        struct.pack_into(
+            ">H",
+            headers,
+            udp_model.UDP_LEN_OFFSET,
+            (payload_length_bytes + udp_model.UDP_HEADER_BYTES) & 0xFFFF,
+        )
+        return headers
+
+    def _frame_headers(self, template, payload_length_bytes, payload_bytes):
+        """
+        Final 42-byte headers of one frame: lengths patched, checksums filled in when
+        enabled (bytearray).
+        """
+        headers = udp_model._patch_lengths(template, payload_length_bytes)
+
+        if self.ip_checksum:
+            struct.pack_into(
+                ">H",
+                headers,
+                udp_model.IP_CHECKSUM_OFFSET,
+                udp_model._fold_checksum(udp_model._word_sum(headers[14:34])),
+            )
+
+        if self.udp_checksum:
+            # pseudo-header (src IP, dst IP, zero, protocol, UDP length) + UDP header + payload
+            udp_len = (payload_length_bytes + udp_model.UDP_HEADER_BYTES) & 0xFFFF
+            total = (
+                udp_model._word_sum(headers[udp_model.IP_SRC_OFFSET : 34])
+                + udp_model.IPPROTO_UDP
+                + udp_len
+                + udp_model._word_sum(headers[34:42])
+                + udp_model._word_sum(bytes(payload_bytes))
+            )
+            # an all-zero checksum means "no checksum" in UDP; send 0xFFFF instead
+            struct.pack_into(
+                ">H",
+                headers,
+                udp_model.UDP_CHECKSUM_OFFSET,
+                udp_model._fold_checksum(total) or 0xFFFF,
+            )
+
+        return headers
+
+    @staticmethod
+    def _word_sum(data):
+        """Sum of the big-endian 16-bit words of data (an odd last byte is zero-padded)."""
+        if len(data) & 1:
+            data = bytes(data) + b"\x00"
+        return sum(struct.unpack(f">{len(data) // 2}H", data))
+
+    @staticmethod
+    def _fold_checksum(total):
+        """One's-complement checksum of a word sum below 2**32 (int or int64 array)."""
+        total = (total & 0xFFFF) + (total >> 16)
+        total = (total & 0xFFFF) + (total >> 16)
+        return ~total & 0xFFFF
+
+    def _header_template(self, connection_id):
+        """
+        Cached 42-byte Ethernet/IPv4/UDP header of a connection, length fields zero.
+
+        Returns:
+            bytes: Header template, or None if connection_id is not a valid entry
+        """
+        generation = self.connection_manager.slot_generation.get(connection_id, 0)
+        cached = self.header_cache.get(connection_id)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+        connection_meta_data = self.connection_manager.read_rv(connection_id)
+        if not connection_meta_data["hit"]:
+            return None
 
-        # ======================================================
-        # Build Ethernet Header (big-endian)
-        # ======================================================
-        ethernet_header = (
-            (udp_model._swap_bytes(udp_model.ETHTYPE_IP, 2) << (2 * 48))
-            | (udp_model._swap_bytes(self.MY_CONFIG_SRC_MAC, 6) << 48)
-            | udp_model._swap_bytes(self.MY_CONFIG_DST_MAC, 6)
+        template = self._build_header_template(
+            connection_meta_data["ipAddr"], connection_meta_data["udpPort"]
         )
+        self.header_cache[connection_id] = (generation, template)
+        return template
 
-        # ======================================================
-        # Build IPv4 Header (exact RTL layout)
-        # ======================================================
-        ip_header = udp_model._build_ipv4_header(
-            payload_length_bytes=payload_length_bytes,
+    def _build_header_template(self, dst_ipAddr, dst_udpPort):
+        """
+        Build the Ethernet + IPv4 + UDP headers of a connection (exact RTL layout).
+
+        Header Structure:
+            [0-13]:    Ethernet header (Dst MAC, Src MAC, EtherType)
+            [14-33]:   IPv4 header (20 bytes, total length left 0)
+            [34-41]:   UDP header (8 bytes, length left 0)
+
+        Returns:
+            bytes: 42-byte header template
+        """
+        ip_fields = udp_model._ipv4_header_fields(
+            payload_length_bytes=0,
             src_ip=self.MY_CONFIG_SRC_IP,
             dst_ip=dst_ipAddr,
             dscp=udp_model.IP_UDP_DSCP,
@@ -706,41 +3191,20 @@ class udp_model:
             UDP_HEADER_BYTES=udp_model.UDP_HEADER_BYTES,
         )
 
-        # ======================================================
-        # Build UDP Header
-        # ======================================================
-        udp_header = (
-            (udp_model._swap_bytes(0, 2) << 48)
-            | (
-                udp_model._swap_bytes(
-                    payload_length_bytes + udp_model.UDP_HEADER_BYTES, 2
-                )
-                << 32
-            )
-            | (udp_model._swap_bytes(dst_udpPort, 2) << 16)
-            | udp_model._swap_bytes(self.MY_CONFIG_SRC_PORT, 2)
-        )
-
-        # ======================================================
-        # Build FINAL PACKET = headers || payload
-        # ======================================================
-        ALL_HDR_BYTES = 42
-
-        all_headers = (
-            (udp_header << (20 + 14) * 8) | (ip_header << (14 * 8)) | ethernet_header
+        return udp_model.HEADER_STRUCT.pack(
+            # Ethernet: dst MAC, src MAC, EtherType
+            (self.MY_CONFIG_DST_MAC & 0xFFFFFFFFFFFF).to_bytes(6, "big"),
+            (self.MY_CONFIG_SRC_MAC & 0xFFFFFFFFFFFF).to_bytes(6, "big"),
+            udp_model.ETHTYPE_IP,
+            # IPv4 (total length patched per packet)
+            *ip_fields,
+            # UDP: src port, dst port, length (patched per packet), checksum
+            self.MY_CONFIG_SRC_PORT & 0xFFFF,
+            dst_udpPort & 0xFFFF,
+            0,
+            0,
         )
 
-        full_packet_bytes = []
-
-        # append header bytes MSB → LSB
-        for i in range(ALL_HDR_BYTES):
-            full_packet_bytes.append((all_headers >> (8 * i)) & 0xFF)
-
-        # append payload (already LSB-first chunks)
-        full_packet_bytes.extend(payload_bytes)
-
-        return {"dropped": 0, "packet": full_packet_bytes}
-
     def _model_loopback_expanded_payload(self, is_valid, connection_id, payload_bytes):
         """
         Model the loopback module output:
@@ -750,24 +3214,13 @@ class udp_model:
 
         Output is returned as 512-bit (64-byte) AXIS beats.
         """
-        payload_length = len(payload_bytes)
-
-        # --- Build the expanded returned payload ---
-        combined = []
-
-        # 4-byte little-endian connection_id
-        for i in range(4):
-            combined.append((connection_id >> (8 * i)) & 0xFF)
-
-        # Next 4 bytes = zeros
-        combined.extend([0] * 4)
-
-        # Append original payload
-        combined.extend(payload_bytes)
-
         if not is_valid:
             return []  # no output beats
 
+        # 4-byte little-endian connection_id, 4 zero bytes, original payload
+        combined = list(struct.pack("<I4x", connection_id & 0xFFFFFFFF))
+        combined.extend(payload_bytes)
+
         return combined
 
     def generate_end_to_end_test(self):
@@ -775,33 +3228,58 @@ class udp_model:
         Generate a realistic loopback end-to-end test:
             Input:  raw payload + connection_id
             Output: expanded loopback payload in AXIS form
+
+        The drop decision is a single read_rv lookup; the raw UDP frame and the
+        loopback output are only built when their entries are read, so loopback-only
+        runs that check 'dropped' and the lengths skip the frame construction. Both
+        are built from the connection table as it was when the test was generated.
+
+        Returns:
+            Mapping: Read-only test dict (see _lazy_test_vector)
         """
 
         # Generate random input
         connection_id, payload_length, payload_bytes = self._generate_random_packet()
 
-        # Old UDP model still used only to determine dropped/valid
-        expected_output = self._model_udp(connection_id, payload_length, payload_bytes)
+        connection_meta_data = self.connection_manager.read_rv(connection_id)
+        dropped = 0 if connection_meta_data["hit"] else 1
+        raw_length = 0 if dropped else udp_model.ALL_HDR_BYTES + payload_length
+        rx_length = 0 if dropped else 8 + payload_length
+
+        def raw_output():
+            if dropped:
+                return []
+            template = self._build_header_template(
+                connection_meta_data["ipAddr"], connection_meta_data["udpPort"]
+            )
+            packet = list(self._frame_headers(template, payload_length, payload_bytes))
+            packet.extend(payload_bytes)
+            return packet
+
+        def rx_output():
+            return self._model_loopback_expanded_payload(
+                is_valid=not dropped,
+                connection_id=connection_id,
+                payload_bytes=payload_bytes,
+            )
 
-        expected_beats = self._model_loopback_expanded_payload(
-            is_valid=not expected_output["dropped"],
-            connection_id=connection_id,
-            payload_bytes=payload_bytes,
+        return _lazy_test_vector(
+            {
+                "connection_id": connection_id,
+                "input_payload_bytes": payload_bytes,
+                "input_payload_bytes_length": payload_length,
+                "dropped": dropped,
+                "raw_output_packet_bytes_length": raw_length,
+                "rx_output_packet_bytes_length": rx_length,
+            },
+            {
+                # raw UDP-modeled output
+                "raw_output_packet_bytes": raw_output,
+                # loopback-expanded AXIS packet (this is what hardware returns)
+                "rx_output_packet_bytes": rx_output,
+            },
         )
 
-        return {
-            "connection_id": connection_id,
-            "input_payload_bytes": payload_bytes,
-            "input_payload_bytes_length": payload_length,
-            "dropped": expected_output["dropped"],
-            # raw UDP-modeled output
-            "raw_output_packet_bytes": expected_output["packet"],
-            "raw_output_packet_bytes_length": len(expected_output["packet"]),
-            # loopback-expanded AXIS packet (this is what hardware returns)
-            "rx_output_packet_bytes": expected_beats,
-            "rx_output_packet_bytes_length": len(expected_beats),
-        }
-
     def generate_test(self):
         """
         Generate a complete test case with input packet and expected output.
@@ -825,3 +3303,463 @@ class udp_model:
             "output_packet_bytes": expected_output["packet"],
             "output_packet_bytes_length": len(expected_output["packet"]),
         }
+
+    def generate_into(self, buf, offset=0):
+        """
+        Generate one test case, writing its input straight into a caller-owned buffer.
+
+        The connectionId prefix (MSB first) and payload are written to
+        buf[offset : offset + input_payload_bytes_length] without building a Python
+        list, so a pynq allocate() buffer can be handed to the DMA engine as is. The
+        random draws are the same as generate_test / generate_end_to_end_test, so an
+        identically seeded model produces the same packet.
+
+        Expected outputs are described instead of copied: each one is a short prefix
+        followed by the input region of buf.
+
+        Args:
+            buf:    Writable uint8 buffer (pynq buffer, np.ndarray, bytearray, ...)
+            offset: Byte offset of the packet in buf
+
+        Returns:
+            dict: Test metadata with keys:
+                - 'connection_id'
+                - 'input_payload_bytes_length':    Bytes written at offset
+                - 'dropped'
+                - 'output_header_bytes':           42-byte TX headers (empty if dropped);
+                  expected TX frame = output_header_bytes || input region
+                - 'output_packet_bytes_length'
+                - 'rx_output_prefix_bytes':        8-byte loopback prefix (empty if
+                  dropped); expected RX output = rx_output_prefix_bytes || input region
+                - 'rx_output_packet_bytes_length'
+
+        Raises:
+            ValueError: If the packet does not fit in buf at offset
+        """
+        view = memoryview(buf).cast("B")
+
+        payload_length_bytes = self._random_payload_length()
+        input_length = payload_length_bytes + 4
+        end = offset + input_length
+        if offset < 0 or end > len(view):
+            raise ValueError(
+                f"packet of {input_length} bytes does not fit at offset {offset} "
+                f"of a {len(view)}-byte buffer"
+            )
+
+        view[offset + 4 : end] = self._payload_view(payload_length_bytes)
+        connection_id = self._random_connection_id()
+        struct.pack_into(">I", view, offset, connection_id)
+
+        template = self._header_template(connection_id)
+        dropped = template is None
+        if dropped:
+            header, prefix = b"", b""
+        else:
+            header = bytes(self._frame_headers(template, input_length, view[offset:end]))
+            prefix = struct.pack("<I4x", connection_id & 0xFFFFFFFF)
+
+        return {
+            "connection_id": connection_id,
+            "input_payload_bytes_length": input_length,
+            "dropped": int(dropped),
+            "output_header_bytes": header,
+            "output_packet_bytes_length": 0 if dropped else len(header) + input_length,
+            "rx_output_prefix_bytes": prefix,
+            "rx_output_packet_bytes_length": 0 if dropped else len(prefix) + input_length,
+        }
+
+    # --------------------------------------------------------------------------------------------------
+    # Batched generation
+    # --------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _exclusive_cumsum(lengths):
+        """Start offset of each segment when the segments are laid out back to back."""
+        offsets = np.zeros(len(lengths), dtype=np.int64)
+        np.cumsum(lengths[:-1], out=offsets[1:])
+        return offsets
+
+    @staticmethod
+    def _gather_segments(src, starts, lengths):
+        """
+        Concatenate variable-length segments of src into one buffer in a single gather.
+
+        Args:
+            src:     1-D source array
+            starts:  Start index of each segment in src
+            lengths: Length of each segment
+
+        Returns:
+            np.ndarray: src[starts[0]:starts[0]+lengths[0]] || src[starts[1]:...] || ...
+        """
+        lengths = np.asarray(lengths, dtype=np.int64)
+        offsets = udp_model._exclusive_cumsum(lengths)
+        index = np.arange(int(lengths.sum()), dtype=np.int64)
+        index += np.repeat(np.asarray(starts, dtype=np.int64) - offsets, lengths)
+        return src[index]
+
+    @staticmethod
+    def _segment_word_sums(buf, starts, lengths):
+        """
+        Sum of the big-endian 16-bit words of each segment of buf, as in _word_sum.
+
+        Segments may start at odd positions: the bytes at even and odd buffer
+        positions are reduced separately (np.add.reduceat) and weighted by whether
+        they are the high or low byte of their word within the segment.
+
+        Returns:
+            np.ndarray: int64 sum per segment
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = starts + np.asarray(lengths, dtype=np.int64)
+        sums = np.zeros(len(starts), dtype=np.int64)
+        if not len(starts):
+            return sums
+
+        for phase in (0, 1):
+            # bytes at buffer positions of this parity; the trailing zero lets a
+            # segment end at the very end of the buffer
+            half = np.append(buf[phase::2], np.uint8(0))
+            lo = (starts - phase + 1) // 2
+            hi = (ends - phase + 1) // 2
+            # uint32 accumulation is about twice as fast as int64 and cannot overflow
+            # for segments below 2**24 bytes
+            part = np.add.reduceat(half, np.stack([lo, hi], axis=1).ravel(), dtype=np.uint32)[::2]
+            part = part.astype(np.int64)
+            part[lo == hi] = 0
+            sums += part * np.where((starts & 1) == phase, 256, 1)
+        return sums
+
+    def _fill_checksums(self, headers, input_buf, offsets, lengths):
+        """
+        Fill in the enabled checksums of many frames at once.
+
+        Args:
+            headers:   (k, 42) uint8 array of length-patched headers, updated in place
+            input_buf: Buffer holding the UDP payload of every frame
+            offsets:   Start of each frame's payload in input_buf
+            lengths:   Payload length of each frame
+        """
+        words = headers.view(">u2")
+
+        if self.ip_checksum:
+            ip_words = slice(14 // 2, 34 // 2)
+            words[:, udp_model.IP_CHECKSUM_OFFSET // 2] = udp_model._fold_checksum(
+                words[:, ip_words].sum(axis=1, dtype=np.int64)
+            )
+
+        if self.udp_checksum:
+            total = (
+                words[:, udp_model.IP_SRC_OFFSET // 2 : 42 // 2].sum(axis=1, dtype=np.int64)
+                + udp_model.IPPROTO_UDP
+                + ((np.asarray(lengths, dtype=np.int64) + udp_model.UDP_HEADER_BYTES) & 0xFFFF)
+                + udp_model._segment_word_sums(input_buf, offsets, lengths)
+            )
+            checksum = udp_model._fold_checksum(total)
+            words[:, udp_model.UDP_CHECKSUM_OFFSET // 2] = np.where(checksum == 0, 0xFFFF, checksum)
+
+    @staticmethod
+    def _be_bytes(values, dtype):
+        """Rows of big-endian bytes of values (dtype '>u2' or '>u4')."""
+        values = np.asarray(values).astype(dtype)
+        return values.view(np.uint8).reshape(len(values), values.itemsize)
+
+    def generate_tests(self, n):
+        """
+        Generate n test vectors at once with vectorized NumPy operations.
+
+        Packet lengths, connectionId selection and drop decisions follow
+        _generate_random_packet / _model_udp / _model_loopback_expanded_payload; every
+        per-packet variable-length field is stored in one contiguous uint8 buffer with
+        offset and length arrays, so test i's input payload is
+        input_payload_bytes[input_payload_offsets[i]:][:input_payload_bytes_length[i]].
+        Dropped packets have zero-length TX and RX outputs.
+
+        Randomness is drawn from self.rng, so a seeded model (or a stream() of one)
+        always produces the same vectors.
+
+        Returns:
+            dict: Arrays with keys:
+                - 'connection_id':                  uint32[n]
+                - 'dropped':                        bool[n]
+                - 'input_payload_bytes':            uint8 buffer of all inputs
+                  (connectionId prefix + payload), with 'input_payload_offsets' and
+                  'input_payload_bytes_length'
+                - 'output_packet_bytes':            uint8 buffer of the expected TX
+                  frames, with 'output_packet_offsets' and 'output_packet_bytes_length'
+                - 'rx_output_packet_bytes':         uint8 buffer of the expected loopback
+                  outputs, with 'rx_output_packet_offsets' and
+                  'rx_output_packet_bytes_length'
+        """
+        rng = self.rng
+        connection_manager = self.connection_manager
+
+        # ------------------------------------------------------------
+        # 1. Packet lengths (see _generate_random_packet)
+        # ------------------------------------------------------------
+        blocks = rng.integers(0, 4, n)
+        mode = rng.integers(0, 3, n)
+        base_len = np.where(
+            mode == 0,
+            8 * rng.integers(0, 22, n),
+            np.where(mode == 1, 176, 184 + 8 * rng.integers(0, 42, n)),
+        )
+        payload_len = np.maximum((base_len + blocks * 512) // 8, 60)
+        input_len = (payload_len + 4).astype(np.int64)
+        input_offsets = udp_model._exclusive_cumsum(input_len)
+
+        # ------------------------------------------------------------
+        # 2. ConnectionIds: 90% existing, 10% random
+        # ------------------------------------------------------------
+        connection_id = rng.integers(0, 1 << 18, n, dtype=np.int64)
+        existing = np.asarray(connection_manager.existing_connection_ids, dtype=np.int64)
+        if len(existing):
+            pick = rng.random(n) < 0.9
+            connection_id[pick] = existing[rng.integers(0, len(existing), int(pick.sum()))]
+
+        # ------------------------------------------------------------
+        # 3. Input buffer: connectionId (MSB first) || payload
+        # ------------------------------------------------------------
+        input_buf = self._payload_buffer(rng, input_len, input_offsets, lead=4)
+        input_buf[input_offsets[:, None] + np.arange(4)] = udp_model._be_bytes(connection_id, ">u4")
+
+        # ------------------------------------------------------------
+        # 4. Drop decision and connection metadata (read_rv)
+        # ------------------------------------------------------------
+        way = connection_id >> 16
+        hash_key = connection_id & 0xFFFF
+        in_table = way < connection_manager.WAYS
+        way = np.where(in_table, way, 0)
+
+        vlds = np.asarray(connection_manager.my_hash_table_vlds, dtype=bool)
+        kept = in_table & vlds[way, hash_key]
+        dropped = ~kept
+        k = int(kept.sum())
+
+        kept_way, kept_hash = way[kept], hash_key[kept]
+        ipAddr_table = np.asarray(connection_manager.my_hash_table_ipAddr, dtype=np.int64)
+        udpPort_table = np.asarray(connection_manager.my_hash_table_udpPort, dtype=np.int64)
+        dst_ipAddr = ipAddr_table[kept_way, kept_hash]
+        dst_udpPort = udpPort_table[kept_way, kept_hash]
+        kept_len = input_len[kept]
+        kept_offsets = input_offsets[kept]
+
+        # ------------------------------------------------------------
+        # 5. Expected TX frames: patched header template || input
+        # ------------------------------------------------------------
+        template = np.frombuffer(self._build_header_template(0, 0), dtype=np.uint8)
+        headers = np.tile(template, (k, 1))
+        ip_total_len = kept_len + udp_model.IP_HEADER_BYTES + udp_model.UDP_HEADER_BYTES
+        udp_len = kept_len + udp_model.UDP_HEADER_BYTES
+        for offset, values, dtype in (
+            (udp_model.IP_DST_OFFSET, dst_ipAddr, ">u4"),
+            (udp_model.UDP_DST_PORT_OFFSET, dst_udpPort, ">u2"),
+            (udp_model.IP_TOTAL_LEN_OFFSET, ip_total_len & 0xFFFF, ">u2"),
+            (udp_model.UDP_LEN_OFFSET, udp_len & 0xFFFF, ">u2"),
+        ):
+            field = udp_model._be_bytes(values, dtype)
+            headers[:, offset : offset + field.shape[1]] = field
+        if self.ip_checksum or self.udp_checksum:
+            self._fill_checksums(headers, input_buf, kept_offsets, kept_len)
+
+        hdr = udp_model.ALL_HDR_BYTES
+        tx_buf = udp_model._gather_segments(
+            np.concatenate([headers.ravel(), input_buf]),
+            np.stack([hdr * np.arange(k), hdr * k + kept_offsets], axis=1).ravel(),
+            np.stack([np.full(k, hdr), kept_len], axis=1).ravel(),
+        )
+        tx_len = np.where(kept, hdr + input_len, 0)
+
+        # ------------------------------------------------------------
+        # 6. Expected RX outputs: connectionId (LSB first) || 4 zero bytes || input
+        # ------------------------------------------------------------
+        prefix = np.zeros((k, 8), dtype=np.uint8)
+        prefix[:, :4] = udp_model._be_bytes(connection_id[kept], ">u4")[:, ::-1]
+        rx_buf = udp_model._gather_segments(
+            np.concatenate([prefix.ravel(), input_buf]),
+            np.stack([8 * np.arange(k), 8 * k + kept_offsets], axis=1).ravel(),
+            np.stack([np.full(k, 8), kept_len], axis=1).ravel(),
+        )
+        rx_len = np.where(kept, 8 + input_len, 0)
+
+        return {
+            "connection_id": connection_id.astype(np.uint32),
+            "dropped": dropped,
+            "input_payload_bytes": input_buf,
+            "input_payload_offsets": input_offsets,
+            "input_payload_bytes_length": input_len,
+            "output_packet_bytes": tx_buf,
+            "output_packet_offsets": udp_model._exclusive_cumsum(tx_len),
+            "output_packet_bytes_length": tx_len,
+            "rx_output_packet_bytes": rx_buf,
+            "rx_output_packet_offsets": udp_model._exclusive_cumsum(rx_len),
+            "rx_output_packet_bytes_length": rx_len,
+        }
+
+    def iter_tests(self, count=None, batch=1 << 16):
+        """
+        Lazily yield test vectors as generate_tests batches, for runs of any length.
+
+        A batch is generated only when the consumer asks for the next one, so a slow
+        consumer (simulation driver, DMA loop, file writer) throttles generation and
+        memory stays at one batch however many tests are produced. Drop the
+        reference to a batch before pulling the next to keep it that way.
+
+        Batch i is generated by stream(i): the vectors depend only on this model's
+        seed and the batch size. The connection table is read when each batch is
+        generated, so bindings changed between batches apply to later batches.
+
+        Args:
+            count: Total number of tests, or None to generate forever
+            batch: Tests per batch (the last batch may be shorter)
+
+        Yields:
+            dict: generate_tests output of up to batch tests
+        """
+        if count is not None and count < 0:
+            raise ValueError(f"count must be >= 0 or None, got {count}")
+        if batch < 1:
+            raise ValueError(f"batch must be >= 1, got {batch}")
+
+        index = 0
+        remaining = count
+        while remaining is None or remaining > 0:
+            n = batch if remaining is None else min(batch, remaining)
+            yield self.stream(index).generate_tests(n)
+            index += 1
+            if remaining is not None:
+                remaining -= n
+
+    # Variable-length buffers of a generate_tests result and their offset arrays
+    _TEST_BUFFERS = (
+        ("input_payload_bytes", "input_payload_offsets"),
+        ("output_packet_bytes", "output_packet_offsets"),
+        ("rx_output_packet_bytes", "rx_output_packet_offsets"),
+    )
+
+    @staticmethod
+    def concat_tests(parts):
+        """
+        Concatenate generate_tests results into one, rebasing the buffer offsets.
+
+        Args:
+            parts: Sequence of generate_tests dicts (e.g. iter_tests batches)
+
+        Returns:
+            dict: Same layout as generate_tests over all tests of parts, in order
+        """
+        parts = list(parts)
+        out = {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+        for buffer_key, offsets_key in udp_model._TEST_BUFFERS:
+            sizes = np.array([len(part[buffer_key]) for part in parts], dtype=np.int64)
+            counts = [len(part[offsets_key]) for part in parts]
+            out[offsets_key] += np.repeat(udp_model._exclusive_cumsum(sizes), counts)
+        return out
+
+    def generate_tests_parallel(self, n, workers=None, chunk=1 << 16):
+        """
+        Generate n test vectors on a pool of worker processes.
+
+        The tests are split into chunks of `chunk` tests; chunk i is generated by
+        stream(i), so the result equals concat_tests(iter_tests(n, batch=chunk))
+        whatever the number of workers. Each worker copies its chunk into a shared
+        memory segment and returns only the segment name and array layout; the
+        parent concatenates straight from the segments and unlinks them, so no
+        payload bytes are pickled. Peak memory is about twice the result.
+
+        The model (with its connection table) is sent to each worker once, when the
+        worker starts.
+
+        Args:
+            n:       Number of tests
+            workers: Worker processes (default: os.cpu_count())
+            chunk:   Tests per work unit
+
+        Returns:
+            dict: Same layout as generate_tests
+        """
+        if chunk < 1:
+            raise ValueError(f"chunk must be >= 1, got {chunk}")
+        if n <= chunk:
+            return self.stream(0).generate_tests(n)
+
+        sizes = [min(chunk, n - start) for start in range(0, n, chunk)]
+        segments = []
+        parts = []
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_parallel_worker_init,
+                initargs=(self,),
+            ) as pool:
+                futures = [
+                    pool.submit(_parallel_worker_chunk, index, size)
+                    for index, size in enumerate(sizes)
+                ]
+                # attach every segment that was created, even after a failure, so
+                # the finally block unlinks all of them
+                errors = []
+                for future in futures:
+                    try:
+                        name, layout = future.result()
+                    except Exception as exc:
+                        errors.append(exc)
+                        continue
+                    segment = multiprocessing.shared_memory.SharedMemory(name=name)
+                    segments.append(segment)
+                    parts.append(
+                        {
+                            key: np.ndarray(shape, dtype=dtype, buffer=segment.buf, offset=offset)
+                            for key, (offset, dtype, shape) in layout.items()
+                        }
+                    )
+            if errors:
+                raise errors[0]
+
+            return udp_model.concat_tests(parts)
+        finally:
+            # the views must go before the segments can be closed
+            parts.clear()
+            for segment in segments:
+                segment.close()
+                segment.unlink()
+
+
+# ======================================================================================================
+# PARALLEL GENERATION WORKERS
+# ======================================================================================================
+
+# udp_model of a generate_tests_parallel worker process (set by _parallel_worker_init)
+_parallel_worker_model = None
+
+
+def _parallel_worker_init(model):
+    global _parallel_worker_model
+    _parallel_worker_model = model
+
+
+def _parallel_worker_chunk(index, n):
+    """
+    Generate chunk index of a generate_tests_parallel run into a new shared memory segment.
+
+    Returns:
+        tuple: (segment name, {key: (byte offset, dtype string, shape)})
+    """
+    tests = _parallel_worker_model.stream(index).generate_tests(n)
+
+    layout = {}
+    size = 0
+    for key, array in tests.items():
+        layout[key] = (size, array.dtype.str, array.shape)
+        size += (array.nbytes + 7) & ~7
+
+    segment = multiprocessing.shared_memory.SharedMemory(create=True, size=max(size, 1))
+    # the parent unlinks the segment once it has been copied; don't let this process's
+    # resource tracker remove it first
+    multiprocessing.resource_tracker.unregister(segment._name, "shared_memory")
+    for key, (offset, dtype, shape) in layout.items():
+        np.ndarray(shape, dtype=dtype, buffer=segment.buf, offset=offset)[...] = tests[key]
+    name = segment.name
+    segment.close()
+    return name, layout
@@ -0,0 +1,125 @@
+"""
+udp_model frame construction benchmark
+
+Times per-packet frame generation of udp_model against the original big-integer
+encoder (kept below as the reference) and checks that both produce byte-identical
+frames for the same packets.
+
+Usage:
+    python udp_model_benchmark.py [num_packets] [num_connections]
+"""
+
+import random
+import sys
+import time
+
+from udp_engine_control import connection_manager_sw, udp_model
+
+
+# ======================================================================================================
+# REFERENCE - Big-integer frame encoder (previous udp_model implementation)
+# ======================================================================================================
+
+
+def _swap_bytes_reference(val, num_bytes):
+    out = 0
+    for i in range(num_bytes):
+        out = (out << 8) | ((val >> (8 * i)) & 0xFF)
+    return out
+
+
+def _ipv4_header_reference(payload_length_bytes, src_ip, dst_ip):
+    version_ihl = (4 << 4) | (udp_model.IP_HEADER_BYTES // 4)
+    dscp_ecn = (udp_model.IP_UDP_DSCP << 2) | udp_model.IP_UDP_ENC
+    total_len = payload_length_bytes + udp_model.IP_HEADER_BYTES + udp_model.UDP_HEADER_BYTES
+    flags_frag = ((udp_model.IP_UDP_FLAGS & 0x7) << 13) | (udp_model.IP_UDP_FRAG_OFFSET & 0x1FFF)
+
+    ip_header = 0
+    ip_header |= version_ihl
+    ip_header |= dscp_ecn << 8
+    ip_header |= _swap_bytes_reference(total_len, 2) << 16
+    ip_header |= _swap_bytes_reference(udp_model.IP_UDP_IDEN, 2) << 32
+    ip_header |= _swap_bytes_reference(flags_frag, 2) << 48
+    ip_header |= udp_model.IP_UDP_TTL << 64
+    ip_header |= udp_model.IPPROTO_UDP << 72
+    ip_header |= _swap_bytes_reference(src_ip, 4) << 96
+    ip_header |= _swap_bytes_reference(dst_ip, 4) << 128
+    return ip_header
+
+
+def model_udp_reference(model, connection_id, payload_length_bytes, payload_bytes):
+    """Frame of one packet built the original way: read_rv, then 336-bit int packing."""
+    meta = model.connection_manager.read_rv(connection_id)
+    if not meta["hit"]:
+        return {"dropped": 1, "packet": []}
+
+    ethernet_header = (
+        (_swap_bytes_reference(udp_model.ETHTYPE_IP, 2) << (2 * 48))
+        | (_swap_bytes_reference(model.MY_CONFIG_SRC_MAC, 6) << 48)
+        | _swap_bytes_reference(model.MY_CONFIG_DST_MAC, 6)
+    )
+    ip_header = _ipv4_header_reference(payload_length_bytes, model.MY_CONFIG_SRC_IP, meta["ipAddr"])
+    udp_header = (
+        (_swap_bytes_reference(payload_length_bytes + udp_model.UDP_HEADER_BYTES, 2) << 32)
+        | (_swap_bytes_reference(meta["udpPort"], 2) << 16)
+        | _swap_bytes_reference(model.MY_CONFIG_SRC_PORT, 2)
+    )
+    all_headers = (udp_header << (20 + 14) * 8) | (ip_header << (14 * 8)) | ethernet_header
+
+    full_packet_bytes = [(all_headers >> (8 * i)) & 0xFF for i in range(udp_model.ALL_HDR_BYTES)]
+    full_packet_bytes.extend(payload_bytes)
+    return {"dropped": 0, "packet": full_packet_bytes}
+
+
+# ======================================================================================================
+# BENCHMARK
+# ======================================================================================================
+
+
+def _time_per_packet(fn, packets, repeat=3):
+    """Best-of-repeat wall time per packet in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for packet in packets:
+            fn(*packet)
+        best = min(best, time.perf_counter() - start)
+    return best / len(packets) * 1e6
+
+
+def run_benchmark(num_packets=20000, num_connections=1000, seed=0):
+    """
+    Returns:
+        dict: Per-packet times in microseconds ('reference_us', 'current_us') and
+              'speedup', after checking the frames are byte-identical
+    """
+    random.seed(seed)
+    connection_manager = connection_manager_sw()
+    for _ in range(num_connections):
+        connection_manager.write(random.getrandbits(32), random.getrandbits(16), 1)
+
+    model = udp_model(connection_manager, 0x112233445566, 0xAABBCCDDEEFF, 0x0A000001, 50000)
+    packets = [model._generate_random_packet() for _ in range(num_packets)]
+
+    for packet in packets:
+        if model._model_udp(*packet) != model_udp_reference(model, *packet):
+            raise AssertionError(f"frame mismatch for connection_id={packet[0]}")
+
+    reference_us = _time_per_packet(lambda *p: model_udp_reference(model, *p), packets)
+    current_us = _time_per_packet(model._model_udp, packets)
+    return {
+        "reference_us": reference_us,
+        "current_us": current_us,
+        "speedup": reference_us / current_us,
+    }
+
+
+if __name__ == "__main__":
+    num_packets = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    num_connections = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    result = run_benchmark(num_packets, num_connections)
+    print(f"frames identical over {num_packets} packets")
+    print(f"reference (big-int): {result['reference_us']:.2f} us/packet")
+    print(f"current   (struct):  {result['current_us']:.2f} us/packet")
+    print(f"speedup:             {result['speedup']:.1f}x")
@@ -19,7 +19,8 @@
 //   The module provides:
 //     • Fully pipelined forward lookups (AXIS)
 //     • Fully pipelined reverse lookups (AXIS)
-//     • Serialized bind / unbind control channel
+//     • Pipelined bind / unbind control channel
+//     • Table dump channel iterating the valid entries
 //
 // ----------------------------------------------------------------------------
 // Table Organization
@@ -61,26 +62,59 @@
 // ----------------------------------------------------------------------------
 // Control Port (Bind / Unbind)
 // ----------------------------------------------------------------------------
-//   • Serialized (one command in flight at a time).
-//   • s02_ready asserted only when FSM is in STATE_IDLE.
+//   • Pipelined: up to BRAM_LATENCY + 1 commands in flight, responses in
+//     command order.
+//         cycle t            : command accepted, hash computed
+//         cycle t+1          : read of all ways issued at the hash index
+//         cycle t+1+BRAM_LAT : ways available, command resolved
+//         cycle t+2+BRAM_LAT : response on m02, table write (if any)
+//
 //   • Bind Operation:
 //         1. Compute hash index.
 //         2. Read all ways at that index.
 //         3. If matching tag exists → return existing connId (ack=1, full=0).
-//         4. Else if a free way exists (valid=0) → allocate it.
+//         4. Else if a free way exists (valid=0) → allocate the lowest one.
 //         5. Else → table full for this index (ack=1, full=1).
 //
 //   • Unbind Operation:
 //         - Clears any entry whose tag matches {IP, UDP port} at this index.
 //
-//   • Latency (approx):
-//         Bind:       BRAM_LATENCY + WAYS + 1 cycles
-//         Unbind:     BRAM_LATENCY + 1 cycles
+//   • s02_ready is deasserted (the command is held, not dropped) when:
+//         - hazard: a command to the same hash index is still in flight and
+//           its write has not landed (read-after-write on the table),
+//         - a resolving command writes next cycle (reads and writes share
+//           the control-side BRAM port),
+//         - the table dump channel is active.
+//
+//   • Throughput: one command per cycle for commands that do not write
+//     (existing binds, unbinds of unknown entries), one per two cycles for
+//     commands that write, versus one per BRAM_LATENCY + WAYS + 1 cycles
+//     for the former serialized FSM.
+//
+//   • s02_axis_ctrl_user is carried unchanged to m02_axis_ctrl_user so
+//     several command sources can share the channel.
 //
 //   • Control responses do not apply backpressure to internal state
 //       (m02_ready must be 1).
 //
 // ----------------------------------------------------------------------------
+// Table Dump (cursor → next valid entry)
+// ----------------------------------------------------------------------------
+//   • Shares the control-port side of the BRAMs, so it is serialized with
+//     bind / unbind (bind / unbind win).
+//   • s03_ready asserted only when the control pipeline is empty and no
+//     control command is pending.
+//   • Request: cursor = {way, hash_index}, the first slot to examine.
+//     Slots are scanned hash-index major, way minor.
+//   • Response: first valid slot at or after the cursor
+//         hit=1 : connId / ipAddr / udpPort of that entry
+//         hit=0 : no valid entry up to the end of the table
+//   • Latency: (BRAM_LATENCY + 1) cycles per hash index scanned.
+//   • Software resumes after an entry by requesting cursor = connId + 1
+//     (in hash-major order), so a full dump costs one request per valid
+//     entry rather than one per slot.
+//
+// ----------------------------------------------------------------------------
 // Consistency Model (Relaxed)
 // ----------------------------------------------------------------------------
 //   • Forward and reverse lookups do *not* stall for control writes.
@@ -105,6 +139,7 @@ module connection_manager #(
     // user-manager parameters
     parameter int WAYS         = 4,  // Associativity of hash table
     parameter int BRAM_LATENCY = 5,  // Latency of underlying RAM
+    parameter int CTRL_USER_WIDTH = 2,  // Width of the control command tag
 
     // developer-managed parameters
     localparam int TAG_WIDTH     = IP_ADDR_WIDTH + UDP_PORT_WIDTH,
@@ -145,13 +180,27 @@ module connection_manager #(
     input  wire  [ IP_ADDR_WIDTH-1:0] s02_axis_ctrl_ipAddr,
     input  wire  [UDP_PORT_WIDTH-1:0] s02_axis_ctrl_udpPort,
     input  wire                       s02_axis_ctrl_bind,
+    input  wire [CTRL_USER_WIDTH-1:0] s02_axis_ctrl_user,
     output logic                      s02_axis_ctrl_ready,
 
-    input  wire                      m02_axis_ctrl_ready,         // must be 1
-    output logic                     m02_axis_ctrl_valid,
-    output logic                     m02_axis_ctrl_ack,
-    output logic [CONN_ID_WIDTH-1:0] m02_axis_ctrl_connectionId,
-    output logic                     m02_axis_ctrl_full
+    input  wire                        m02_axis_ctrl_ready,         // must be 1
+    output logic                       m02_axis_ctrl_valid,
+    output logic                       m02_axis_ctrl_ack,
+    output logic [  CONN_ID_WIDTH-1:0] m02_axis_ctrl_connectionId,
+    output logic                       m02_axis_ctrl_full,
+    output logic [CTRL_USER_WIDTH-1:0] m02_axis_ctrl_user,
+
+    // Table Dump Channel (clocked by s02_axis_ctrl_aclk)
+    input  wire                      s03_axis_dump_valid,
+    input  wire  [CONN_ID_WIDTH-1:0] s03_axis_dump_cursor,
+    output logic                     s03_axis_dump_ready,
+
+    input  wire                       m03_axis_dump_ready,         // must be 1
+    output logic                      m03_axis_dump_valid,
+    output logic                      m03_axis_dump_hit,
+    output logic [ CONN_ID_WIDTH-1:0] m03_axis_dump_connectionId,
+    output logic [ IP_ADDR_WIDTH-1:0] m03_axis_dump_ipAddr,
+    output logic [UDP_PORT_WIDTH-1:0] m03_axis_dump_udpPort
 );
 
   // -------------------------------------------------------------------------
@@ -395,157 +444,273 @@ module connection_manager #(
 
 
   // -------------------------------------------------------------------------
-  // Control (Write) FSM
+  // Control (Write) Pipeline
   // -------------------------------------------------------------------------
 
-  typedef enum logic [2:0] {
+  typedef enum logic [1:0] {
     STATE_IDLE,
-    STATE_READ,
-    STATE_ACTIVATE_CHECK,
-    STATE_ACTIVATE,
-    STATE_DEACTIVATE
+    STATE_DUMP_READ,
+    STATE_DUMP_SCAN
   } state_t;
 
   state_t                          state;
 
-  logic   [     IP_ADDR_WIDTH-1:0] ctrl_ipAddr_q;
-  logic   [    UDP_PORT_WIDTH-1:0] ctrl_udpPort_q;
-  logic   [        HASH_WIDTH-1:0] ctrl_hash_idx_q;
-  logic                            ctrl_act_q;
+  // read pipeline: stage i holds the command whose read was issued i cycles ago
+  localparam int PIPE_DEPTH = BRAM_LATENCY + 1;
+
+  logic [PIPE_DEPTH-1:0]                      rd_pipe_valid;
+  logic [PIPE_DEPTH-1:0][ IP_ADDR_WIDTH-1:0]  rd_pipe_ipAddr;
+  logic [PIPE_DEPTH-1:0][UDP_PORT_WIDTH-1:0]  rd_pipe_udpPort;
+  logic [PIPE_DEPTH-1:0][    HASH_WIDTH-1:0]  rd_pipe_hash_idx;
+  logic [PIPE_DEPTH-1:0]                      rd_pipe_bind;
+  logic [PIPE_DEPTH-1:0][CTRL_USER_WIDTH-1:0] rd_pipe_user;
+
+  // write stage (one cycle after resolve)
+  logic                            wr_active;
+  logic   [        HASH_WIDTH-1:0] wr_hash_idx_q;
 
+  // dump scan
+  logic   [        HASH_WIDTH-1:0] ctrl_hash_idx_q;
   logic   [          WAYS_LOG-1:0] way_iter;
   logic   [$clog2(BRAM_LATENCY):0] read_wait;
 
-  assign s02_axis_ctrl_ready = (state == STATE_IDLE);
+  // -------------------------------------------------------------------------
+  // Accept: hazard detection
+  // -------------------------------------------------------------------------
 
-  assign ctrl_addr = ctrl_hash_idx_q;
+  logic [HASH_WIDTH-1:0] s02_hash_idx;
+  logic                  s02_hazard;
+
+  always_comb begin
+    s02_hash_idx = hash_fun_ip_port(s02_axis_ctrl_ipAddr, s02_axis_ctrl_udpPort);
+    s02_hazard   = 1'b0;
+    for (int i = 0; i < PIPE_DEPTH; i++) begin
+      if (rd_pipe_valid[i] && (rd_pipe_hash_idx[i] == s02_hash_idx)) begin
+        s02_hazard = 1'b1;
+      end
+    end
+  end
+
+  // -------------------------------------------------------------------------
+  // Resolve: command at the end of the read pipeline against the read ways
+  // -------------------------------------------------------------------------
+
+  logic                 res_valid;
+  logic                 res_hit;
+  logic [ WAYS_LOG-1:0] res_hit_way;
+  logic                 res_free;
+  logic [ WAYS_LOG-1:0] res_free_way;
+  logic [     WAYS-1:0] res_unbind_mask;
+  logic                 res_write;
+
+  always_comb begin
+    res_valid       = rd_pipe_valid[BRAM_LATENCY];
+    res_hit         = 1'b0;
+    res_hit_way     = 'b0;
+    res_free        = 1'b0;
+    res_free_way    = 'b0;
+    res_unbind_mask = 'b0;
+
+    for (int i = WAYS - 1; i >= 0; i--) begin
+      if (ctrl_dout_tag[i] == {rd_pipe_ipAddr[BRAM_LATENCY], rd_pipe_udpPort[BRAM_LATENCY]}) begin
+        res_unbind_mask[i] = 1'b1;
+        if (ctrl_dout_valid[i]) begin
+          res_hit     = 1'b1;
+          res_hit_way = i;
+        end
+      end
+      if (!ctrl_dout_valid[i]) begin
+        res_free     = 1'b1;
+        res_free_way = i;
+      end
+    end
+
+    if (rd_pipe_bind[BRAM_LATENCY]) begin
+      res_write = res_valid && !res_hit && res_free;
+    end else begin
+      res_write = res_valid && (|res_unbind_mask);
+    end
+  end
+
+  // reads and writes share the control-side BRAM port: no read is issued in a write cycle
+  assign s02_axis_ctrl_ready = (state == STATE_IDLE) && !s02_hazard && !res_write;
+  assign s03_axis_dump_ready = (state == STATE_IDLE) && !s02_axis_ctrl_valid
+                               && !(|rd_pipe_valid) && !wr_active;
+
+  assign ctrl_addr = (state != STATE_IDLE) ? ctrl_hash_idx_q :
+                     (wr_active)           ? wr_hash_idx_q   : rd_pipe_hash_idx[0];
 
   always_ff @(posedge s02_axis_ctrl_aclk) begin
     if (!s02_axis_ctrl_aresetn) begin
-      state               <= STATE_IDLE;
+      state                      <= STATE_IDLE;
 
-      ctrl_ipAddr_q       <= 'b0;
-      ctrl_udpPort_q      <= 'b0;
-      ctrl_hash_idx_q     <= 'b0;
-      ctrl_act_q          <= 'b0;
+      rd_pipe_valid              <= 'b0;
+      rd_pipe_ipAddr             <= 'b0;
+      rd_pipe_udpPort            <= 'b0;
+      rd_pipe_hash_idx           <= 'b0;
+      rd_pipe_bind               <= 'b0;
+      rd_pipe_user               <= 'b0;
 
-      m02_axis_ctrl_valid <= 1'b0;
-      m02_axis_ctrl_ack   <= 1'b0;
-      m02_axis_ctrl_full  <= 1'b0;
-      way_iter            <= 'b0;
-      read_wait           <= 'b0;
+      wr_active                  <= 1'b0;
+      wr_hash_idx_q              <= 'b0;
 
-      ctrl_din_tag        <= 1'b0;
-      ctrl_din_valid      <= 1'b0;
-      ctrl_din_ipAddr     <= 'b0;
-      ctrl_din_udpPort    <= 'b0;
+      ctrl_hash_idx_q            <= 'b0;
+      way_iter                   <= 'b0;
+      read_wait                  <= 'b0;
+
+      m02_axis_ctrl_valid        <= 1'b0;
+      m02_axis_ctrl_ack          <= 1'b0;
+      m02_axis_ctrl_full         <= 1'b0;
+      m02_axis_ctrl_connectionId <= 'b0;
+      m02_axis_ctrl_user         <= 'b0;
+
+      ctrl_din_tag               <= 1'b0;
+      ctrl_din_valid             <= 1'b0;
+      ctrl_din_ipAddr            <= 'b0;
+      ctrl_din_udpPort           <= 'b0;
 
       for (int i = 0; i < WAYS; i++) begin
         ctrl_wren[i] <= 1'b0;
       end
 
-      m02_axis_ctrl_connectionId <= 'b0;
+      m03_axis_dump_valid        <= 1'b0;
+      m03_axis_dump_hit          <= 1'b0;
+      m03_axis_dump_connectionId <= 'b0;
+      m03_axis_dump_ipAddr       <= 'b0;
+      m03_axis_dump_udpPort      <= 'b0;
 
     end else begin
       // DEFAULTS
+      m02_axis_ctrl_valid        <= 1'b0;
+      m02_axis_ctrl_ack          <= 1'b0;
+      m02_axis_ctrl_full         <= 1'b0;
       m02_axis_ctrl_connectionId <= 'b0;
+      m03_axis_dump_valid        <= 1'b0;
       ctrl_din_tag               <= 1'b0;
       ctrl_din_valid             <= 1'b0;
       ctrl_din_ipAddr            <= 'b0;
       ctrl_din_udpPort           <= 'b0;
+      wr_active                  <= 1'b0;
       for (int i = 0; i < WAYS; i++) begin
         ctrl_wren[i] <= 1'b0;
       end
 
-      case (state)
-        // -------------------------------------------------------------
-        STATE_IDLE: begin
-          m02_axis_ctrl_valid <= 1'b0;
-          m02_axis_ctrl_ack   <= 1'b0;
-          m02_axis_ctrl_full  <= 1'b0;
-          way_iter            <= 'b0;
-          read_wait           <= 'b0;
-
-          ctrl_ipAddr_q       <= s02_axis_ctrl_ipAddr;
-          ctrl_udpPort_q      <= s02_axis_ctrl_udpPort;
-          ctrl_hash_idx_q     <= hash_fun_ip_port(s02_axis_ctrl_ipAddr, s02_axis_ctrl_udpPort);
-          ctrl_act_q          <= s02_axis_ctrl_bind;
-
-          state               <= (s02_axis_ctrl_valid) ? STATE_READ : STATE_IDLE;
-        end
+      // -------------------------------------------------------------
+      // read pipeline
+      // -------------------------------------------------------------
+      rd_pipe_valid[0]    <= s02_axis_ctrl_valid && s02_axis_ctrl_ready;
+      rd_pipe_ipAddr[0]   <= s02_axis_ctrl_ipAddr;
+      rd_pipe_udpPort[0]  <= s02_axis_ctrl_udpPort;
+      rd_pipe_hash_idx[0] <= s02_hash_idx;
+      rd_pipe_bind[0]     <= s02_axis_ctrl_bind;
+      rd_pipe_user[0]     <= s02_axis_ctrl_user;
+
+      for (int i = 1; i < PIPE_DEPTH; i++) begin
+        rd_pipe_valid[i]    <= rd_pipe_valid[i-1];
+        rd_pipe_ipAddr[i]   <= rd_pipe_ipAddr[i-1];
+        rd_pipe_udpPort[i]  <= rd_pipe_udpPort[i-1];
+        rd_pipe_hash_idx[i] <= rd_pipe_hash_idx[i-1];
+        rd_pipe_bind[i]     <= rd_pipe_bind[i-1];
+        rd_pipe_user[i]     <= rd_pipe_user[i-1];
+      end
 
-        // -------------------------------------------------------------
-        STATE_READ: begin
-          read_wait <= read_wait + 1;
-          if (read_wait == BRAM_LATENCY - 1) begin
-            state <= ctrl_act_q ? STATE_ACTIVATE_CHECK : STATE_DEACTIVATE;
+      // -------------------------------------------------------------
+      // resolve → response + write
+      // -------------------------------------------------------------
+      if (res_valid) begin
+        m02_axis_ctrl_valid <= 1'b1;
+        m02_axis_ctrl_ack   <= 1'b1;
+        m02_axis_ctrl_user  <= rd_pipe_user[BRAM_LATENCY];
+
+        if (rd_pipe_bind[BRAM_LATENCY]) begin
+          if (res_hit) begin
+            m02_axis_ctrl_connectionId <= {res_hit_way, rd_pipe_hash_idx[BRAM_LATENCY]};
+          end else if (res_free) begin
+            m02_axis_ctrl_connectionId <= {res_free_way, rd_pipe_hash_idx[BRAM_LATENCY]};
+          end else begin
+            m02_axis_ctrl_full <= 1'b1;
           end
         end
+      end
 
-        // -------------------------------------------------------------
-        STATE_DEACTIVATE: begin
-          ctrl_din_tag     <= 1'b0;
-          ctrl_din_valid   <= 1'b0;
-          ctrl_din_ipAddr  <= 'b0;
-          ctrl_din_udpPort <= 'b0;
+      if (res_write) begin
+        wr_active     <= 1'b1;
+        wr_hash_idx_q <= rd_pipe_hash_idx[BRAM_LATENCY];
+
+        if (rd_pipe_bind[BRAM_LATENCY]) begin
+          ctrl_din_valid             <= 1'b1;
+          ctrl_din_tag               <= {rd_pipe_ipAddr[BRAM_LATENCY], rd_pipe_udpPort[BRAM_LATENCY]};
+          ctrl_din_ipAddr            <= rd_pipe_ipAddr[BRAM_LATENCY];
+          ctrl_din_udpPort           <= rd_pipe_udpPort[BRAM_LATENCY];
+          ctrl_wren[res_free_way]    <= 1'b1;
+        end else begin
           for (int i = 0; i < WAYS; i++) begin
-            ctrl_wren[i] <= (ctrl_dout_tag[i] == {ctrl_ipAddr_q, ctrl_udpPort_q});
+            ctrl_wren[i] <= res_unbind_mask[i];
           end
-
-          m02_axis_ctrl_valid <= 1'b1;
-          m02_axis_ctrl_ack   <= 1'b1;
-          state               <= STATE_IDLE;
         end
+      end
 
-        STATE_ACTIVATE_CHECK: begin
-          logic local_is_any;
-          local_is_any = 1'b0;
+      // -------------------------------------------------------------
+      // table dump
+      // -------------------------------------------------------------
+      case (state)
+        STATE_IDLE: begin
+          way_iter  <= 'b0;
+          read_wait <= 'b0;
 
-          for (int i = 0; i < WAYS; i++) begin
-            if ((ctrl_dout_tag[i] == {ctrl_ipAddr_q, ctrl_udpPort_q}) && ctrl_dout_valid[i]) begin
-              m02_axis_ctrl_connectionId[CONN_ID_WIDTH-1:HASH_WIDTH] <= i;
-              local_is_any |= 1;
-            end
+          if (s03_axis_dump_valid && s03_axis_dump_ready) begin
+            ctrl_hash_idx_q <= s03_axis_dump_cursor[HASH_WIDTH-1:0];
+            way_iter        <= s03_axis_dump_cursor[CONN_ID_WIDTH-1:HASH_WIDTH];
+            state           <= STATE_DUMP_READ;
           end
+        end
 
-          if (local_is_any) begin
-            m02_axis_ctrl_valid                        <= 1'b1;
-            m02_axis_ctrl_ack                          <= 1'b1;
-            state                                      <= STATE_IDLE;
-            m02_axis_ctrl_connectionId[HASH_WIDTH-1:0] <= ctrl_hash_idx_q;
-          end else begin
-            state <= STATE_ACTIVATE;
+        // -------------------------------------------------------------
+        STATE_DUMP_READ: begin
+          read_wait <= read_wait + 1;
+          if (read_wait == BRAM_LATENCY - 1) begin
+            state <= STATE_DUMP_SCAN;
           end
         end
 
         // -------------------------------------------------------------
-        STATE_ACTIVATE: begin
-          ctrl_din_valid   <= 1'b1;
-          ctrl_din_tag     <= {ctrl_ipAddr_q, ctrl_udpPort_q};
-          ctrl_din_ipAddr  <= ctrl_ipAddr_q;
-          ctrl_din_udpPort <= ctrl_udpPort_q;
-
-          if (!ctrl_dout_valid[way_iter]) begin
-            ctrl_wren[way_iter]        <= 1'b1;
-            m02_axis_ctrl_valid        <= 1'b1;
-            m02_axis_ctrl_ack          <= 1'b1;
-            m02_axis_ctrl_full         <= 1'b0;
-            state                      <= STATE_IDLE;
-            m02_axis_ctrl_connectionId <= {way_iter, ctrl_hash_idx_q};
+        STATE_DUMP_SCAN: begin
+          logic                local_found;
+          logic [WAYS_LOG-1:0] local_way;
+          local_found = 1'b0;
+          local_way   = 'b0;
+
+          for (int i = WAYS - 1; i >= 0; i--) begin
+            if (ctrl_dout_valid[i] && (i >= way_iter)) begin
+              local_found = 1'b1;
+              local_way   = i;
+            end
+          end
 
+          if (local_found) begin
+            m03_axis_dump_valid        <= 1'b1;
+            m03_axis_dump_hit          <= 1'b1;
+            m03_axis_dump_connectionId <= {local_way, ctrl_hash_idx_q};
+            m03_axis_dump_ipAddr       <= ctrl_dout_tag[local_way][TAG_WIDTH-1:UDP_PORT_WIDTH];
+            m03_axis_dump_udpPort      <= ctrl_dout_tag[local_way][UDP_PORT_WIDTH-1:0];
+            state                      <= STATE_IDLE;
+          end else if (ctrl_hash_idx_q == INDEXES - 1) begin
+            m03_axis_dump_valid        <= 1'b1;
+            m03_axis_dump_hit          <= 1'b0;
+            m03_axis_dump_connectionId <= 'b0;
+            m03_axis_dump_ipAddr       <= 'b0;
+            m03_axis_dump_udpPort      <= 'b0;
+            state                      <= STATE_IDLE;
           end else begin
-            if (way_iter == WAYS - 1) begin
-              m02_axis_ctrl_valid <= 1'b1;
-              m02_axis_ctrl_ack   <= 1'b1;
-              m02_axis_ctrl_full  <= 1'b1;
-              state               <= STATE_IDLE;
-            end else begin
-              way_iter <= way_iter + 1;
-            end
+            ctrl_hash_idx_q <= ctrl_hash_idx_q + 1;
+            way_iter        <= 'b0;
+            read_wait       <= 'b0;
+            state           <= STATE_DUMP_READ;
           end
         end
 
         // -------------------------------------------------------------
+        default: state <= STATE_IDLE;
       endcase
 
     end
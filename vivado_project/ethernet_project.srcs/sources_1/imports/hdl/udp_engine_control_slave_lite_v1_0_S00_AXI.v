@@ -28,6 +28,18 @@
 		output wire [31:0]  csr_udp_engine_100g__connManager_wr_trigger,
 		input  wire [31:0] 	csr_udp_engine_100g__connManager_wr_status,
 		input  wire [31:0] 	csr_udp_engine_100g__connManager_wr_connectedId,
+		output wire [31:0]  csr_udp_engine_100g__connManager_dump_cursor,
+		output wire [31:0]  csr_udp_engine_100g__connManager_dump_seek,
+		output wire [31:0]  csr_udp_engine_100g__connManager_dump_next,
+		input  wire [31:0] 	csr_udp_engine_100g__connManager_dump_status,
+		input  wire [31:0] 	csr_udp_engine_100g__connManager_dump_ipAddr,
+		input  wire [31:0] 	csr_udp_engine_100g__connManager_dump_connectedId,
+		output wire [31:0]  csr_udp_engine_100g__connManager_batch_ipAddr,
+		output wire [31:0]  csr_udp_engine_100g__connManager_batch_push,
+		output wire [31:0]  csr_udp_engine_100g__connManager_batch_push_pulse,
+		output wire [31:0]  csr_udp_engine_100g__connManager_batch_pop,
+		input  wire [31:0] 	csr_udp_engine_100g__connManager_batch_resp,
+		input  wire [31:0] 	csr_udp_engine_100g__connManager_batch_status,
 		// User ports ends
 		// Do not modify the ports beyond this line
 
@@ -243,6 +255,18 @@
 	reg [31:0]  reg____csr_udp_engine_100g__connManager_wr_trigger;
 	assign csr_udp_engine_100g__connManager_wr_trigger = reg____csr_udp_engine_100g__connManager_wr_trigger;
 
+	// a write to reg 14 (seek to cursor) or reg 15 (next entry) should make a dump pulse
+	reg [31:0]  reg____csr_udp_engine_100g__connManager_dump_seek;
+	reg [31:0]  reg____csr_udp_engine_100g__connManager_dump_next;
+	assign csr_udp_engine_100g__connManager_dump_seek = reg____csr_udp_engine_100g__connManager_dump_seek;
+	assign csr_udp_engine_100g__connManager_dump_next = reg____csr_udp_engine_100g__connManager_dump_next;
+
+	// a write to reg 19 pushes a batch command, a write to reg 20 pops a batch response
+	reg [31:0]  reg____csr_udp_engine_100g__connManager_batch_push_pulse;
+	reg [31:0]  reg____csr_udp_engine_100g__connManager_batch_pop;
+	assign csr_udp_engine_100g__connManager_batch_push_pulse = reg____csr_udp_engine_100g__connManager_batch_push_pulse;
+	assign csr_udp_engine_100g__connManager_batch_pop = reg____csr_udp_engine_100g__connManager_batch_pop;
+
 	always @( posedge S_AXI_ACLK )
 	begin
 
@@ -253,6 +277,26 @@
 			(( (S_AXI_AWVALID)? S_AXI_AWADDR[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] : 
 								axi_awaddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB]		) == 10);
 
+		reg____csr_udp_engine_100g__connManager_dump_seek <=   
+			(S_AXI_WVALID) && 
+			(( (S_AXI_AWVALID)? S_AXI_AWADDR[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] : 
+								axi_awaddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB]		) == 14);
+
+		reg____csr_udp_engine_100g__connManager_dump_next <=   
+			(S_AXI_WVALID) && 
+			(( (S_AXI_AWVALID)? S_AXI_AWADDR[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] : 
+								axi_awaddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB]		) == 15);
+
+		reg____csr_udp_engine_100g__connManager_batch_push_pulse <=   
+			(S_AXI_WVALID) && 
+			(( (S_AXI_AWVALID)? S_AXI_AWADDR[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] : 
+								axi_awaddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB]		) == 19);
+
+		reg____csr_udp_engine_100g__connManager_batch_pop <=   
+			(S_AXI_WVALID) && 
+			(( (S_AXI_AWVALID)? S_AXI_AWADDR[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] : 
+								axi_awaddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB]		) == 20);
+
 		// ----------
 	
 	  if ( S_AXI_ARESETN == 1'b0 )
@@ -620,13 +664,13 @@
 							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'hC) ? csr_udp_engine_100g__connManager_wr_connectedId : 
 							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'hD) ? slv_reg13 : 
 							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'hE) ? slv_reg14 : 
-							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'hF) ? slv_reg15 : 
-							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'h10) ? slv_reg16 : 
-							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'h11) ? slv_reg17 : 
+							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'hF) ? csr_udp_engine_100g__connManager_dump_status : 
+							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'h10) ? csr_udp_engine_100g__connManager_dump_ipAddr : 
+							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'h11) ? csr_udp_engine_100g__connManager_dump_connectedId : 
 							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'h12) ? slv_reg18 : 
 							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'h13) ? slv_reg19 : 
-							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'h14) ? slv_reg20 : 
-							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'h15) ? slv_reg21 : 
+							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'h14) ? csr_udp_engine_100g__connManager_batch_resp : 
+							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'h15) ? csr_udp_engine_100g__connManager_batch_status : 
 							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'h16) ? slv_reg22 : 
 							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'h17) ? slv_reg23 : 
 							(axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 5'h18) ? slv_reg24 : 
@@ -649,6 +693,9 @@
 	reg [31:0]  reg____csr_udp_engine_100g__connManager_wr_ip_addr;
 	reg [31:0]  reg____csr_udp_engine_100g__connManager_wr_port;
 	reg [31:0]  reg____csr_udp_engine_100g__connManager_wr_bind;
+	reg [31:0]  reg____csr_udp_engine_100g__connManager_dump_cursor;
+	reg [31:0]  reg____csr_udp_engine_100g__connManager_batch_ipAddr;
+	reg [31:0]  reg____csr_udp_engine_100g__connManager_batch_push;
 
 	always @(*) begin
 		reg____csr_udp_engine_100g__ctrl							= slv_reg0;
@@ -661,6 +708,9 @@
 		reg____csr_udp_engine_100g__connManager_wr_ip_addr			= slv_reg7;
 		reg____csr_udp_engine_100g__connManager_wr_port				= slv_reg8;
 		reg____csr_udp_engine_100g__connManager_wr_bind				= slv_reg9;
+		reg____csr_udp_engine_100g__connManager_dump_cursor			= slv_reg13;
+		reg____csr_udp_engine_100g__connManager_batch_ipAddr		= slv_reg18;
+		reg____csr_udp_engine_100g__connManager_batch_push			= slv_reg19;
 	end
 
 	assign csr_udp_engine_100g__ctrl 							= reg____csr_udp_engine_100g__ctrl;
@@ -673,6 +723,9 @@
 	assign csr_udp_engine_100g__connManager_wr_ip_addr 			= reg____csr_udp_engine_100g__connManager_wr_ip_addr;
 	assign csr_udp_engine_100g__connManager_wr_port 			= reg____csr_udp_engine_100g__connManager_wr_port;
 	assign csr_udp_engine_100g__connManager_wr_bind 			= reg____csr_udp_engine_100g__connManager_wr_bind;
+	assign csr_udp_engine_100g__connManager_dump_cursor 		= reg____csr_udp_engine_100g__connManager_dump_cursor;
+	assign csr_udp_engine_100g__connManager_batch_ipAddr 		= reg____csr_udp_engine_100g__connManager_batch_ipAddr;
+	assign csr_udp_engine_100g__connManager_batch_push 			= reg____csr_udp_engine_100g__connManager_batch_push;
 	// User logic ends
 
 	endmodule